@@ -1,3 +1,4 @@
+import json
 import logging as python_logging
 import multiprocessing
 import traceback
@@ -7,7 +8,10 @@ import click
 import uvicorn
 
 from seedarr.app import create_app
+from seedarr.benchmarks import hot_paths, load as load_test
+from seedarr.benchmarks.suite import BENCHMARKS, run_suite
 from seedarr.singletons import Logger
+from seedarr.utilities import ingest_client
 
 
 async def run_app(host: str, port: int, debug: bool):
@@ -30,12 +34,118 @@ async def run_app(host: str, port: int, debug: bool):
         traceback.print_exception(e)
 
 
-@click.command()
+@click.group(invoke_without_command=True)
 @click.option("--host", default="127.0.0.1", help="Host to listen on")
 @click.option("--port", default=8080, type=int, help="Port to listen on")
 @click.option("--debug", is_flag=True, type=bool, help="Run in debug mode")
-def main(host: str, port: int, debug: bool):
-    anyio.run(run_app, host, port, debug)
+@click.pass_context
+def main(ctx: click.Context, host: str, port: int, debug: bool):
+    """Run the seedarr daemon."""
+    if ctx.invoked_subcommand is None:
+        anyio.run(run_app, host, port, debug)
+
+
+@main.command()
+@click.option(
+    "--benchmark",
+    "-b",
+    "names",
+    multiple=True,
+    type=click.Choice(BENCHMARKS),
+    help="Benchmark to run, repeatable (default: hot_paths)",
+)
+@click.option("--all", "run_all", is_flag=True, help="Run every benchmark")
+@click.option("--torrents", default=hot_paths.TORRENTS, type=int, help="Fake swarm torrents")
+@click.option("--peers", default=hot_paths.PEERS, type=int, help="Peers per fake torrent")
+@click.option("--files", default=hot_paths.FILES, type=int, help="Files per fake torrent")
+@click.option("--clients", default=hot_paths.CLIENTS, type=int, help="Broadcast clients")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write the JSON results to this file instead of stdout",
+)
+def bench(
+    names: tuple[str, ...],
+    run_all: bool,
+    torrents: int,
+    peers: int,
+    files: int,
+    clients: int,
+    output: str | None,
+):
+    """Run benchmarks and print their results as JSON."""
+    if run_all:
+        names = BENCHMARKS
+    elif not names:
+        names = ("hot_paths",)
+
+    options = {
+        "hot_paths": {"torrents": torrents, "peers": peers, "files": files, "clients": clients}
+    }
+    document = run_suite(names, options)
+    text = json.dumps(document, indent=2)
+    if output:
+        with open(output, "w") as file:
+            file.write(text + "\n")
+    else:
+        click.echo(text)
+
+    if any("error" in entry for entry in document["benchmarks"].values()):
+        raise SystemExit(1)
+
+
+@main.command()
+@click.option("--clients", default=load_test.CLIENTS, type=int, help="Simulated dashboards")
+@click.option("--duration", default=load_test.DURATION, type=float, help="Seconds to run")
+@click.option("--url", default=None, help="Attach to a running daemon instead of starting one")
+@click.option("--pid", default=None, type=int, help="PID of the attached daemon, for CPU use")
+@click.option(
+    "--standin/--real",
+    default=True,
+    help="Start the daemon with the fake libtorrent (default) or the real one",
+)
+@click.option("--torrents", default=load_test.TORRENTS, type=int, help="Fake swarm torrents")
+@click.option("--peers", default=load_test.PEERS, type=int, help="Peers per fake torrent")
+@click.option("--files", default=load_test.FILES, type=int, help="Files per fake torrent")
+def load(
+    clients: int,
+    duration: float,
+    url: str | None,
+    pid: int | None,
+    standin: bool,
+    torrents: int,
+    peers: int,
+    files: int,
+):
+    """Load-test the daemon with simulated dashboards and print a JSON report."""
+    report = load_test.run(clients, duration, url, pid, standin, torrents, peers, files)
+    click.echo(json.dumps(report, indent=2))
+
+
+@main.command()
+@click.argument("sources", nargs=-1, required=True)
+@click.option("--url", default=ingest_client.URL, help="URL of the running daemon")
+@click.option("--save-path", default="", help="Download directory (default: the daemon's tempdir)")
+@click.option("--concurrency", default=None, type=int, help="Torrents added at a time")
+def ingest(sources: tuple[str, ...], url: str, save_path: str, concurrency: int | None):
+    """
+    Bulk-add magnet links, .torrent files and directories of .torrent files
+    to a running daemon and print its JSON report.
+    """
+
+    def on_progress(progress: dict) -> None:
+        click.echo(
+            f"{progress['done']}/{progress['total']}: {progress['added']} added, "
+            f"{progress['duplicates']} duplicates, {progress['failed']} failed",
+            err=True,
+        )
+
+    report = ingest_client.run(sources, url, save_path, concurrency, on_progress)
+    click.echo(json.dumps(report, indent=2))
+
+    if report.get("status") == "error":
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
@@ -4,10 +4,15 @@ import sys
 
 import socketio
 
+from seedarr.asgi import metrics_app
+from seedarr.enums import EventTopic
 from seedarr.singletons import (
     SIO,
+    Database,
     EventBus,
     FolderLock,
+    GeoIP,
+    LibtorrentExecutor,
     LibtorrentSession,
     Logger,
 )
@@ -17,30 +22,70 @@ faulthandler.enable(file=sys.stderr, all_threads=True)
 
 
 async def on_startup(sio: socketio.AsyncServer):
-    # Initialize the database connection
-
     # Initialize the logger singleton
     Logger.init()
 
+    # Initialize the database connection
+    await Database.init()
+
+    # Open the GeoIP database, when one is configured
+    GeoIP.init()
+
+    # Start the threads blocking libtorrent calls run on
+    LibtorrentExecutor.init()
+
     # Initialize the libtorrent session
     await LibtorrentSession.init()
 
     # Initialize the event bus
-    from seedarr.consumers import alert_consumer, shared_poll_and_publish
+    from seedarr.consumers import (
+        RESUME_DATA_CONSUMER,
+        alert_consumer,
+        persist_resume_data,
+        post_status_updates,
+        publish_subscriptions,
+        shared_poll_and_publish,
+    )
+    from seedarr.tasks import (
+        post_session_stats_periodically,
+        restore_torrents,
+        sample_rate_history,
+        save_resume_data_periodically,
+    )
 
     EventBus.init()
     event_bus = EventBus.get_bus()
-    event_bus.set_consumer(alert_consumer)
+    event_bus.subscribe(
+        "broadcast", alert_consumer, topics=(EventTopic.ALERTS, EventTopic.SYNTHETIC)
+    )
+    event_bus.subscribe(RESUME_DATA_CONSUMER, persist_resume_data, topics=(EventTopic.RESUME_DATA,))
     sio.start_background_task(shared_poll_and_publish, event_bus)
+    sio.start_background_task(post_status_updates)
     sio.start_background_task(event_bus.start)
+    sio.start_background_task(publish_subscriptions)
+    sio.start_background_task(restore_torrents)
+    sio.start_background_task(save_resume_data_periodically)
+    sio.start_background_task(sample_rate_history)
+    sio.start_background_task(post_session_stats_periodically)
     # Lazy import submodules to avoid circular imports
     import_submodules("seedarr.events")
     import_submodules("seedarr.routes.libtorrent")
     import_submodules("seedarr.routes.bridge")
+    import_submodules("seedarr.routes.admin")
+    # Count and time every route handler
+    from seedarr.decorators import instrument_handlers
+
+    instrument_handlers(sio)
 
 
 async def on_shutdown():
+    from seedarr.tasks import flush_resume_data
+
+    await flush_resume_data()
     await LibtorrentSession.close()
+    LibtorrentExecutor.close()
+    await Database.close()
+    GeoIP.close()
     await SIO.close()
     await FolderLock.clear_all()
 
@@ -48,7 +93,8 @@ async def on_shutdown():
 async def create_app():
     await SIO.init()
     sio = SIO.get_instance()
-    sio_app = socketio.ASGIApp(sio)
+    # Plain HTTP requests (e.g. Prometheus scrapes) go to the metrics app
+    sio_app = socketio.ASGIApp(sio, other_asgi_app=metrics_app)
     sio_app.on_startup = functools.partial(on_startup, sio)
     sio_app.on_shutdown = on_shutdown
     return sio_app
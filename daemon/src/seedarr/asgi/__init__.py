@@ -0,0 +1 @@
+from .metrics import metrics_app as metrics_app
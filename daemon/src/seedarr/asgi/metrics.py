@@ -0,0 +1,84 @@
+from seedarr.envs import METRICS_PATH
+from seedarr.managers import LatencyManager, SessionStatsManager
+from seedarr.singletons import EventBus, LibtorrentExecutor
+
+session_stats_manager = SessionStatsManager()
+latency_manager = LatencyManager()
+event_bus = EventBus.get_bus()
+
+CONTENT_TYPE = b"text/plain; version=0.0.4; charset=utf-8"
+
+EVENT_BUS_METRICS = (
+    ("depth", "gauge", "seedarr_event_bus_depth"),
+    ("published", "counter", "seedarr_event_bus_published_total"),
+    ("consumed", "counter", "seedarr_event_bus_consumed_total"),
+    ("dropped", "counter", "seedarr_event_bus_dropped_total"),
+    ("coalesced", "counter", "seedarr_event_bus_coalesced_total"),
+)
+
+EVENT_BUS_HISTOGRAMS = (
+    ("wait_histogram", "seedarr_event_bus_wait_seconds"),
+    ("handle_histogram", "seedarr_event_bus_handle_seconds"),
+)
+
+
+def render_event_bus() -> str:
+    stats = event_bus.stats()
+    lines = []
+    for key, kind, name in EVENT_BUS_METRICS:
+        lines.append(f"# TYPE {name} {kind}\n")
+        lines.extend(
+            f'{name}{{consumer="{consumer}"}} {values[key]}\n' for consumer, values in stats.items()
+        )
+
+    subscribers = event_bus.subscribers()
+    for attribute, name in EVENT_BUS_HISTOGRAMS:
+        lines.append(f"# TYPE {name} histogram\n")
+        lines.extend(
+            getattr(subscriber, attribute).render(name, f'consumer="{consumer}",')
+            for consumer, subscriber in subscribers.items()
+        )
+    return "".join(lines)
+
+
+def render_metrics() -> bytes:
+    return (
+        session_stats_manager.render()
+        + render_event_bus()
+        + latency_manager.render()
+        + LibtorrentExecutor.render()
+    ).encode()
+
+
+async def _respond(send, status: int, body: bytes, content_type: bytes) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", content_type),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def metrics_app(scope, receive, send):
+    """
+    ASGI app serving the cached session counters and EventBus stats in the
+    Prometheus text format at `METRICS_PATH`. Mounted as Socket.IO's
+    `other_asgi_app`, so it sees every non-Socket.IO HTTP request.
+    """
+    if scope["type"] != "http":
+        return
+
+    if scope["path"].rstrip("/") != METRICS_PATH.rstrip("/"):
+        await _respond(send, 404, b"Not Found", b"text/plain")
+        return
+
+    if scope["method"] not in ("GET", "HEAD"):
+        await _respond(send, 405, b"Method Not Allowed", b"text/plain")
+        return
+
+    await _respond(send, 200, render_metrics(), CONTENT_TYPE)
@@ -0,0 +1,702 @@
+"""
+In-process stand-in for the parts of `libtorrent` the daemon uses, backed
+by a synthetic swarm of N torrents with M peers and F files each.
+
+`install()` registers this module as `libtorrent` in `sys.modules`, so it
+must run before anything imports seedarr modules that import libtorrent.
+Every `session()` created afterwards is populated from the configured
+`FakeSwarm`; `post_torrent_updates()` queues a `state_update_alert` for the
+torrents whose rates changed since the last one and `FakeSwarm.alerts()`
+produces a stream of the alert types the broadcast path serializes.
+
+Only the Python side is modelled: calls return immediately instead of
+crossing into C++, so benchmarks built on this measure the daemon's own
+overhead, not libtorrent's.
+"""
+
+import enum
+import hashlib
+import random
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+# Default swarm shape, overridden with `configure()`
+TORRENTS = 100
+PEERS = 50
+FILES = 20
+
+_swarm: Optional["FakeSwarm"] = None
+
+
+def _hash(data: bytes, length: int) -> bytes:
+    return hashlib.sha256(data).digest()[:length]
+
+
+class _Digest:
+    __slots__ = ("_bytes",)
+    size = 20
+
+    def __init__(self, data: bytes = b"") -> None:
+        self._bytes = bytes(data).ljust(self.size, b"\0")[: self.size]
+
+    def to_bytes(self) -> bytes:
+        return self._bytes
+
+    def is_all_zeros(self) -> bool:
+        return not any(self._bytes)
+
+    def __str__(self) -> str:
+        return self._bytes.hex()
+
+    def __eq__(self, other) -> bool:
+        return type(other) is type(self) and other._bytes == self._bytes
+
+    def __hash__(self) -> int:
+        return hash(self._bytes)
+
+    def __repr__(self):
+        return str(self)
+
+
+class sha1_hash(_Digest):
+    __slots__ = ()
+    size = 20
+
+
+class sha256_hash(_Digest):
+    __slots__ = ()
+    size = 32
+
+
+class info_hash_t:
+    __slots__ = ("v1", "v2")
+
+    def __init__(self, v1: Optional[sha1_hash] = None, v2: Optional[sha256_hash] = None):
+        self.v1 = v1 or sha1_hash()
+        self.v2 = v2 or sha256_hash()
+
+    def has_v1(self) -> bool:
+        return not self.v1.is_all_zeros()
+
+    def has_v2(self) -> bool:
+        return not self.v2.is_all_zeros()
+
+    def get_best(self):
+        return self.v2 if self.has_v2() else self.v1
+
+
+class _States(enum.IntEnum):
+    checking_files = 1
+    downloading_metadata = 2
+    downloading = 3
+    finished = 4
+    seeding = 5
+    allocating = 6
+    checking_resume_data = 7
+    queued_for_checking = 8
+
+
+class torrent_flags:
+    seed_mode = 1 << 0
+    upload_mode = 1 << 1
+    paused = 1 << 4
+    auto_managed = 1 << 5
+
+
+class storage_mode_t:
+    storage_mode_allocate = 0
+    storage_mode_sparse = 1
+
+
+class options_t:
+    delete_files = 1
+
+
+class metric_type_t(enum.IntEnum):
+    counter = 0
+    gauge = 1
+
+
+class _Duration:
+    __slots__ = ("_seconds",)
+
+    def __init__(self, seconds: float) -> None:
+        self._seconds = seconds
+
+    def total_seconds(self) -> float:
+        return self._seconds
+
+
+class torrent_status:
+    checking_files = _States.checking_files
+    downloading_metadata = _States.downloading_metadata
+    downloading = _States.downloading
+    finished = _States.finished
+    seeding = _States.seeding
+    allocating = _States.allocating
+    checking_resume_data = _States.checking_resume_data
+    queued_for_checking = _States.queued_for_checking
+
+    def __init__(self, torrent: "_Torrent") -> None:
+        self.handle = torrent.handle
+        self.info_hash = torrent.info_hashes.v1
+        self.info_hashes = torrent.info_hashes
+        self.name = torrent.name
+        self.save_path = torrent.save_path
+        self.state = torrent.state
+        self.flags = torrent.flags
+        self.progress = torrent.progress
+        self.total_wanted = torrent.total_size
+        self.total_done = int(torrent.total_size * torrent.progress)
+        self.total_wanted_done = self.total_done
+        self.all_time_download = self.total_done
+        self.all_time_upload = torrent.uploaded
+        self.total_failed_bytes = 0
+        self.download_rate = torrent.download_rate
+        self.upload_rate = torrent.upload_rate
+        self.num_peers = len(torrent.peers)
+        self.num_seeds = torrent.seeds
+        self.num_connections = len(torrent.peers)
+        self.list_peers = len(torrent.peers)
+        self.added_time = torrent.added_time
+        self.completed_time = torrent.added_time if torrent.progress >= 1 else 0
+        self.is_finished = torrent.progress >= 1
+        self.is_seeding = self.is_finished
+        self.active_time = int(time.time()) - torrent.added_time
+        self.seeding_time = self.active_time if self.is_seeding else 0
+        self.next_announce = _Duration(1800)
+        self.has_metadata = True
+
+
+class peer_info:
+    interesting = 0x1
+    choked = 0x2
+    seed = 0x400
+    utp_socket = 0x2000
+
+    def __init__(self, rng: random.Random, index: int) -> None:
+        self.ip = (f"10.{rng.randrange(256)}.{rng.randrange(256)}.{index % 250 + 1}", 6881)
+        self.client = rng.choice((b"qBittorrent 4.6.2", b"Transmission 4.0.5", b"libtorrent"))
+        self.flags = rng.choice((0, peer_info.seed, peer_info.utp_socket))
+        self.progress = 1.0 if self.flags & peer_info.seed else rng.random()
+        self.download_queue_length = rng.randrange(64)
+        self.upload_queue_length = rng.randrange(64)
+        self.up_speed = rng.randrange(1 << 20)
+        self.down_speed = rng.randrange(1 << 22)
+        self.total_download = rng.randrange(1 << 32)
+        self.total_upload = rng.randrange(1 << 32)
+
+
+class announce_entry:
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.tier = 0
+
+
+class file_storage:
+    def __init__(self, files: List[tuple]) -> None:
+        self._files = files
+
+    def num_files(self) -> int:
+        return len(self._files)
+
+    def file_path(self, index: int) -> str:
+        return self._files[index][0]
+
+    def file_size(self, index: int) -> int:
+        return self._files[index][1]
+
+    def file_offset(self, index: int) -> int:
+        return self._files[index][2]
+
+
+class torrent_info:
+    def __init__(self, torrent: "_Torrent") -> None:
+        self._torrent = torrent
+        self._files = file_storage(torrent.files)
+
+    def files(self) -> file_storage:
+        return self._files
+
+    def info_hash(self) -> sha1_hash:
+        return self._torrent.info_hashes.v1
+
+    def info_hashes(self) -> info_hash_t:
+        return self._torrent.info_hashes
+
+    def name(self) -> str:
+        return self._torrent.name
+
+    def comment(self) -> str:
+        return "Synthetic torrent"
+
+    def creator(self) -> str:
+        return "seedarr fake_libtorrent"
+
+    def total_size(self) -> int:
+        return self._torrent.total_size
+
+    def piece_length(self) -> int:
+        return 1 << 18
+
+    def num_pieces(self) -> int:
+        return -(-self._torrent.total_size // (1 << 18))
+
+    def num_files(self) -> int:
+        return len(self._torrent.files)
+
+    def priv(self) -> bool:
+        return False
+
+    def creation_date(self) -> int:
+        return self._torrent.added_time
+
+    def metadata_size(self) -> int:
+        return 64 * len(self._torrent.files) + 20 * self.num_pieces()
+
+    def trackers(self) -> List[announce_entry]:
+        return [announce_entry(tracker["url"]) for tracker in self._torrent.trackers]
+
+    def nodes(self) -> list:
+        return []
+
+
+class _Torrent:
+    """One synthetic torrent and the state its handle and status report."""
+
+    def __init__(self, rng: random.Random, index: int, peers: int, files: int) -> None:
+        seed = rng.randbytes(32)
+        self.info_hashes = info_hash_t(sha1_hash(_hash(seed, 20)))
+        self.name = f"Some.Linux.Distribution.{index}.x86_64"
+        self.save_path = "/srv/downloads"
+        self.state = torrent_status.downloading
+        self.flags = torrent_flags.auto_managed
+        self.progress = rng.random()
+        self.download_rate = rng.randrange(1 << 22)
+        self.upload_rate = rng.randrange(1 << 20)
+        self.uploaded = rng.randrange(1 << 34)
+        self.added_time = int(time.time()) - rng.randrange(86400 * 30)
+        self.peers = [peer_info(rng, i) for i in range(peers)]
+        self.seeds = sum(bool(p.flags & peer_info.seed) for p in self.peers)
+        self.trackers = [
+            {"url": f"udp://tracker{i}.example.org:1337/announce", "tier": i} for i in range(3)
+        ]
+
+        self.files = []
+        offset = 0
+        for i in range(files):
+            size = rng.randrange(1 << 16, 1 << 30)
+            self.files.append((f"{self.name}/disc{i // 100}/part{i:05d}.bin", size, offset))
+            offset += size
+        self.total_size = offset
+        self.info = torrent_info(self)
+        self.handle = torrent_handle(self)
+        self.valid = True
+        self.changed = True
+
+
+class torrent_handle:
+    save_info_dict = 1 << 1
+    flush_disk_cache = 1 << 0
+
+    def __init__(self, torrent: _Torrent) -> None:
+        self._torrent = torrent
+
+    def is_valid(self) -> bool:
+        return self._torrent.valid
+
+    def info_hash(self) -> sha1_hash:
+        return self._torrent.info_hashes.v1
+
+    def info_hashes(self) -> info_hash_t:
+        return self._torrent.info_hashes
+
+    def name(self) -> str:
+        return self._torrent.name
+
+    def status(self, flags: int = 0) -> torrent_status:
+        return torrent_status(self._torrent)
+
+    def has_metadata(self) -> bool:
+        return True
+
+    def get_torrent_info(self) -> torrent_info:
+        return self._torrent.info
+
+    def torrent_file(self) -> torrent_info:
+        return self._torrent.info
+
+    def file_progress(self, flags: int = 0) -> List[int]:
+        progress = self._torrent.progress
+        return [int(size * progress) for _, size, _ in self._torrent.files]
+
+    def file_priorities(self) -> List[int]:
+        return [4] * len(self._torrent.files)
+
+    def get_peer_info(self) -> List[peer_info]:
+        return list(self._torrent.peers)
+
+    def trackers(self) -> List[dict]:
+        return [dict(tracker) for tracker in self._torrent.trackers]
+
+    def replace_trackers(self, trackers) -> None:
+        self._torrent.trackers = [{"url": t.url, "tier": t.tier} for t in trackers]
+
+    def save_path(self) -> str:
+        return self._torrent.save_path
+
+    def is_paused(self) -> bool:
+        return bool(self._torrent.flags & torrent_flags.paused)
+
+    def flags(self) -> int:
+        return self._torrent.flags
+
+    def set_flags(self, flags: int, mask: Optional[int] = None) -> None:
+        self._torrent.flags |= flags
+        self._torrent.changed = True
+
+    def unset_flags(self, flags: int) -> None:
+        self._torrent.flags &= ~flags
+        self._torrent.changed = True
+
+    def pause(self, flags: int = 0) -> None:
+        self.set_flags(torrent_flags.paused)
+
+    def resume(self) -> None:
+        self.unset_flags(torrent_flags.paused)
+
+    def auto_managed(self, enabled: bool) -> None:
+        if enabled:
+            self.set_flags(torrent_flags.auto_managed)
+        else:
+            self.unset_flags(torrent_flags.auto_managed)
+
+    def set_upload_mode(self, enabled: bool) -> None:
+        if enabled:
+            self.set_flags(torrent_flags.upload_mode)
+        else:
+            self.unset_flags(torrent_flags.upload_mode)
+
+    def force_reannounce(self, *args) -> None:
+        pass
+
+    def force_recheck(self) -> None:
+        pass
+
+    def need_save_resume_data(self) -> bool:
+        return False
+
+    def save_resume_data(self, flags: int = 0) -> None:
+        pass
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, torrent_handle) and other._torrent is self._torrent
+
+    def __hash__(self) -> int:
+        return id(self._torrent)
+
+
+class alert:
+    class category_t:
+        error_notification = 1 << 0
+        peer_notification = 1 << 1
+        status_notification = 1 << 6
+        dht_notification = 1 << 10
+        all_categories = 0x7FFFFFFF
+
+    def __init__(self, handle: Optional[torrent_handle] = None) -> None:
+        if handle is not None:
+            self.handle = handle
+        self.timestamp = time.time()
+
+    def what(self) -> str:
+        return type(self).__name__.removesuffix("_alert")
+
+    def message(self) -> str:
+        return str(self)
+
+    def __str__(self) -> str:
+        handle = getattr(self, "handle", None)
+        name = handle.name() if handle is not None else "session"
+        return f"{name}: {self.what()}"
+
+
+class torrent_alert(alert):
+    pass
+
+
+class state_update_alert(alert):
+    def __init__(self, status: List[torrent_status]) -> None:
+        super().__init__()
+        self.status = status
+
+
+class torrent_finished_alert(torrent_alert):
+    pass
+
+
+class torrent_paused_alert(torrent_alert):
+    pass
+
+
+class torrent_resumed_alert(torrent_alert):
+    pass
+
+
+class metadata_received_alert(torrent_alert):
+    pass
+
+
+class storage_moved_alert(torrent_alert):
+    pass
+
+
+class file_renamed_alert(torrent_alert):
+    pass
+
+
+class save_resume_data_failed_alert(torrent_alert):
+    pass
+
+
+class add_torrent_alert(torrent_alert):
+    def __init__(self, handle: torrent_handle, params: "add_torrent_params") -> None:
+        super().__init__(handle)
+        self.params = params
+        self.error = None
+
+
+class save_resume_data_alert(torrent_alert):
+    def __init__(self, handle: torrent_handle, params: "add_torrent_params") -> None:
+        super().__init__(handle)
+        self.params = params
+
+
+class torrent_removed_alert(torrent_alert):
+    def __init__(self, handle: torrent_handle) -> None:
+        super().__init__(handle)
+        self.info_hashes = handle.info_hashes()
+
+
+class peer_connect_alert(torrent_alert):
+    def __init__(self, handle: torrent_handle, peer: peer_info) -> None:
+        super().__init__(handle)
+        self.ip = peer.ip
+        self.endpoint = peer.ip
+
+
+class session_stats_alert(alert):
+    def __init__(self, values: Dict[str, int]) -> None:
+        super().__init__()
+        self.values = values
+
+
+class _Metric:
+    __slots__ = ("name", "value_index", "type")
+
+    def __init__(self, name: str, value_index: int, type: metric_type_t) -> None:
+        self.name = name
+        self.value_index = value_index
+        self.type = type
+
+
+_METRICS = (
+    ("net.sent_bytes", metric_type_t.counter),
+    ("net.recv_bytes", metric_type_t.counter),
+    ("peer.num_peers_connected", metric_type_t.gauge),
+    ("ses.num_downloading_torrents", metric_type_t.gauge),
+    ("ses.num_seeding_torrents", metric_type_t.gauge),
+)
+
+
+def session_stats_metrics() -> List[_Metric]:
+    return [_Metric(name, index, type) for index, (name, type) in enumerate(_METRICS)]
+
+
+class add_torrent_params:
+    def __init__(self) -> None:
+        self.info_hashes = info_hash_t()
+        self.name = ""
+        self.save_path = ""
+        self.ti = None
+        self.flags = torrent_flags.auto_managed | torrent_flags.paused
+        self.trackers: List[str] = []
+        self.storage_mode = storage_mode_t.storage_mode_sparse
+
+
+def parse_magnet_uri(uri: str) -> add_torrent_params:
+    params = add_torrent_params()
+    digest = uri.partition("xt=urn:btih:")[2][:40]
+    params.info_hashes = info_hash_t(sha1_hash(bytes.fromhex(digest)))
+    return params
+
+
+def write_resume_data_buf(params: add_torrent_params) -> bytes:
+    return params.info_hashes.v1.to_bytes() + params.name.encode()
+
+
+def read_resume_data(buffer: bytes) -> add_torrent_params:
+    params = add_torrent_params()
+    params.info_hashes = info_hash_t(sha1_hash(buffer[:20]))
+    params.name = bytes(buffer[20:]).decode()
+    return params
+
+
+def bdecode(buffer: bytes):
+    return None
+
+
+class FakeSwarm:
+    """`torrents` synthetic torrents with `peers` peers and `files` files each."""
+
+    def __init__(self, torrents: int, peers: int, files: int, seed: int = 0) -> None:
+        self.rng = random.Random(seed)
+        self.torrents = [_Torrent(self.rng, i, peers, files) for i in range(torrents)]
+
+    def handles(self) -> List[torrent_handle]:
+        return [torrent.handle for torrent in self.torrents if torrent.valid]
+
+    def tick(self, fraction: float = 0.05) -> None:
+        """Change the rates of `fraction` of the torrents, as a second of transfer would."""
+        rng = self.rng
+        count = max(1, int(len(self.torrents) * fraction))
+        for torrent in rng.sample(self.torrents, k=min(count, len(self.torrents))):
+            torrent.download_rate = rng.randrange(1 << 22)
+            torrent.upload_rate = rng.randrange(1 << 20)
+            torrent.progress = min(1.0, torrent.progress + rng.random() / 100)
+            torrent.changed = True
+
+    def state_update(self) -> state_update_alert:
+        """A state_update_alert for the torrents changed since the last one."""
+        changed = []
+        for torrent in self.torrents:
+            if torrent.changed and torrent.valid:
+                torrent.changed = False
+                changed.append(torrent_status(torrent))
+        return state_update_alert(changed)
+
+    def alerts(self, count: int) -> List[alert]:
+        """`count` per-torrent alerts of the kinds the daemon serializes."""
+        rng = self.rng
+        result: List[alert] = []
+        for _ in range(count):
+            torrent = rng.choice(self.torrents)
+            kind = rng.randrange(3)
+            if kind == 0 and torrent.peers:
+                result.append(peer_connect_alert(torrent.handle, rng.choice(torrent.peers)))
+            elif kind == 1:
+                result.append(torrent_finished_alert(torrent.handle))
+            else:
+                params = add_torrent_params()
+                params.info_hashes = torrent.info_hashes
+                result.append(add_torrent_alert(torrent.handle, params))
+        return result
+
+
+class session:
+    def __init__(self, settings: Optional[dict] = None) -> None:
+        self._settings = dict(settings or {})
+        self._swarm = _swarm if _swarm is not None else FakeSwarm(TORRENTS, PEERS, FILES)
+        self._alerts: List[alert] = []
+        self._alerts_lock = threading.Lock()
+        self._queued = threading.Event()
+        self._paused = False
+
+    @property
+    def swarm(self) -> FakeSwarm:
+        return self._swarm
+
+    def apply_settings(self, settings: dict) -> None:
+        self._settings.update(settings)
+
+    def get_settings(self) -> dict:
+        return dict(self._settings)
+
+    def add_dht_router(self, host: str, port: int) -> None:
+        pass
+
+    def get_torrents(self) -> List[torrent_handle]:
+        return self._swarm.handles()
+
+    def find_torrent(self, info_hash: sha1_hash) -> torrent_handle:
+        for torrent in self._swarm.torrents:
+            if torrent.valid and torrent.info_hashes.v1 == info_hash:
+                return torrent.handle
+        return torrent_handle(_InvalidTorrent())
+
+    def add_torrent(self, params: add_torrent_params) -> torrent_handle:
+        torrent = _Torrent(self._swarm.rng, len(self._swarm.torrents), 0, 1)
+        if params.info_hashes.has_v1() or params.info_hashes.has_v2():
+            torrent.info_hashes = params.info_hashes
+        self._swarm.torrents.append(torrent)
+        self.post_alert(add_torrent_alert(torrent.handle, params))
+        return torrent.handle
+
+    def async_add_torrent(self, params: add_torrent_params) -> None:
+        self.add_torrent(params)
+
+    def remove_torrent(self, handle: torrent_handle, options: int = 0) -> None:
+        handle._torrent.valid = False
+        self.post_alert(torrent_removed_alert(handle))
+
+    def pause(self) -> None:
+        self._paused = True
+
+    def resume(self) -> None:
+        self._paused = False
+
+    def is_paused(self) -> bool:
+        return self._paused
+
+    def post_alert(self, posted: alert) -> None:
+        with self._alerts_lock:
+            self._alerts.append(posted)
+        self._queued.set()
+
+    def post_torrent_updates(self, flags: int = 0) -> None:
+        # Rates move between updates, as they would over a real swarm
+        self._swarm.tick()
+        self.post_alert(self._swarm.state_update())
+
+    def post_session_stats(self) -> None:
+        self.post_alert(session_stats_alert({name: 0 for name, _ in _METRICS}))
+
+    def wait_for_alert(self, max_wait_ms: int) -> Optional[alert]:
+        if not self._queued.wait(max_wait_ms / 1000):
+            return None
+        with self._alerts_lock:
+            return self._alerts[0] if self._alerts else None
+
+    def pop_alerts(self) -> List[alert]:
+        with self._alerts_lock:
+            alerts, self._alerts = self._alerts, []
+            self._queued.clear()
+        return alerts
+
+
+class _InvalidTorrent:
+    valid = False
+    info_hashes = info_hash_t()
+    name = ""
+
+
+def configure(
+    torrents: int = TORRENTS, peers: int = PEERS, files: int = FILES, seed: int = 0
+) -> FakeSwarm:
+    """Build the swarm every `session()` created from now on is populated with."""
+    global _swarm
+    _swarm = FakeSwarm(torrents, peers, files, seed)
+    return _swarm
+
+
+def install() -> None:
+    """Make `import libtorrent` resolve to this module."""
+    current = sys.modules.get("libtorrent")
+    if current is not None and current is not sys.modules[__name__]:
+        raise RuntimeError("The real libtorrent is already imported; install the fake first")
+    sys.modules["libtorrent"] = sys.modules[__name__]
+
+
+__version__ = "fake"
@@ -0,0 +1,111 @@
+"""
+Alerts per second that `alert_consumer` can fan out with 1, 10 and 100
+connected clients: one emit per client (the old behaviour) against one
+emit to a room, which python-socketio encodes once for all members.
+
+Engine.IO transport sends are replaced with no-ops, so the numbers cover
+Socket.IO packet building and msgpack encoding only.
+
+Run with `python -m seedarr.benchmarks.fanout`.
+"""
+
+import os
+import random
+import time
+
+import anyio
+import socketio
+
+CLIENTS = (1, 10, 100)
+TORRENTS_PER_ALERT = 200
+DURATION = 1.0
+ROOM = "libtorrent:broadcast"
+
+
+def _make_alert(torrents: int) -> dict:
+    return {
+        "type": "libtorrent:state_update",
+        "statuses": [
+            {
+                "info_hash": os.urandom(20).hex(),
+                "name": f"Some.Linux.Distribution.{i}.x86_64.iso",
+                "progress": round(random.random() * 100, 2),
+                "download_rate": random.randrange(1 << 22),
+                "upload_rate": random.randrange(1 << 20),
+                "num_peers": random.randrange(200),
+                "num_seeds": random.randrange(50),
+                "total_size": random.randrange(1 << 34),
+                "state": "downloading",
+            }
+            for i in range(torrents)
+        ],
+    }
+
+
+async def _make_server(clients: int) -> tuple[socketio.AsyncServer, list[str]]:
+    sio = socketio.AsyncServer(async_mode="asgi", serializer="msgpack")
+
+    async def discard(*args, **kwargs):
+        return None
+
+    sio.eio.send = discard  # type: ignore
+    sio.eio.send_packet = discard  # type: ignore
+
+    sids = []
+    for i in range(clients):
+        sid = await sio.manager.connect(f"eio-{i}", "/")
+        await sio.enter_room(sid, ROOM)
+        sids.append(sid)
+    return sio, sids
+
+
+async def _alerts_per_second(emit_once) -> float:
+    count = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < DURATION:
+        await emit_once()
+        count += 1
+    return count / (time.perf_counter() - started)
+
+
+async def _run(clients_counts, torrents: int) -> list[dict]:
+    alert = _make_alert(torrents)
+    results = []
+
+    for clients in clients_counts:
+        sio, sids = await _make_server(clients)
+
+        async def per_client():
+            for sid in sids:
+                await sio.emit("libtorrent:broadcast", alert, room=sid)
+
+        async def per_room():
+            await sio.emit("libtorrent:broadcast", alert, room=ROOM)
+
+        results.append(
+            {
+                "clients": clients,
+                "per_client_alerts_per_s": await _alerts_per_second(per_client),
+                "room_alerts_per_s": await _alerts_per_second(per_room),
+            }
+        )
+
+    return results
+
+
+def run(clients=CLIENTS, torrents: int = TORRENTS_PER_ALERT) -> list[dict]:
+    return anyio.run(_run, clients, torrents)
+
+
+def main() -> None:
+    print(f"state_update alerts carrying {TORRENTS_PER_ALERT} torrents")
+    print(f"{'clients':>8} {'per-client emit/s':>18} {'room emit/s':>12}")
+    for row in run():
+        print(
+            f"{row['clients']:>8} {row['per_client_alerts_per_s']:>18.0f} "
+            f"{row['room_alerts_per_s']:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
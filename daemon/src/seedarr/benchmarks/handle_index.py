@@ -0,0 +1,90 @@
+"""
+Compare info-hash lookups through `HandleIndex` against the linear
+`get_torrents()` scan the routes used before it existed.
+
+Run with `python -m seedarr.benchmarks.handle_index`.
+"""
+
+import os
+import random
+import timeit
+
+import libtorrent as lt
+
+from seedarr.datastructures import HandleIndex
+
+SIZES = (100, 1_000, 10_000, 20_000, 100_000)
+LOOKUPS = 1_000
+
+
+class _StubHandle:
+    """Just enough of `lt.torrent_handle` for the index and the linear scan."""
+
+    __slots__ = ("_info_hashes",)
+
+    def __init__(self, info_hashes: lt.info_hash_t) -> None:
+        self._info_hashes = info_hashes
+
+    def info_hashes(self) -> lt.info_hash_t:
+        return self._info_hashes
+
+    def info_hash(self) -> lt.sha1_hash:
+        return self._info_hashes.get_best()
+
+    def is_valid(self) -> bool:
+        return True
+
+
+def _make_handles(count: int) -> list[_StubHandle]:
+    return [_StubHandle(lt.info_hash_t(lt.sha1_hash(os.urandom(20)))) for _ in range(count)]
+
+
+def _linear_find(handles: list[_StubHandle], info_hash: str):
+    for handle in handles:
+        if not handle.is_valid():
+            continue
+        if str(handle.info_hash()) == info_hash:
+            return handle
+    return None
+
+
+def run(sizes=SIZES, lookups: int = LOOKUPS) -> list[dict]:
+    results = []
+
+    for size in sizes:
+        handles = _make_handles(size)
+        index = HandleIndex()
+        for handle in handles:
+            index.add(handle)
+
+        targets = [str(h.info_hash()) for h in random.choices(handles, k=lookups)]
+
+        indexed = timeit.timeit(lambda: [index.get(t) for t in targets], number=1)
+
+        # The scan is too slow to run the full batch on large sessions
+        scan_targets = targets[: max(1, lookups * 1_000 // size)]
+        linear = timeit.timeit(lambda: [_linear_find(handles, t) for t in scan_targets], number=1)
+
+        results.append(
+            {
+                "torrents": size,
+                "index_ns_per_lookup": indexed / len(targets) * 1e9,
+                "linear_ns_per_lookup": linear / len(scan_targets) * 1e9,
+            }
+        )
+
+    return results
+
+
+def main() -> None:
+    print(f"{'torrents':>10} {'index (ns)':>12} {'linear scan (ns)':>18}")
+    for row in run():
+        print(
+            f"{row['torrents']:>10} "
+            f"{row['index_ns_per_lookup']:>12.0f} "
+            f"{row['linear_ns_per_lookup']:>18.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Time the daemon's hot paths against `fake_libtorrent`, so they can be
+measured without a real swarm: serializing one torrent's files, peers and
+general info, answering `libtorrent:get_all` from a stale status store
+(which requests and applies one state_update) and a fresh one, serializing
+general info again, serializing alerts, and pushing alert batches through
+the EventBus into `alert_consumer` with broadcast clients connected.
+
+The swarm shape (torrents, peers and files per torrent) is configurable.
+Engine.IO sends are no-ops, as in the fanout benchmark.
+
+Run with `python -m seedarr.benchmarks.hot_paths`.
+"""
+
+import contextlib
+import io
+import statistics
+import time
+
+import anyio
+
+from . import fake_libtorrent
+
+TORRENTS = 1_000
+PEERS = 50
+FILES = 100
+CLIENTS = 10
+ALERTS_PER_BATCH = 20
+
+# Each path is called for at least this long and at least MIN_CALLS times
+DURATION = 0.5
+MIN_CALLS = 5
+
+
+async def _measure(call) -> dict:
+    durations = []
+    started = time.perf_counter()
+    while len(durations) < MIN_CALLS or time.perf_counter() - started < DURATION:
+        begin = time.perf_counter()
+        await call()
+        durations.append(time.perf_counter() - begin)
+    return {
+        "calls": len(durations),
+        "mean_ms": statistics.fmean(durations) * 1e3,
+        "p50_ms": statistics.median(durations) * 1e3,
+        "min_ms": min(durations) * 1e3,
+        "max_ms": max(durations) * 1e3,
+    }
+
+
+async def _run(torrents: int, peers: int, files: int, clients: int) -> list[dict]:
+    fake_libtorrent.install()
+    swarm = fake_libtorrent.configure(torrents, peers, files)
+
+    # Imported only now, so they bind the fake libtorrent
+    from seedarr.enums import EventTopic
+    from seedarr.singletons import SIO, EventBus, LibtorrentSession, Logger
+
+    Logger.init()
+    await SIO.init()
+    with contextlib.redirect_stdout(io.StringIO()):
+        # Session creation prints the applied settings
+        await LibtorrentSession.init()
+
+    from seedarr.consumers import alert_consumer
+    from seedarr.consumers.broadcast import serialize_alert
+    from seedarr.managers import BROADCAST_ROOM, BroadcastClientManager
+    from seedarr.routes.libtorrent.get_all import get_all
+    from seedarr.serializers import (
+        serialize_file_info,
+        serialize_magnet_torrent_info,
+        serialize_peer_info,
+    )
+
+    sio = SIO.get_instance()
+
+    async def discard(*args, **kwargs):
+        return None
+
+    sio.eio.send = discard  # type: ignore
+    sio.eio.send_packet = discard  # type: ignore
+
+    handle = swarm.torrents[0].handle
+    shape = {"torrents": torrents, "peers": peers, "files": files}
+    results = []
+
+    def record(name: str, timings: dict, **extra) -> None:
+        results.append({"name": name, **shape, **extra, **timings})
+
+    record("serialize_file_info", await _measure(lambda: serialize_file_info(handle)))
+    record("serialize_peer_info", await _measure(lambda: serialize_peer_info(handle)))
+    record(
+        "serialize_magnet_torrent_info",
+        await _measure(lambda: serialize_magnet_torrent_info(handle)),
+    )
+
+    statuses = await LibtorrentSession.get_status_store()
+
+    lt_ses = await LibtorrentSession.get_session()
+
+    async def answer_state_update():
+        # Stands in for the alert loop, which is not running here
+        while not (alerts := lt_ses.pop_alerts()):
+            await anyio.sleep(0)
+        await LibtorrentSession.track_alerts(alerts)
+
+    async def get_all_stale():
+        statuses.refreshed = float("-inf")
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(answer_state_update)
+            await get_all("bench")
+
+    record("get_all_stale", await _measure(get_all_stale))
+    statuses.refreshed = time.monotonic() + 3600
+    record("get_all_fresh", await _measure(lambda: get_all("bench")))
+    record(
+        "serialize_magnet_torrent_info_fresh",
+        await _measure(lambda: serialize_magnet_torrent_info(handle)),
+    )
+
+    swarm.tick(1.0)
+    state_update = swarm.state_update()
+    record(
+        "serialize_alert_state_update",
+        await _measure(lambda: serialize_alert(state_update)),
+        statuses=len(state_update.status),
+    )
+
+    alerts = swarm.alerts(ALERTS_PER_BATCH)
+
+    async def serialize_alerts():
+        for alert in alerts:
+            await serialize_alert(alert)
+
+    record("serialize_alert_batch", await _measure(serialize_alerts), alerts=len(alerts))
+
+    # A pop's worth of alerts: the state_update of 5% of the swarm and some
+    # per-torrent alerts, serialized as shared_poll_and_publish does
+    swarm.tick(0.05)
+    batch = [await serialize_alert(alert) for alert in [swarm.state_update(), *alerts]]
+
+    broadcast_client_manager = BroadcastClientManager()
+    for i in range(clients):
+        sid = await sio.manager.connect(f"eio-{i}", "/")
+        await sio.enter_room(sid, BROADCAST_ROOM)
+        broadcast_client_manager.add_client(sid)
+
+    EventBus.init()
+    event_bus = EventBus.get_bus()
+    event_bus.subscribe("broadcast", alert_consumer, topics=(EventTopic.ALERTS,))
+
+    async def publish_and_consume():
+        await event_bus.publish(list(batch), topic=EventTopic.ALERTS)
+        await event_bus.join("broadcast")
+
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(event_bus.start)
+        await anyio.sleep(0)
+        record(
+            "event_bus_alert_consumer",
+            await _measure(publish_and_consume),
+            clients=clients,
+            alerts=len(batch),
+        )
+        event_bus.stop()
+
+    return results
+
+
+def run(
+    torrents: int = TORRENTS, peers: int = PEERS, files: int = FILES, clients: int = CLIENTS
+) -> list[dict]:
+    return anyio.run(_run, torrents, peers, files, clients)
+
+
+def main() -> None:
+    print(f"{TORRENTS} torrents, {PEERS} peers and {FILES} files each, {CLIENTS} clients")
+    print(f"{'path':>30} {'calls':>7} {'mean ms':>9} {'p50 ms':>9} {'min ms':>9}")
+    for row in run():
+        print(
+            f"{row['name']:>30} {row['calls']:>7} {row['mean_ms']:>9.3f} "
+            f"{row['p50_ms']:>9.3f} {row['min_ms']:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
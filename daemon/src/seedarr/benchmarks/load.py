@@ -0,0 +1,326 @@
+"""
+Load-test the daemon with simulated dashboard clients, each doing what the
+web app does: start the alert stream, fetch `libtorrent:get_all` once and
+poll one torrent's detail endpoints every 950 ms.
+
+Reports p50/p99 ack latency per event and broadcast lag. Lag is measured
+by a probe client that pauses and resumes a torrent and times how long the
+synthetic event takes to reach every dashboard. Also reported: the interval
+between state updates and the daemon's CPU use over the run.
+
+By default the daemon is started on localhost backed by `fake_libtorrent`;
+`standin=False` starts it with the real libtorrent and `url` attaches to a
+daemon that is already running (pass its `pid` to get CPU use). The
+python-socketio client needs aiohttp, installed with the `dev` group.
+
+Run with `python -m seedarr.benchmarks.load`, or `seedarr load`.
+"""
+
+import asyncio
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+import socketio
+
+CLIENTS = 20
+DURATION = 30.0
+PORT = 18765
+# The web app's POLLING_INTERVAL, in seconds
+POLL_INTERVAL = 0.95
+PROBE_INTERVAL = 2.0
+ACK_TIMEOUT = 10.0
+DETAIL_EVENTS = (
+    "libtorrent:get_specific",
+    "libtorrent:get_specific_peers",
+    "libtorrent:get_specific_files",
+)
+
+# Swarm of the stand-in daemon
+TORRENTS = 1_000
+PEERS = 50
+FILES = 100
+
+_STANDIN = (
+    "import sys\n"
+    "from seedarr.benchmarks import fake_libtorrent\n"
+    "fake_libtorrent.install()\n"
+    "fake_libtorrent.configure(*map(int, sys.argv[1:4]))\n"
+    "from seedarr.__main__ import main\n"
+    "main(sys.argv[4:])\n"
+)
+
+
+def _percentiles(values: list[float]) -> dict:
+    if not values:
+        return {"count": 0, "p50_ms": None, "p99_ms": None, "max_ms": None}
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "p50_ms": statistics.median(ordered) * 1e3,
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e3,
+        "max_ms": ordered[-1] * 1e3,
+    }
+
+
+def _cpu_seconds(pid: int) -> float | None:
+    """User plus system CPU time of process `pid`, from /proc (Linux only)."""
+    try:
+        with open(f"/proc/{pid}/stat") as file:
+            fields = file.read().rpartition(")")[2].split()
+    except OSError:
+        return None
+    # utime and stime are the 14th and 15th fields, after "pid (comm)"
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+class _Daemon:
+    """A daemon subprocess listening on localhost."""
+
+    def __init__(self, port: int, standin: bool, torrents: int, peers: int, files: int):
+        self.port = port
+        self.url = f"http://127.0.0.1:{port}"
+        self._directory = tempfile.TemporaryDirectory()
+        environment = dict(os.environ)
+        if standin:
+            # Keep the stand-in away from the real resume data and folder locks
+            environment["DATABASE_PATH"] = os.path.join(self._directory.name, "seedarr.db")
+            environment["FOLDER_LOCK_DIRECTORY"] = self._directory.name
+            command = [sys.executable, "-c", _STANDIN, str(torrents), str(peers), str(files)]
+        else:
+            command = [sys.executable, "-m", "seedarr"]
+        self.process = subprocess.Popen(
+            [*command, "--port", str(port)],
+            env=environment,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    async def wait_ready(self, timeout: float = 30.0) -> None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"Daemon exited with status {self.process.returncode}")
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=0.2):
+                    return
+            except OSError:
+                await asyncio.sleep(0.2)
+        raise TimeoutError(f"Daemon did not listen on port {self.port} within {timeout}s")
+
+    def stop(self) -> None:
+        self.process.send_signal(signal.SIGINT)
+        try:
+            self.process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self._directory.cleanup()
+
+
+class _Stats:
+    def __init__(self) -> None:
+        self.acks: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.timeouts: dict[str, int] = defaultdict(int)
+        self.frames = 0
+        self.state_update_intervals: list[float] = []
+        # (event type, info_hash) -> when the probe sent it
+        self.probes: dict[tuple[str, str], float] = {}
+        self.probes_sent = 0
+        self.lags: list[float] = []
+
+    async def call(self, client: socketio.AsyncClient, event: str, data=None):
+        started = time.perf_counter()
+        try:
+            response = await client.call(event, data, timeout=ACK_TIMEOUT)
+        except socketio.exceptions.TimeoutError:
+            self.timeouts[event] += 1
+            return None
+        self.acks[event].append(time.perf_counter() - started)
+        if not isinstance(response, dict) or response.get("status") == "error":
+            self.errors[event] += 1
+        return response
+
+
+def _frame_alerts(frame) -> list:
+    if isinstance(frame, dict) and frame.get("type") == "batch":
+        return frame.get("alerts", [])
+    return [frame]
+
+
+async def _dashboard(index: int, url: str, stats: _Stats, stop: asyncio.Event) -> None:
+    client = socketio.AsyncClient(serializer="msgpack")
+    last_state_update = None
+
+    @client.on("libtorrent:broadcast")
+    async def on_broadcast(frame):
+        nonlocal last_state_update
+        now = time.perf_counter()
+        stats.frames += 1
+        for alert in _frame_alerts(frame):
+            kind = alert.get("type")
+            if kind == "libtorrent:state_update":
+                if last_state_update is not None:
+                    stats.state_update_intervals.append(now - last_state_update)
+                last_state_update = now
+            sent = stats.probes.get((kind, alert.get("info_hash")))
+            if sent is not None:
+                stats.lags.append(now - sent)
+
+    await client.connect(url, transports=["websocket"])
+    try:
+        await stats.call(client, "libtorrent:broadcast", {"event": "start"})
+        response = await stats.call(client, "libtorrent:get_all")
+        torrents = (response or {}).get("torrents") or []
+        info_hash = torrents[index % len(torrents)]["info_hash"] if torrents else None
+
+        while not stop.is_set():
+            if info_hash is not None:
+                for event in DETAIL_EVENTS:
+                    await stats.call(client, event, {"info_hash": info_hash})
+            try:
+                await asyncio.wait_for(stop.wait(), POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        await client.disconnect()
+
+
+async def _probe(url: str, stats: _Stats, stop: asyncio.Event) -> None:
+    """Pause and resume one torrent so dashboards can time the synthetic events."""
+    client = socketio.AsyncClient(serializer="msgpack")
+    await client.connect(url, transports=["websocket"])
+    try:
+        response = await stats.call(client, "libtorrent:get_all")
+        torrents = (response or {}).get("torrents") or []
+        if not torrents:
+            return
+        info_hash = torrents[0]["info_hash"]
+
+        paused = False
+        while not stop.is_set():
+            event = "libtorrent:resume" if paused else "libtorrent:pause"
+            kind = "synthetic:resumed" if paused else "synthetic:paused"
+            stats.probes[(kind, info_hash)] = time.perf_counter()
+            stats.probes_sent += 1
+            await stats.call(client, event, {"info_hash": info_hash})
+            paused = not paused
+            try:
+                await asyncio.wait_for(stop.wait(), PROBE_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        await client.disconnect()
+
+
+async def _run(
+    clients: int,
+    duration: float,
+    url: str | None,
+    pid: int | None,
+    standin: bool,
+    torrents: int,
+    peers: int,
+    files: int,
+) -> dict:
+    daemon = None
+    if url is None:
+        daemon = _Daemon(PORT, standin, torrents, peers, files)
+        url, pid = daemon.url, daemon.pid
+
+    try:
+        if daemon is not None:
+            await daemon.wait_ready()
+
+        stats = _Stats()
+        stop = asyncio.Event()
+        cpu_started = _cpu_seconds(pid) if pid else None
+        started = time.perf_counter()
+
+        tasks = [asyncio.create_task(_dashboard(i, url, stats, stop)) for i in range(clients)]
+        tasks.append(asyncio.create_task(_probe(url, stats, stop)))
+        await asyncio.sleep(duration)
+        stop.set()
+        await asyncio.gather(*tasks)
+
+        elapsed = time.perf_counter() - started
+        cpu_finished = _cpu_seconds(pid) if pid else None
+    finally:
+        if daemon is not None:
+            daemon.stop()
+
+    cpu = None
+    if cpu_started is not None and cpu_finished is not None:
+        cpu = (cpu_finished - cpu_started) / elapsed * 100
+
+    return {
+        "url": url,
+        "backend": "attached" if daemon is None else ("fake" if standin else "libtorrent"),
+        "clients": clients,
+        "seconds": elapsed,
+        "daemon_cpu_percent": cpu,
+        "acks": {
+            event: {
+                **_percentiles(latencies),
+                "errors": stats.errors[event],
+                "timeouts": stats.timeouts[event],
+            }
+            for event, latencies in sorted(stats.acks.items())
+        },
+        "broadcast": {
+            "frames": stats.frames,
+            "probes_sent": stats.probes_sent,
+            "lag": _percentiles(stats.lags),
+            "state_update_interval": _percentiles(stats.state_update_intervals),
+        },
+    }
+
+
+def run(
+    clients: int = CLIENTS,
+    duration: float = DURATION,
+    url: str | None = None,
+    pid: int | None = None,
+    standin: bool = True,
+    torrents: int = TORRENTS,
+    peers: int = PEERS,
+    files: int = FILES,
+) -> dict:
+    return asyncio.run(_run(clients, duration, url, pid, standin, torrents, peers, files))
+
+
+def main() -> None:
+    report = run()
+    print(
+        f"{report['clients']} clients for {report['seconds']:.0f}s against {report['backend']}, "
+        f"daemon CPU {report['daemon_cpu_percent'] or 0:.0f}%"
+    )
+    print(f"{'event':>32} {'acks':>7} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7} {'timeouts':>9}")
+    for event, row in report["acks"].items():
+        print(
+            f"{event:>32} {row['count']:>7} {row['p50_ms'] or 0:>8.1f} "
+            f"{row['p99_ms'] or 0:>8.1f} {row['errors']:>7} {row['timeouts']:>9}"
+        )
+    broadcast = report["broadcast"]
+    lag, interval = broadcast["lag"], broadcast["state_update_interval"]
+    print(
+        f"broadcast: {broadcast['frames']} frames, lag p50 {lag['p50_ms'] or 0:.1f} ms "
+        f"p99 {lag['p99_ms'] or 0:.1f} ms over {lag['count']} probe events, "
+        f"state_update interval p50 {interval['p50_ms'] or 0:.0f} ms "
+        f"p99 {interval['p99_ms'] or 0:.0f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
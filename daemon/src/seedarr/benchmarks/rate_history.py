@@ -0,0 +1,70 @@
+"""
+Measure memory held by `RateHistory` and the cost of its once-per-second
+sample, of the minute roll-up and of reading one torrent's series, for
+sessions of 1,000 to 50,000 torrents.
+
+Run with `python -m seedarr.benchmarks.rate_history`.
+"""
+
+import time
+
+from seedarr.benchmarks.status_store import stub_statuses
+from seedarr.datastructures import RateHistory, StatusStore
+
+SIZES = (1_000, 10_000, 50_000)
+TICKS = 60
+
+
+def run(sizes=SIZES, ticks: int = TICKS) -> list[dict]:
+    results = []
+
+    for size in sizes:
+        store = StatusStore()
+        store.replace(stub_statuses(size))
+        history = RateHistory()
+
+        durations = []
+        for _ in range(ticks):
+            started = time.perf_counter()
+            history.sample(store)
+            durations.append(time.perf_counter() - started)
+
+        # The first tick allocates every slot and the last one rolls up the minute
+        first, roll_up = durations[0], durations[-1]
+        steady = durations[1:-1]
+
+        info_hash = next(iter(store)).info_hash
+        started = time.perf_counter()
+        history.series(info_hash, "1s")
+        series_time = time.perf_counter() - started
+
+        results.append(
+            {
+                "torrents": size,
+                "memory_mib": history.nbytes() / (1 << 20),
+                "bytes_per_torrent": history.nbytes() / size,
+                "first_tick_ms": first * 1e3,
+                "tick_ms": sum(steady) / len(steady) * 1e3,
+                "roll_up_ms": roll_up * 1e3,
+                "series_ms": series_time * 1e3,
+            }
+        )
+
+    return results
+
+
+def main() -> None:
+    print(
+        f"{'torrents':>10} {'MiB':>8} {'B/torrent':>10} {'first ms':>9} "
+        f"{'tick ms':>8} {'roll-up ms':>11} {'series ms':>10}"
+    )
+    for row in run():
+        print(
+            f"{row['torrents']:>10} {row['memory_mib']:>8.1f} "
+            f"{row['bytes_per_torrent']:>10.0f} {row['first_tick_ms']:>9.1f} "
+            f"{row['tick_ms']:>8.2f} {row['roll_up_ms']:>11.1f} {row['series_ms']:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Time a startup restore of 1,000 and 10,000 torrents from the resume-data
+table, split into reading the rows, parsing them with
+`lt.read_resume_data` and libtorrent adding them (queued at once with
+`async_add_torrent`, until every add_torrent_alert arrived).
+
+Torrents are single-piece, paused and without files on disk, so the
+numbers cover restore overhead rather than disk checks.
+
+Run with `python -m seedarr.benchmarks.restore`.
+"""
+
+import os
+import tempfile
+import time
+
+import aiosqlite
+import anyio
+import libtorrent as lt
+
+from seedarr.envs import ALERT_QUEUE_SIZE
+from seedarr.orm import ResumeDataTable
+
+SIZES = (1_000, 10_000)
+
+
+def _make_resume_data(count: int, save_path: str) -> list[tuple[str, bytes]]:
+    rows = []
+    for i in range(count):
+        info = {
+            b"name": f"Some.Linux.Distribution.{i}.x86_64.iso".encode(),
+            b"piece length": 16384,
+            b"length": 16384,
+            b"pieces": os.urandom(20),
+        }
+        atp = lt.add_torrent_params()
+        atp.ti = lt.torrent_info({b"info": info})
+        atp.save_path = save_path
+        atp.flags = lt.torrent_flags.paused
+        rows.append((str(atp.ti.info_hashes().get_best()), lt.write_resume_data_buf(atp)))
+    return rows
+
+
+def _make_session() -> lt.session:
+    return lt.session(
+        {
+            "listen_interfaces": "127.0.0.1:0",
+            "enable_dht": False,
+            "enable_lsd": False,
+            "enable_upnp": False,
+            "enable_natpmp": False,
+            "alert_mask": lt.alert.category_t.status_notification,
+            # As in the daemon's session
+            "alert_queue_size": ALERT_QUEUE_SIZE,
+        }
+    )
+
+
+async def _restore(path: str, count: int) -> dict:
+    ses = _make_session()
+    started = time.perf_counter()
+
+    async with aiosqlite.connect(path) as connection:
+        rows = await ResumeDataTable.load_all(connection)
+    loaded = time.perf_counter()
+
+    params = [lt.read_resume_data(data) for _, data in rows]
+    parsed = time.perf_counter()
+
+    for atp in params:
+        ses.async_add_torrent(atp)
+
+    added = 0
+    while added < count:
+        ses.wait_for_alert(1000)
+        added += sum(isinstance(alert, lt.add_torrent_alert) for alert in ses.pop_alerts())
+    finished = time.perf_counter()
+
+    return {
+        "torrents": count,
+        "load_s": loaded - started,
+        "parse_s": parsed - loaded,
+        "add_s": finished - parsed,
+        "total_s": finished - started,
+    }
+
+
+async def _run(sizes) -> list[dict]:
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            path = os.path.join(directory, f"restore-{size}.db")
+            async with aiosqlite.connect(path) as connection:
+                await connection.execute("PRAGMA journal_mode=WAL")
+                await ResumeDataTable.create(connection)
+                await ResumeDataTable.write(
+                    connection, _make_resume_data(size, directory), removed=()
+                )
+            results.append(await _restore(path, size))
+    return results
+
+
+def run(sizes=SIZES) -> list[dict]:
+    return anyio.run(_run, sizes)
+
+
+def main() -> None:
+    print(f"{'torrents':>10} {'load s':>8} {'parse s':>8} {'add s':>8} {'total s':>8}")
+    for row in run():
+        print(
+            f"{row['torrents']:>10} {row['load_s']:>8.3f} {row['parse_s']:>8.3f} "
+            f"{row['add_s']:>8.3f} {row['total_s']:>8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
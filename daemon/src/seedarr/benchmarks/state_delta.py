@@ -0,0 +1,115 @@
+"""
+Compare msgpack size and encode time of full `libtorrent:state_update`
+broadcasts against `libtorrent:state_delta` ones for sessions where every
+torrent reports a status change each tick but only its rates move.
+
+Run with `python -m seedarr.benchmarks.state_delta`.
+"""
+
+import os
+import random
+import time
+
+import msgpack
+
+from seedarr.managers import StateDeltaManager
+
+SIZES = (1_000, 10_000, 50_000)
+TICKS = 10
+
+
+def _make_statuses(count: int) -> list[dict]:
+    return [
+        {
+            "info_hash": os.urandom(20).hex(),
+            "name": f"Some.Linux.Distribution.{i}.x86_64.iso",
+            "progress": round(random.random() * 100, 2),
+            "download_rate": random.randrange(1 << 22),
+            "upload_rate": random.randrange(1 << 20),
+            "num_peers": random.randrange(200),
+            "num_seeds": random.randrange(50),
+            "total_size": random.randrange(1 << 34),
+            "state": "downloading",
+        }
+        for i in range(count)
+    ]
+
+
+def _tick(statuses: list[dict]) -> list[dict]:
+    return [
+        {
+            **status,
+            "download_rate": random.randrange(1 << 22),
+            "upload_rate": random.randrange(1 << 20),
+        }
+        for status in statuses
+    ]
+
+
+def run(sizes=SIZES, ticks: int = TICKS) -> list[dict]:
+    results = []
+
+    for size in sizes:
+        manager = StateDeltaManager()
+        statuses = _make_statuses(size)
+        manager.reset(statuses)
+
+        full_bytes = delta_bytes = 0
+        full_time = diff_time = delta_time = 0.0
+
+        for _ in range(ticks):
+            statuses = _tick(statuses)
+
+            started = time.perf_counter()
+            full_bytes += len(
+                msgpack.packb({"type": "libtorrent:state_update", "statuses": statuses})
+            )
+            full_time += time.perf_counter() - started
+
+            started = time.perf_counter()
+            added, changes = manager.diff(statuses)
+            diff_time += time.perf_counter() - started
+
+            started = time.perf_counter()
+            delta_bytes += len(
+                msgpack.packb(
+                    {
+                        "type": "libtorrent:state_delta",
+                        "seq": manager.seq,
+                        "added": added,
+                        "changes": changes,
+                    }
+                )
+            )
+            delta_time += time.perf_counter() - started
+
+        manager.clear()
+        results.append(
+            {
+                "torrents": size,
+                "full_kib_per_tick": full_bytes / ticks / 1024,
+                "delta_kib_per_tick": delta_bytes / ticks / 1024,
+                "full_encode_ms": full_time / ticks * 1e3,
+                "delta_encode_ms": delta_time / ticks * 1e3,
+                "delta_diff_ms": diff_time / ticks * 1e3,
+            }
+        )
+
+    return results
+
+
+def main() -> None:
+    print(
+        f"{'torrents':>10} {'full KiB':>10} {'delta KiB':>10} "
+        f"{'full encode ms':>15} {'delta encode ms':>16} {'diff ms':>8}"
+    )
+    for row in run():
+        print(
+            f"{row['torrents']:>10} {row['full_kib_per_tick']:>10.1f} "
+            f"{row['delta_kib_per_tick']:>10.1f} {row['full_encode_ms']:>15.2f} "
+            f"{row['delta_encode_ms']:>16.2f} {row['delta_diff_ms']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
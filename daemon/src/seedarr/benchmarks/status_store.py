@@ -0,0 +1,98 @@
+"""
+Measure memory per torrent held by `StatusStore` and the cost of feeding it
+and of answering `libtorrent:get_all` from it.
+
+Run with `python -m seedarr.benchmarks.status_store`.
+"""
+
+import gc
+import random
+import time
+import tracemalloc
+
+from seedarr.benchmarks import fake_libtorrent
+from seedarr.datastructures import StatusStore
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+class _StubStatus(fake_libtorrent.torrent_status):
+    """
+    A `fake_libtorrent` status, so the fields a row reads stay in step with
+    the fake, whose name is a fresh string on every access like libtorrent's.
+    """
+
+    @property
+    def name(self) -> str:
+        return "".join(self._name)
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+
+
+def stub_statuses(size: int, seed: int = 0) -> list[_StubStatus]:
+    """Statuses of `size` synthetic torrents without peers or files."""
+    rng = random.Random(seed)
+    return [
+        _StubStatus(fake_libtorrent._Torrent(rng, index, peers=0, files=0)) for index in range(size)
+    ]
+
+
+def run(sizes=SIZES) -> list[dict]:
+    results = []
+
+    for size in sizes:
+        statuses = stub_statuses(size)
+
+        gc.collect()
+        tracemalloc.start()
+        store = StatusStore()
+        store.replace(statuses)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        store = StatusStore()
+        started = time.perf_counter()
+        store.replace(statuses)
+        fill = time.perf_counter() - started
+
+        # A typical tick only reports a fraction of the session as changed
+        changed = random.sample(statuses, k=max(1, size // 20))
+        started = time.perf_counter()
+        store.update(changed)
+        update = time.perf_counter() - started
+
+        started = time.perf_counter()
+        [row.to_dict() for row in store]
+        get_all = time.perf_counter() - started
+
+        results.append(
+            {
+                "torrents": size,
+                "bytes_per_torrent": memory / size,
+                "total_mib": memory / (1 << 20),
+                "fill_ms": fill * 1e3,
+                "update_5pct_ms": update * 1e3,
+                "get_all_ms": get_all * 1e3,
+            }
+        )
+
+    return results
+
+
+def main() -> None:
+    print(
+        f"{'torrents':>10} {'bytes/torrent':>14} {'total MiB':>10} "
+        f"{'fill ms':>9} {'update 5% ms':>13} {'get_all ms':>11}"
+    )
+    for row in run():
+        print(
+            f"{row['torrents']:>10} {row['bytes_per_torrent']:>14.0f} "
+            f"{row['total_mib']:>10.1f} {row['fill_ms']:>9.1f} "
+            f"{row['update_5pct_ms']:>13.2f} {row['get_all_ms']:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
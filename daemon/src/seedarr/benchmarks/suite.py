@@ -0,0 +1,85 @@
+"""
+Run benchmarks and collect their results as one JSON document, the output
+of `seedarr bench`.
+
+Each benchmark runs in a fresh interpreter: the singletons start empty and
+`hot_paths` can swap in `fake_libtorrent` while the others use the real
+libtorrent.
+"""
+
+import datetime
+import importlib
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+# Benchmark modules under seedarr.benchmarks; `hot_paths` needs no swarm
+BENCHMARKS = (
+    "hot_paths",
+    "fanout",
+    "handle_index",
+    "status_store",
+    "state_delta",
+    "rate_history",
+    "restore",
+)
+
+
+def _child() -> None:
+    """Entry point of the benchmark interpreter: run(**kwargs) into a file."""
+    name, kwargs, output = sys.argv[1:4]
+    module = importlib.import_module(f"seedarr.benchmarks.{name}")
+    results = module.run(**json.loads(kwargs))
+    with open(output, "w") as file:
+        json.dump(results, file)
+
+
+def run_benchmark(name: str, **kwargs) -> list[dict]:
+    """Run benchmark `name` in a new interpreter and return its rows."""
+    if name not in BENCHMARKS:
+        raise ValueError(f"Unknown benchmark '{name}'")
+
+    with tempfile.NamedTemporaryFile(suffix=".json") as output:
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "from seedarr.benchmarks.suite import _child; _child()",
+                name,
+                json.dumps(kwargs),
+                output.name,
+            ],
+            check=True,
+            # Keep stdout for the JSON document
+            stdout=sys.stderr,
+        )
+        return json.load(output)
+
+
+def run_suite(names=BENCHMARKS, options: dict[str, dict] | None = None) -> dict:
+    """
+    Run every benchmark in `names`, passing `options[name]` as keyword
+    arguments. A failing benchmark is reported under "error" and does not
+    stop the others.
+    """
+    options = options or {}
+    document = {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": {},
+    }
+
+    for name in names:
+        started = time.perf_counter()
+        try:
+            entry = {"results": run_benchmark(name, **options.get(name, {}))}
+        except subprocess.CalledProcessError as e:
+            entry = {"error": f"exited with status {e.returncode}"}
+        entry["seconds"] = time.perf_counter() - started
+        document["benchmarks"][name] = entry
+
+    return document
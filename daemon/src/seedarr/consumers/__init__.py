@@ -1,4 +1,14 @@
 from .broadcast import (
     alert_consumer as alert_consumer,
+    post_status_updates as post_status_updates,
     shared_poll_and_publish as shared_poll_and_publish,
 )
+from .resume_data import (
+    RESUME_DATA_CONSUMER as RESUME_DATA_CONSUMER,
+    persist_resume_data as persist_resume_data,
+)
+from .subscriptions import (
+    TOPICS as TOPICS,
+    publish_subscriptions as publish_subscriptions,
+    serialize_subscription as serialize_subscription,
+)
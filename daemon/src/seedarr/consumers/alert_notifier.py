@@ -0,0 +1,70 @@
+import asyncio
+import threading
+
+import anyio
+import libtorrent as lt
+
+# How long the notifier thread blocks in wait_for_alert before checking
+# whether it was stopped, in milliseconds
+WAIT_TIMEOUT_MS = 500
+
+
+class AlertNotifier:
+    """
+    Blocks in `session.wait_for_alert()` on a dedicated thread and wakes the
+    event loop when alerts are queued.
+
+    Alerts are only popped on the event loop. After waking it the thread
+    waits for `drained()` before blocking again, because `wait_for_alert`
+    returns straight away while alerts are still pending.
+    """
+
+    def __init__(self, session: lt.session) -> None:
+        self._session = session
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+        self._drained = threading.Event()
+        self._drained.set()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="seedarr-alert-notifier", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._drained.set()
+
+    async def wait(self, timeout: float | None = None) -> bool:
+        """
+        Wait until libtorrent has alerts to pop, at most `timeout` seconds.
+        Returns whether it has; the caller must then pop and call `drained()`.
+        """
+        with anyio.move_on_after(timeout):
+            await self._ready.wait()
+        # Checked rather than inferred from the timeout, so a wakeup that
+        # raced it is not lost
+        if not self._ready.is_set():
+            return False
+        self._ready.clear()
+        return True
+
+    def drained(self) -> None:
+        """Tell the thread the pending alerts were popped."""
+        self._drained.set()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._drained.wait()
+            if self._stopped.is_set():
+                break
+            if self._session.wait_for_alert(WAIT_TIMEOUT_MS) is None:
+                continue
+            self._drained.clear()
+            try:
+                self._loop.call_soon_threadsafe(self._ready.set)
+            except RuntimeError:
+                # The event loop was closed under us
+                break
@@ -0,0 +1,49 @@
+from typing import Iterator, List
+
+STATE_UPDATE = "libtorrent:state_update"
+
+
+def coalesce_alerts(alerts: List[dict]) -> List[dict]:
+    """
+    Collapse repeated per-torrent alerts of one batch to the latest value.
+
+    State updates are merged into a single state_update holding the latest
+    status of each torrent. Other alerts carrying an info_hash keep only
+    their last occurrence per (type, info_hash). Everything keeps the
+    position of its last occurrence, so the relative order of, say, a pause
+    and a later resume is preserved.
+    """
+    seen = set()
+    merged_statuses: List[dict] | None = None
+    seen_statuses = set()
+    coalesced = []
+
+    for data in reversed(alerts):
+        if data["type"] == STATE_UPDATE and "error" not in data:
+            if merged_statuses is None:
+                merged_statuses = []
+                coalesced.append({"type": STATE_UPDATE, "statuses": merged_statuses})
+            for status in reversed(data["statuses"]):
+                if status["info_hash"] not in seen_statuses:
+                    seen_statuses.add(status["info_hash"])
+                    merged_statuses.append(status)
+            continue
+
+        info_hash = data.get("info_hash")
+        if info_hash is not None:
+            key = (data["type"], info_hash)
+            if key in seen:
+                continue
+            seen.add(key)
+
+        coalesced.append(data)
+
+    if merged_statuses is not None:
+        merged_statuses.reverse()
+    coalesced.reverse()
+    return coalesced
+
+
+def chunked(alerts: List[dict], size: int) -> Iterator[List[dict]]:
+    for start in range(0, len(alerts), size):
+        yield alerts[start : start + size]
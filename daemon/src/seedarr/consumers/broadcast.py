@@ -1,19 +1,58 @@
+import operator
+import time
+
 import anyio
 import libtorrent as lt
 
-from seedarr.datastructures import EventDataclass
-from seedarr.enums import SyntheticEvent
-from seedarr.managers import BroadcastClientManager
+from seedarr.datastructures import BatchEventDataclass, EventDataclass
+from seedarr.enums import EventTopic, OverflowPolicy, SyntheticEvent
+from seedarr.envs import ALERT_BATCH_SIZE, ALERT_FLUSH_INTERVAL, STATUS_UPDATE_INTERVAL
+from seedarr.managers import (
+    BROADCAST_ROOM,
+    DELTA_BROADCAST_ROOM,
+    AlertWaiterManager,
+    BroadcastClientManager,
+    LatencyManager,
+    ResumeDataManager,
+    SessionStatsManager,
+    StateDeltaManager,
+)
 from seedarr.singletons import SIO, EventBus, LibtorrentSession, Logger
 
+from .alert_notifier import AlertNotifier
+from .batching import chunked, coalesce_alerts
+from .resume_data import encode_resume_data
+
 event_bus = EventBus.get_bus()
 logger = Logger.get_logger()
 broadcast_client_manager = BroadcastClientManager()
+state_delta_manager = StateDeltaManager()
+resume_data_manager = ResumeDataManager()
+alert_waiter_manager = AlertWaiterManager()
+session_stats_manager = SessionStatsManager()
+latency_manager = LatencyManager()
 sio = SIO.get_instance()
 
+# Bus key under which popped alert batches coalesce while queued
+ALERTS_KEY = "libtorrent:alerts"
+
+
+def _alert_info_hash(alert) -> str | None:
+    try:
+        return str(alert.handle.info_hash())
+    except Exception:
+        return None
+
 
 async def serialize_alert(alert) -> dict:
-    if isinstance(alert, EventDataclass):
+    if isinstance(alert, BatchEventDataclass):
+        return {
+            "type": "synthetic:batch",
+            "event": alert.type,
+            "info_hashes": alert.info_hashes,
+        }
+
+    elif isinstance(alert, EventDataclass):
         if alert.event == SyntheticEvent.RESUMED:
             return {
                 "type": "synthetic:resumed",
@@ -39,20 +78,25 @@ async def serialize_alert(alert) -> dict:
             }
 
     elif isinstance(alert, lt.torrent_finished_alert):
-        return {"type": "libtorrent:torrent_finished", "message": str(alert)}
+        return {
+            "type": "libtorrent:torrent_finished",
+            "message": str(alert),
+            "info_hash": _alert_info_hash(alert),
+        }
 
     elif isinstance(alert, lt.add_torrent_alert):
-        info_hash = None
-        if hasattr(alert.handle, "info_hash"):
-            info_hash = str(alert.handle.info_hash())
         return {
             "type": "libtorrent:add_torrent",
             "message": str(alert),
-            "info_hash": info_hash,
+            "info_hash": _alert_info_hash(alert),
         }
 
     elif isinstance(alert, lt.peer_connect_alert):
-        return {"type": "libtorrent:peer_connected", "message": str(alert.ip)}
+        return {
+            "type": "libtorrent:peer_connected",
+            "message": str(alert.ip),
+            "info_hash": _alert_info_hash(alert),
+        }
 
     elif isinstance(alert, lt.state_update_alert):
         lt_state_map = {
@@ -69,9 +113,7 @@ async def serialize_alert(alert) -> dict:
         statuses = []
 
         try:
-            state_list = (
-                alert.status
-            )  # May raise AttributeError or Boost.Python.ArgumentError
+            state_list = alert.status  # May raise AttributeError or Boost.Python.ArgumentError
         except Exception as e:
             logger.error(f"Could not access state_update_alert.status: {e}")
             return {
@@ -101,37 +143,174 @@ async def serialize_alert(alert) -> dict:
         return {}
 
 
+def _merge_alerts(waiting: list[dict], alerts: list[dict]) -> list[dict]:
+    return coalesce_alerts(waiting + alerts)
+
+
+async def _handle_alerts(bus: EventBus, alerts: list) -> list[dict]:
+    """
+    Update every alert-fed cache and waiter from one pop, publish its resume
+    data, and return the alerts serialized for broadcast clients, if any.
+    """
+    await LibtorrentSession.track_alerts(alerts)
+    alert_waiter_manager.collect(alerts)
+    for alert in alerts:
+        if isinstance(alert, lt.session_stats_alert):
+            session_stats_manager.update(alert)
+
+    resume_data = await encode_resume_data(resume_data_manager.collect(alerts))
+    if resume_data:
+        await bus.publish(
+            resume_data,
+            topic=EventTopic.RESUME_DATA,
+            policy=OverflowPolicy.COALESCE,
+            key=EventTopic.RESUME_DATA,
+            merge=operator.add,
+        )
+
+    if broadcast_client_manager.count() == 0 or not alerts:
+        return []
+    return [await serialize_alert(alert) for alert in alerts]
+
+
 async def shared_poll_and_publish(bus: EventBus):
+    """
+    Pop alerts as soon as libtorrent queues them, and publish the pops of
+    each `ALERT_FLUSH_INTERVAL` window as one bus event. Alerts are
+    serialized as they are popped because libtorrent frees them on the next
+    `pop_alerts()`, which may come before the bus consumer runs.
+
+    A failing pop is logged and skipped, so one bad alert cannot stop
+    broadcasts, resume data persistence or pending waiters for good.
+    """
     lt_ses = await LibtorrentSession.get_session()
-    while True:
-        if broadcast_client_manager.count() == 0:
-            await anyio.sleep(1)
-            continue
+    notifier = AlertNotifier(lt_ses)
+    notifier.start()
+
+    # Serialized alerts waiting for the window that started at their first pop
+    pending: list[dict] = []
+    flush_at = 0.0
+
+    try:
+        while True:
+            timeout = max(flush_at - time.monotonic(), 0) if pending else None
+            if await notifier.wait(timeout):
+                serialized: list[dict] = []
+                try:
+                    serialized = await _handle_alerts(bus, lt_ses.pop_alerts())
+                except Exception:
+                    logger.exception("Failed to handle popped alerts")
+                finally:
+                    notifier.drained()
+                if serialized:
+                    if not pending:
+                        flush_at = time.monotonic() + ALERT_FLUSH_INTERVAL
+                    pending.extend(serialized)
 
+            if pending and time.monotonic() >= flush_at:
+                try:
+                    # A lagging consumer gets one merged batch instead of a backlog
+                    await bus.publish(
+                        pending,
+                        topic=EventTopic.ALERTS,
+                        policy=OverflowPolicy.COALESCE,
+                        key=ALERTS_KEY,
+                        merge=_merge_alerts,
+                    )
+                except Exception:
+                    logger.exception("Failed to publish alerts")
+                pending = []
+    finally:
+        notifier.stop()
+
+
+async def post_status_updates():
+    """
+    Ask libtorrent for a state_update every `STATUS_UPDATE_INTERVAL` while
+    clients are streaming alerts, and stay idle otherwise.
+    """
+    lt_ses = await LibtorrentSession.get_session()
+    while True:
+        await broadcast_client_manager.wait_for_clients()
         lt_ses.post_torrent_updates()
+        await anyio.sleep(STATUS_UPDATE_INTERVAL)
 
-        alerts = lt_ses.pop_alerts()
-        for alert in alerts:
-            await bus.publish(alert)
 
-        await anyio.sleep(0.25)
+def serialize_delta(data: dict) -> dict | None:
+    """
+    Reduce a state_update to the fields that changed since the last one sent
+    to delta clients, or None when nothing changed.
+    """
+    if data["type"] == "synthetic:removed":
+        state_delta_manager.forget(data["info_hash"])
+        return data
 
+    if data["type"] == "synthetic:batch":
+        if data["event"] == "synthetic:removed":
+            for info_hash in data["info_hashes"]:
+                state_delta_manager.forget(info_hash)
+        return data
 
-async def alert_consumer(alert):
-    data = await serialize_alert(alert)
-    if not data:
+    if data["type"] != "libtorrent:state_update" or "error" in data:
+        return data
+
+    added, changes = state_delta_manager.diff(data["statuses"])
+    if not added and not changes:
+        return None
+
+    return {
+        "type": "libtorrent:state_delta",
+        "seq": state_delta_manager.seq,
+        "added": added,
+        "changes": changes,
+    }
+
+
+def _frames(alerts: list[dict]):
+    for chunk in chunked(alerts, ALERT_BATCH_SIZE):
+        yield chunk[0] if len(chunk) == 1 else {"type": "batch", "alerts": chunk}
+
+
+async def alert_consumer(alerts):
+    """
+    Take a pop's worth of serialized alerts (or a single synthetic event),
+    coalesce them and emit them as few frames as `ALERT_BATCH_SIZE` allows.
+    """
+    if broadcast_client_manager.count() == 0:
         return
 
-    clients = broadcast_client_manager.get_clients()
-    if not clients:
+    if not isinstance(alerts, list):
+        alerts = [alerts]
+
+    serialized = [
+        data
+        for data in [
+            alert if isinstance(alert, dict) else await serialize_alert(alert) for alert in alerts
+        ]
+        if data
+    ]
+    if not serialized:
         return
 
-    for sid in clients:
+    batch = coalesce_alerts(serialized)
+
+    # Emitting to a room without a callback encodes the packet once and
+    # reuses it for every member
+    outgoing = []
+    if broadcast_client_manager.count_full():
+        outgoing.extend((BROADCAST_ROOM, frame) for frame in _frames(batch))
+    if broadcast_client_manager.count_delta():
+        deltas = [delta for delta in map(serialize_delta, batch) if delta is not None]
+        outgoing.extend((DELTA_BROADCAST_ROOM, frame) for frame in _frames(deltas))
+
+    for room, payload in outgoing:
+        started = time.perf_counter()
         try:
-            logger.info(
-                f"Broadcasting alert to {broadcast_client_manager.count()} clients"
+            await sio.emit("libtorrent:broadcast", payload, room=room)
+            latency_manager.observe_emit(
+                "delta" if room == DELTA_BROADCAST_ROOM else "broadcast",
+                time.perf_counter() - started,
             )
-            await sio.emit("libtorrent:broadcast", data, room=sid)
         except TypeError as e:
-            logger.error(f"JSON serialization failed for alert data: {data}")
+            logger.error(f"JSON serialization failed for alert data: {payload}")
             logger.error(f"Serialization error: {e}")
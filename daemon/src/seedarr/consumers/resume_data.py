@@ -0,0 +1,49 @@
+import libtorrent as lt
+
+from seedarr.orm import ResumeDataTable
+from seedarr.singletons import Database, LibtorrentExecutor, Logger
+
+logger = Logger.get_logger()
+
+# Name of the EventBus consumer that stores resume data
+RESUME_DATA_CONSUMER = "resume_data"
+
+
+def _write_resume_data(params: list[lt.add_torrent_params]) -> list[bytes]:
+    return [bytes(lt.write_resume_data_buf(atp)) for atp in params]
+
+
+async def encode_resume_data(events: list[dict]) -> list[dict]:
+    """
+    Bencode the `params` of a pop's resume_data:save events into their
+    `data` in one libtorrent worker hop. The params belong to the popped
+    alerts, so this must finish before the next `pop_alerts()`.
+    """
+    saved = [event for event in events if event["type"] == "resume_data:save"]
+    if saved:
+        encoded = await LibtorrentExecutor.run(
+            "write_resume_data", _write_resume_data, [event.pop("params") for event in saved]
+        )
+        for event, data in zip(saved, encoded):
+            event["data"] = data
+    return events
+
+
+async def persist_resume_data(events: list[dict]):
+    """
+    Store a batch of resume_data:save / resume_data:remove events in one
+    transaction. Only the latest event per torrent is written.
+    """
+    latest = {event["info_hash"]: event for event in events}
+    saved = [
+        (info_hash, event["data"])
+        for info_hash, event in latest.items()
+        if event["type"] == "resume_data:save"
+    ]
+    removed = [
+        info_hash for info_hash, event in latest.items() if event["type"] == "resume_data:remove"
+    ]
+
+    connection = await Database.get_connection()
+    await ResumeDataTable.write(connection, saved, removed)
+    logger.debug(f"Stored resume data of {len(saved)} torrents, removed {len(removed)}")
@@ -0,0 +1,72 @@
+import time
+
+import anyio
+
+from seedarr.envs import SUBSCRIPTION_INTERVAL
+from seedarr.managers import BroadcastClientManager, LatencyManager, subscription_room
+from seedarr.serializers import (
+    serialize_file_info,
+    serialize_magnet_torrent_info,
+    serialize_peer_info,
+    serialize_tracker_info,
+)
+from seedarr.singletons import SIO, LibtorrentSession, Logger
+
+logger = Logger.get_logger()
+broadcast_client_manager = BroadcastClientManager()
+latency_manager = LatencyManager()
+sio = SIO.get_instance()
+
+TOPICS = {
+    "general": serialize_magnet_torrent_info,
+    "peers": serialize_peer_info,
+    "files": serialize_file_info,
+    "trackers": serialize_tracker_info,
+}
+
+
+async def serialize_subscription(info_hash: str, topic: str) -> dict:
+    handle = await LibtorrentSession.find_handle(info_hash)
+    if handle is None:
+        return {
+            "type": "libtorrent:subscription",
+            "info_hash": info_hash,
+            "topic": topic,
+            "error": "torrent_not_found",
+        }
+
+    try:
+        data = await TOPICS[topic](handle)
+    except Exception as e:
+        logger.error(f"Failed to serialize {topic} for {info_hash}: {e}")
+        data = None
+
+    return {
+        "type": "libtorrent:subscription",
+        "info_hash": info_hash,
+        "topic": topic,
+        "data": data,
+    }
+
+
+async def publish_subscriptions():
+    """
+    Push every subscribed (info_hash, topic) once per interval, serializing
+    each one a single time no matter how many clients follow it.
+    """
+    while True:
+        subscriptions = broadcast_client_manager.get_subscriptions()
+
+        for info_hash, topic in subscriptions:
+            # One failing subscription must not stop the others or the loop
+            try:
+                payload = await serialize_subscription(info_hash, topic)
+                started = time.perf_counter()
+                await sio.emit(
+                    "libtorrent:broadcast", payload, room=subscription_room(info_hash, topic)
+                )
+                latency_manager.observe_emit("subscription", time.perf_counter() - started)
+            except Exception as e:
+                logger.error(f"Failed to publish {topic} of {info_hash}: {e}")
+
+        await anyio.sleep(SUBSCRIPTION_INTERVAL)
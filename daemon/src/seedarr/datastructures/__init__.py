@@ -1,4 +1,33 @@
 from .dataclass import (
+    BatchEventDataclass as BatchEventDataclass,
     EventDataclass as EventDataclass,
     TorrentDataclass as TorrentDataclass,
 )
+from .file_table import FileTable as FileTable, FileTableCache as FileTableCache
+from .handle_index import (
+    HandleIndex as HandleIndex,
+    info_hash_keys as info_hash_keys,
+    is_info_hash as is_info_hash,
+)
+from .latency_histogram import LatencyHistogram as LatencyHistogram
+from .metadata_cache import (
+    MetadataCache as MetadataCache,
+    torrent_file_from_info as torrent_file_from_info,
+)
+from .rate_history import (
+    RATE_HISTORY_TIERS as RATE_HISTORY_TIERS,
+    RateHistory as RateHistory,
+)
+from .status_store import (
+    CATEGORIES as CATEGORIES,
+    DEFAULT_FIELDS as DEFAULT_FIELDS,
+    ROW_FIELDS as ROW_FIELDS,
+    SORT_KEYS as SORT_KEYS,
+    STATE_UPDATE_FIELDS as STATE_UPDATE_FIELDS,
+    StatusStore as StatusStore,
+    TorrentStatusRow as TorrentStatusRow,
+)
+from .torrent_metadata import (
+    MISSING_METADATA as MISSING_METADATA,
+    TorrentMetadata as TorrentMetadata,
+)
@@ -1,2 +1,5 @@
-from .events import EventDataclass as EventDataclass
+from .events import (
+    BatchEventDataclass as BatchEventDataclass,
+    EventDataclass as EventDataclass,
+)
 from .torrent import TorrentDataclass as TorrentDataclass
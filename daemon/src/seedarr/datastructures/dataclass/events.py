@@ -9,3 +9,19 @@ from seedarr.enums import SyntheticEvent
 class EventDataclass:
     torrent: lt.torrent_handle
     event: SyntheticEvent
+
+    @property
+    def type(self) -> str:
+        return f"synthetic:{self.event.name.lower()}"
+
+
+@dataclass
+class BatchEventDataclass:
+    """One synthetic event standing for the same change to many torrents."""
+
+    info_hashes: list[str]
+    event: SyntheticEvent
+
+    @property
+    def type(self) -> str:
+        return f"synthetic:{self.event.name.lower()}"
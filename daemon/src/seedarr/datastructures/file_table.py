@@ -0,0 +1,109 @@
+import os
+from array import array
+from collections import OrderedDict
+from itertools import count
+from operator import sub
+from typing import Sequence
+
+import libtorrent as lt
+
+
+class FileTable:
+    """
+    The columns of a torrent's file list that never change once metadata
+    exists: path, name, size and offset, in file index order.
+    """
+
+    __slots__ = ("paths", "names", "sizes", "offsets")
+
+    def __init__(self, files: lt.file_storage) -> None:
+        indices = range(files.num_files())
+        self.paths = [str(files.file_path(index)) for index in indices]
+        self.names = [os.path.basename(path) for path in self.paths]
+        self.sizes = array("q", map(files.file_size, indices))
+        self.offsets = array("q", map(files.file_offset, indices))
+
+    def rows(self, progress: Sequence[int], priorities: Sequence[int]) -> list[dict]:
+        """Combine the static columns with per-request progress and priorities."""
+        return [
+            {
+                "index": index,
+                "path": path,
+                "name": name,
+                "size": size,
+                "offset": offset,
+                "progress": done,
+                "remaining": remaining,
+                "priority": priority,
+            }
+            for index, path, name, size, offset, done, remaining, priority in zip(
+                count(),
+                self.paths,
+                self.names,
+                self.sizes,
+                self.offsets,
+                progress,
+                map(sub, self.sizes, progress),
+                priorities,
+            )
+        ]
+
+    def columns(self, progress: Sequence[int], priorities: Sequence[int]) -> dict:
+        """The same data as `rows`, one sequence per field."""
+        return {
+            "index": range(len(self.paths)),
+            "path": self.paths,
+            "name": self.names,
+            "size": self.sizes,
+            "offset": self.offsets,
+            "progress": progress,
+            "remaining": list(map(sub, self.sizes, progress)),
+            "priority": priorities,
+        }
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __repr__(self):
+        return f"<FileTable files={len(self)}>"
+
+
+class FileTableCache:
+    """`FileTable`s by info-hash, dropping the least recently used past `size`."""
+
+    __slots__ = ("_tables", "size")
+
+    def __init__(self, size: int) -> None:
+        self._tables: OrderedDict[str, FileTable] = OrderedDict()
+        self.size = size
+
+    def get(self, info_hash: str) -> FileTable | None:
+        table = self._tables.get(info_hash)
+        if table is not None:
+            self._tables.move_to_end(info_hash)
+        return table
+
+    def peek(self, info_hash: str) -> FileTable | None:
+        """Like `get`, without marking the table as recently used."""
+        return self._tables.get(info_hash)
+
+    def put(self, info_hash: str, table: FileTable) -> None:
+        self._tables[info_hash] = table
+        self._tables.move_to_end(info_hash)
+        while len(self._tables) > self.size:
+            self._tables.popitem(last=False)
+
+    def discard(self, info_hash: str) -> None:
+        self._tables.pop(info_hash, None)
+
+    def clear(self) -> None:
+        self._tables.clear()
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def __contains__(self, info_hash: str) -> bool:
+        return info_hash in self._tables
+
+    def __repr__(self):
+        return f"<FileTableCache tables={len(self)}/{self.size}>"
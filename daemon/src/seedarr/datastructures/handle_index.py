@@ -0,0 +1,64 @@
+import string
+from typing import Dict, List
+
+import libtorrent as lt
+
+
+def info_hash_keys(info_hashes: lt.info_hash_t) -> List[str]:
+    """
+    Return every hex string a client may use to refer to a torrent.
+
+    Hybrid torrents are reachable through both their v1 and v2 hash. Any
+    torrent with a v2 hash is also reachable through the truncated v2 hash,
+    which is what the deprecated `torrent_handle.info_hash()` reports for it.
+    """
+    keys = []
+    if info_hashes.has_v1():
+        keys.append(str(info_hashes.v1))
+    if info_hashes.has_v2():
+        v2 = str(info_hashes.v2)
+        keys.append(v2)
+        keys.append(v2[:40])
+    return keys
+
+
+def is_info_hash(value: str) -> bool:
+    """Whether `value` is a hex v1 (40 digits) or v2 (64 digits) info-hash."""
+    return len(value) in (40, 64) and all(char in string.hexdigits for char in value)
+
+
+class HandleIndex:
+    """
+    Maps lowercase hex info-hashes (v1 and v2) to their torrent handle.
+    """
+
+    __slots__ = ("_handles",)
+
+    def __init__(self) -> None:
+        self._handles: Dict[str, lt.torrent_handle] = {}
+
+    def add(self, handle: lt.torrent_handle) -> None:
+        for key in info_hash_keys(handle.info_hashes()):
+            self._handles[key] = handle
+
+    def remove(self, info_hashes: lt.info_hash_t) -> None:
+        for key in info_hash_keys(info_hashes):
+            self._handles.pop(key, None)
+
+    def discard(self, info_hash: str) -> None:
+        self._handles.pop(info_hash.lower(), None)
+
+    def get(self, info_hash: str) -> lt.torrent_handle | None:
+        return self._handles.get(info_hash.lower())
+
+    def clear(self) -> None:
+        self._handles.clear()
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def __contains__(self, info_hash: str) -> bool:
+        return info_hash.lower() in self._handles
+
+    def __repr__(self):
+        return f"<HandleIndex keys={len(self)}>"
@@ -0,0 +1,87 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterable, List
+
+# Upper bounds in seconds, from half a millisecond to ten seconds
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket histogram of durations in seconds, in the shape Prometheus
+    expects: `counts[i]` holds observations <= `buckets[i]` (not cumulative)
+    and the last count those above every bound.
+    """
+
+    __slots__ = ("buckets", "counts", "count", "total", "max")
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = array("Q", [0]) * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def cumulative(self) -> List[int]:
+        result = []
+        running = 0
+        for count in self.counts:
+            running += count
+            result.append(running)
+        return result
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the `q` quantile (max if above all)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        for bound, seen in zip(self.buckets, self.cumulative()):
+            if seen >= rank:
+                return bound
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum_ms": self.total * 1e3,
+            "mean_ms": self.total / self.count * 1e3 if self.count else 0.0,
+            "max_ms": self.max * 1e3,
+            "p50_ms": self.quantile(0.5) * 1e3,
+            "p99_ms": self.quantile(0.99) * 1e3,
+            "buckets": dict(zip([*map(str, self.buckets), "+Inf"], self.cumulative())),
+        }
+
+    def render(self, name: str, labels: str) -> str:
+        """Prometheus text samples (no TYPE line) with `labels` like 'a="b",'."""
+        lines = [
+            f'{name}_bucket{{{labels}le="{bound}"}} {seen}'
+            for bound, seen in zip([*map(str, self.buckets), "+Inf"], self.cumulative())
+        ]
+        lines.append(f"{name}_sum{{{labels.rstrip(',')}}} {self.total}")
+        lines.append(f"{name}_count{{{labels.rstrip(',')}}} {self.count}")
+        return "\n".join(lines) + "\n"
+
+    def __repr__(self):
+        return f"<LatencyHistogram count={self.count} max={self.max:.4f}s>"
@@ -0,0 +1,69 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
+
+
+def torrent_file_from_info(info_section: bytes) -> bytes:
+    """A minimal .torrent file around a bencoded info dict, for `lt.torrent_info`."""
+    return b"d4:info" + info_section + b"e"
+
+
+class MetadataCache:
+    """
+    Bencoded info dicts by info-hash, reachable through every hex info-hash
+    of the torrent. Entries expire `ttl` seconds after they are stored and the
+    least recently used are dropped past `size`.
+    """
+
+    __slots__ = ("_entries", "_aliases", "size", "ttl")
+
+    def __init__(self, size: int, ttl: float) -> None:
+        # Primary key -> (info dict, expiry, every key of the torrent)
+        self._entries: OrderedDict[str, Tuple[bytes, float, List[str]]] = OrderedDict()
+        self._aliases: Dict[str, str] = {}
+        self.size = size
+        self.ttl = ttl
+
+    def get(self, keys: Iterable[str]) -> bytes | None:
+        """The info dict of the first of `keys` that has a live entry."""
+        for key in keys:
+            primary = self._aliases.get(key.lower())
+            if primary is None:
+                continue
+            info_section, expires, _ = self._entries[primary]
+            if expires <= time.monotonic():
+                self._drop(primary)
+                continue
+            self._entries.move_to_end(primary)
+            return info_section
+        return None
+
+    def put(self, keys: List[str], info_section: bytes) -> None:
+        """Store `info_section` under the first of `keys`, aliased by the rest."""
+        if not keys or self.size <= 0:
+            return
+        primary = keys[0]
+        for key in keys:
+            existing = self._aliases.get(key)
+            if existing is not None:
+                self._drop(existing)
+        self._entries[primary] = (info_section, time.monotonic() + self.ttl, keys)
+        for key in keys:
+            self._aliases[key] = primary
+        while len(self._entries) > self.size:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, primary: str) -> None:
+        _, _, keys = self._entries.pop(primary)
+        for key in keys:
+            self._aliases.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._aliases.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"<MetadataCache entries={len(self)}/{self.size}>"
@@ -0,0 +1,225 @@
+import math
+from array import array
+from operator import add, attrgetter
+from typing import Dict, List
+
+from .status_store import StatusStore, TorrentStatusRow
+
+# (name, seconds per sample, samples kept): a minute of seconds, an hour of
+# minutes and a day of hours
+RATE_HISTORY_TIERS = (("1s", 1, 60), ("1m", 60, 60), ("1h", 3600, 24))
+
+# Sampled row attributes and their array typecodes
+SERIES = (("download_rate", "I"), ("upload_rate", "I"), ("num_peers", "H"))
+
+# Time constant in seconds of the download-rate EWMA used for the ETA
+ETA_TIME_CONSTANT = 30.0
+
+
+class _EmptyRow:
+    __slots__ = ()
+    info_hash = ""
+    download_rate = upload_rate = num_peers = 0
+
+
+_EMPTY = _EmptyRow()
+
+
+class RateHistory:
+    """
+    Fixed-size ring buffers of download/upload rate and peer count for every
+    torrent, at 1 s, 1 min and 1 h resolution, fed once per second from the
+    status store.
+
+    Each (tier, series) is one flat array laid out sample-major: the values
+    of all torrents for one sample are contiguous, so a tick writes a single
+    slice per series. Coarser tiers are averages of running sums, which
+    keeps every tick equally cheap. Torrents own a slot (column) and freed
+    slots are reused, so memory is `capacity * bytes_per_slot()` however
+    long the daemon runs.
+    """
+
+    __slots__ = (
+        "_capacity",
+        "_slots",
+        "_rows",
+        "_free",
+        "_started",
+        "_ewma",
+        "_arrays",
+        "_sums",
+        "_generation",
+        "tick",
+    )
+
+    def __init__(self) -> None:
+        self._capacity = 0
+        self._slots: Dict[str, int] = {}
+        self._rows: List = []
+        self._free: List[int] = []
+        self._started = array("q")
+        self._ewma = array("f")
+        self._arrays = [[array(typecode) for _, typecode in SERIES] for _ in RATE_HISTORY_TIERS]
+        # Running sums of the finer tier's samples, per coarser tier
+        self._sums = [[array("Q") for _ in SERIES] for _ in RATE_HISTORY_TIERS[1:]]
+        self._generation = -1
+        self.tick = 0
+
+    @staticmethod
+    def bytes_per_slot() -> int:
+        per_sample = sum(array(typecode).itemsize for _, typecode in SERIES)
+        samples = sum(length for _, _, length in RATE_HISTORY_TIERS)
+        sums = (len(RATE_HISTORY_TIERS) - 1) * len(SERIES) * array("Q").itemsize
+        return per_sample * samples + sums + array("q").itemsize + array("f").itemsize
+
+    def nbytes(self) -> int:
+        arrays = [self._started, self._ewma]
+        arrays.extend(values for tier in self._arrays for values in tier)
+        arrays.extend(values for tier in self._sums for values in tier)
+        return sum(len(values) * values.itemsize for values in arrays)
+
+    def _reserve(self, count: int) -> None:
+        """Grow capacity to at least `count` slots, in steps of a quarter."""
+        old = self._capacity
+        if count <= old:
+            return
+        new = max(count, old + old // 4)
+        new = -(-new // 256) * 256
+        extra = new - old
+
+        for (_, _, length), tier in zip(RATE_HISTORY_TIERS, self._arrays):
+            for index, values in enumerate(tier):
+                grown = array(values.typecode, [0]) * (new * length)
+                for position in range(length):
+                    grown[position * new : position * new + old] = values[
+                        position * old : (position + 1) * old
+                    ]
+                tier[index] = grown
+        for tier in self._sums:
+            for values in tier:
+                values.extend(array("Q", [0]) * extra)
+        self._rows.extend([_EMPTY] * extra)
+        self._started.extend(array("q", [0]) * extra)
+        self._ewma.extend(array("f", [0.0]) * extra)
+        self._free = list(range(new - 1, old - 1, -1)) + self._free
+        self._capacity = new
+
+    def _release(self, slot: int) -> None:
+        capacity = self._capacity
+        for (_, _, length), tier in zip(RATE_HISTORY_TIERS, self._arrays):
+            for values in tier:
+                for position in range(length):
+                    values[position * capacity + slot] = 0
+        for tier in self._sums:
+            for values in tier:
+                values[slot] = 0
+        self._ewma[slot] = 0.0
+        self._rows[slot] = _EMPTY
+        self._free.append(slot)
+
+    def _sync(self, store: StatusStore) -> None:
+        """Give new torrents a slot, free removed ones and rebind rows."""
+        for info_hash in [key for key in self._slots if key not in store]:
+            self._release(self._slots.pop(info_hash))
+
+        self._reserve(len(store))
+        for row in store:
+            slot = self._slots.get(row.info_hash)
+            if slot is None:
+                slot = self._free.pop()
+                self._slots[row.info_hash] = slot
+                self._started[slot] = self.tick
+            self._rows[slot] = row
+
+        self._generation = store.generation
+
+    def sample(self, store: StatusStore) -> None:
+        """Record one 1 s sample of every torrent and roll up finished minutes/hours."""
+        if store.generation != self._generation:
+            self._sync(store)
+
+        capacity = self._capacity
+        tick = self.tick
+        rows = self._rows
+
+        for series_index, (attribute, typecode) in enumerate(SERIES):
+            values = array(typecode, map(attrgetter(attribute), rows))
+
+            for tier_index, (_, period, length) in enumerate(RATE_HISTORY_TIERS):
+                if tier_index:
+                    # Average the finer tier's samples of the period ending now
+                    sums = self._sums[tier_index - 1]
+                    finer_period = RATE_HISTORY_TIERS[tier_index - 1][1]
+                    count = period // finer_period
+                    values = array(typecode, [total // count for total in sums[series_index]])
+                    sums[series_index] = array("Q", [0]) * capacity
+
+                position = (tick // period) % length
+                self._arrays[tier_index][series_index][
+                    position * capacity : (position + 1) * capacity
+                ] = values
+
+                if tier_index + 1 < len(RATE_HISTORY_TIERS):
+                    sums = self._sums[tier_index]
+                    sums[series_index] = array("Q", map(add, sums[series_index], values))
+                    if (tick + 1) % RATE_HISTORY_TIERS[tier_index + 1][1]:
+                        break
+
+        alpha = 1 - math.exp(-1 / ETA_TIME_CONSTANT)
+        self._ewma = array(
+            "f",
+            [
+                ewma + alpha * (rate - ewma)
+                for ewma, rate in zip(self._ewma, map(attrgetter("download_rate"), rows))
+            ],
+        )
+        self.tick = tick + 1
+
+    def series(self, info_hash: str, tier: str = "1s") -> Dict[str, List[int]] | None:
+        """
+        The samples of one torrent at `tier`, oldest first, covering only the
+        periods it was tracked for. None for unknown torrents.
+        """
+        slot = self._slots.get(info_hash.lower())
+        if slot is None:
+            return None
+
+        tier_index = [name for name, _, _ in RATE_HISTORY_TIERS].index(tier)
+        _, period, length = RATE_HISTORY_TIERS[tier_index]
+        written = self.tick // period
+        first = (self._started[slot] + period - 1) // period
+        count = max(min(written - first, length), 0)
+
+        result = {}
+        for (attribute, _), values in zip(SERIES, self._arrays[tier_index]):
+            column = values[slot :: self._capacity]
+            result[attribute] = [
+                column[index % length] for index in range(written - count, written)
+            ]
+        return result
+
+    def average_download_rate(self, info_hash: str) -> float | None:
+        slot = self._slots.get(info_hash.lower())
+        return None if slot is None else self._ewma[slot]
+
+    def eta(self, row: TorrentStatusRow) -> float | None:
+        """
+        Seconds until `row` completes at its smoothed download rate, or None
+        when it is not downloading.
+        """
+        remaining = row.total_wanted - row.total_done
+        if remaining <= 0:
+            return 0.0
+        rate = self.average_download_rate(row.info_hash)
+        if not rate or rate < 1:
+            return None
+        return remaining / rate
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __repr__(self):
+        return f"<RateHistory torrents={len(self)} capacity={self._capacity} tick={self.tick}>"
@@ -0,0 +1,285 @@
+import heapq
+import time
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, Iterator, List
+
+import libtorrent as lt
+
+
+class TorrentStatusRow:
+    """
+    The subset of `lt.torrent_status` the read paths serve, kept per torrent.
+    """
+
+    __slots__ = (
+        "info_hash",
+        "name",
+        "state",
+        "paused",
+        "progress",
+        "total_done",
+        "total_wanted",
+        "download_rate",
+        "upload_rate",
+        "num_peers",
+        "num_seeds",
+        "added_time",
+        "completed_time",
+        "is_finished",
+        "is_seeding",
+        "save_path",
+        "total_wanted_done",
+        "all_time_download",
+        "all_time_upload",
+        "total_failed_bytes",
+        "num_connections",
+        "list_peers",
+        "active_time",
+        "seeding_time",
+        "next_announce",
+    )
+
+    info_hash: str
+    name: str
+    state: str
+    paused: bool
+    progress: float
+    total_done: int
+    total_wanted: int
+    download_rate: int
+    upload_rate: int
+    num_peers: int
+    num_seeds: int
+    added_time: int
+    completed_time: int
+    is_finished: bool
+    is_seeding: bool
+    save_path: str
+    total_wanted_done: int
+    all_time_download: int
+    all_time_upload: int
+    total_failed_bytes: int
+    num_connections: int
+    list_peers: int
+    active_time: int
+    seeding_time: int
+    # Seconds until the next tracker announce
+    next_announce: int
+
+    def __init__(self, status: lt.torrent_status) -> None:
+        self.info_hash = str(status.info_hash)
+        self.update(status)
+
+    def update(self, status: lt.torrent_status) -> None:
+        self.name = status.name
+        self.state = status.state.name
+        self.paused = bool(status.flags & lt.torrent_flags.paused)
+        self.progress = status.progress
+        self.total_done = status.total_done
+        self.total_wanted = status.total_wanted
+        self.download_rate = status.download_rate
+        self.upload_rate = status.upload_rate
+        self.num_peers = status.num_peers
+        self.num_seeds = status.num_seeds
+        self.added_time = status.added_time
+        self.completed_time = status.completed_time
+        self.is_finished = status.is_finished
+        self.is_seeding = status.is_seeding
+        self.save_path = status.save_path
+        self.total_wanted_done = status.total_wanted_done
+        self.all_time_download = status.all_time_download
+        self.all_time_upload = status.all_time_upload
+        self.total_failed_bytes = status.total_failed_bytes
+        self.num_connections = status.num_connections
+        self.list_peers = status.list_peers
+        self.active_time = status.active_time
+        self.seeding_time = status.seeding_time
+        self.next_announce = int(status.next_announce.total_seconds())
+
+    def to_dict(self, fields: Iterable[str] | None = None) -> dict:
+        if fields is None:
+            fields = DEFAULT_FIELDS
+        return {field: ROW_FIELDS[field](self) for field in fields}
+
+    def __repr__(self):
+        return f"<TorrentStatusRow {self.info_hash} {self.state}>"
+
+
+# Response field name -> value, as sent to clients
+ROW_FIELDS: Dict[str, Callable[[TorrentStatusRow], object]] = {
+    "name": attrgetter("name"),
+    "info_hash": attrgetter("info_hash"),
+    "progress": lambda row: round(row.progress * 100, 2),
+    "state": attrgetter("state"),
+    "paused": attrgetter("paused"),
+    "finished": attrgetter("is_finished"),
+    "total_download": attrgetter("total_done"),
+    "total_size": attrgetter("total_wanted"),
+    "download_rate": attrgetter("download_rate"),
+    "upload_rate": attrgetter("upload_rate"),
+    "num_peers": attrgetter("num_peers"),
+    "num_seeds": attrgetter("num_seeds"),
+    "seeders": attrgetter("num_seeds"),
+    "added_time": attrgetter("added_time"),
+    "completed_time": attrgetter("completed_time"),
+}
+
+DEFAULT_FIELDS = (
+    "name",
+    "info_hash",
+    "progress",
+    "state",
+    "paused",
+    "total_download",
+    "total_size",
+    "download_rate",
+    "upload_rate",
+    "num_peers",
+    "num_seeds",
+    "seeders",
+)
+
+# Fields carried per torrent by libtorrent:state_update broadcasts
+STATE_UPDATE_FIELDS = (
+    "info_hash",
+    "name",
+    "progress",
+    "download_rate",
+    "upload_rate",
+    "num_peers",
+    "num_seeds",
+    "total_size",
+    "state",
+)
+
+# Response field name -> value rows are ordered by
+SORT_KEYS: Dict[str, Callable[[TorrentStatusRow], object]] = {
+    "name": lambda row: row.name.casefold(),
+    "info_hash": attrgetter("info_hash"),
+    "progress": attrgetter("progress"),
+    "state": attrgetter("state"),
+    "paused": attrgetter("paused"),
+    "finished": attrgetter("is_finished"),
+    "total_download": attrgetter("total_done"),
+    "total_size": attrgetter("total_wanted"),
+    "download_rate": attrgetter("download_rate"),
+    "upload_rate": attrgetter("upload_rate"),
+    "num_peers": attrgetter("num_peers"),
+    "num_seeds": attrgetter("num_seeds"),
+    "seeders": attrgetter("num_seeds"),
+    "added_time": attrgetter("added_time"),
+    "completed_time": attrgetter("completed_time"),
+}
+
+
+def _is_active(row: TorrentStatusRow) -> bool:
+    return row.download_rate > 0 or row.upload_rate > 0
+
+
+# Listing category -> predicate over a status row
+CATEGORIES: Dict[str, Callable[[TorrentStatusRow], bool]] = {
+    "all": lambda row: True,
+    "active": _is_active,
+    "inactive": lambda row: not _is_active(row),
+    "completed": attrgetter("is_finished"),
+    "downloading": lambda row: (
+        not row.paused and row.state in ("downloading", "downloading_metadata")
+    ),
+    "uploading": lambda row: not row.paused and row.state == "seeding",
+    "running": lambda row: not row.paused,
+    "stopped": attrgetter("paused"),
+}
+
+
+class StatusStore:
+    """
+    Latest known status of every torrent, fed from `post_torrent_updates()`.
+
+    libtorrent only reports torrents whose status changed since the previous
+    call, so rows are updated in place and never rebuilt wholesale.
+    `refreshed` is the monotonic time the store was last known to be current
+    and `generation` changes whenever rows are added, removed or replaced.
+    """
+
+    __slots__ = ("_rows", "primed", "refreshed", "generation")
+
+    def __init__(self) -> None:
+        self._rows: Dict[str, TorrentStatusRow] = {}
+        self.primed = False
+        self.refreshed = 0.0
+        self.generation = 0
+
+    def update(self, statuses: Iterable[lt.torrent_status]) -> None:
+        rows = self._rows
+        for status in statuses:
+            row = rows.get(str(status.info_hash))
+            if row is None:
+                row = TorrentStatusRow(status)
+                rows[row.info_hash] = row
+                self.generation += 1
+            else:
+                row.update(status)
+
+    def replace(self, statuses: Iterable[lt.torrent_status]) -> None:
+        self._rows.clear()
+        self.generation += 1
+        self.update(statuses)
+        self.primed = True
+        self.refreshed = time.monotonic()
+
+    def age(self) -> float:
+        return time.monotonic() - self.refreshed
+
+    def select(
+        self,
+        category: str = "all",
+        sort_by: str = "name",
+        descending: bool = False,
+        limit: int | None = None,
+    ) -> tuple[int, List[TorrentStatusRow]]:
+        """
+        Filter rows by category and sort them, ties broken by info-hash.
+
+        Returns the number of matching rows and, when `limit` is given, only
+        the first `limit` of them in order, which avoids sorting the whole
+        session to serve its first pages.
+        """
+        predicate = CATEGORIES[category]
+        matching = [row for row in self._rows.values() if predicate(row)]
+
+        sort_value = SORT_KEYS[sort_by]
+
+        def key(row: TorrentStatusRow):
+            return sort_value(row), row.info_hash
+
+        if limit is not None and limit < len(matching) // 4:
+            pick = heapq.nlargest if descending else heapq.nsmallest
+            return len(matching), pick(limit, matching, key=key)
+
+        matching.sort(key=key, reverse=descending)
+        return len(matching), matching if limit is None else matching[:limit]
+
+    def remove(self, info_hash: str) -> None:
+        if self._rows.pop(info_hash.lower(), None) is not None:
+            self.generation += 1
+
+    def get(self, info_hash: str) -> TorrentStatusRow | None:
+        return self._rows.get(info_hash.lower())
+
+    def clear(self) -> None:
+        self._rows.clear()
+        self.primed = False
+        self.refreshed = 0.0
+        self.generation += 1
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, info_hash: str) -> bool:
+        return info_hash.lower() in self._rows
+
+    def __iter__(self) -> Iterator[TorrentStatusRow]:
+        return iter(self._rows.values())
+
+    def __repr__(self):
+        return f"<StatusStore rows={len(self)}>"
@@ -0,0 +1,55 @@
+import libtorrent as lt
+
+
+class TorrentMetadata:
+    """
+    The general-tab fields of a torrent that never change once metadata
+    exists: name, comment, creator, sizes, seeds and the trackers listed in
+    the metadata itself.
+    """
+
+    __slots__ = ("fields", "trackers")
+
+    def __init__(self, ti: lt.torrent_info) -> None:
+        hashes = ti.info_hashes()
+        self.fields = {
+            "name": ti.name(),
+            "comment": ti.comment(),
+            "creator": ti.creator(),
+            "info_hash_v2": str(hashes.v2) if hashes.has_v2() else None,
+            "total_size": int(ti.total_size()),
+            "piece_length": int(ti.piece_length()),
+            "num_pieces": int(ti.num_pieces()),
+            "is_private": bool(ti.priv()),
+            "creation_date": int(ti.creation_date()),
+            "num_files": int(ti.num_files()),
+            "metadata_size": int(ti.metadata_size()),
+            "url_seeds": getattr(ti, "url_seeds", lambda: [])(),
+            "http_seeds": getattr(ti, "http_seeds", lambda: [])(),
+        }
+        # torrent_info.trackers() yields announce_entry objects msgpack cannot encode
+        self.trackers = [{"url": tr.url, "tier": tr.tier} for tr in ti.trackers()]
+
+    def __repr__(self):
+        return f"<TorrentMetadata {self.fields['name']!r}>"
+
+
+# Static fields of a torrent whose metadata has not arrived yet
+MISSING_METADATA = {
+    "name": None,
+    "comment": None,
+    "creator": None,
+    "info_hash_v2": None,
+    "total_size": None,
+    "piece_length": None,
+    "num_pieces": None,
+    "is_private": None,
+    "creation_date": None,
+    "num_files": None,
+    "metadata_size": None,
+    "files": [],
+    "trackers": [],
+    "nodes": [],
+    "url_seeds": [],
+    "http_seeds": [],
+}
@@ -1 +1,6 @@
+from .instrument import (
+    instrument as instrument,
+    instrument_handlers as instrument_handlers,
+    record_validation as record_validation,
+)
 from .validate_payload import validate_payload as validate_payload
@@ -0,0 +1,78 @@
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import Optional
+
+import socketio
+
+from seedarr.managers import LatencyManager
+
+latency_manager = LatencyManager()
+
+
+class CallTiming:
+    __slots__ = ("validation", "invalid")
+
+    def __init__(self) -> None:
+        self.validation = 0.0
+        self.invalid = False
+
+
+# Timing of the handler call running in this task, filled in by validate_payload
+_timing: ContextVar[Optional[CallTiming]] = ContextVar("seedarr_call_timing", default=None)
+
+
+def record_validation(seconds: float, invalid: bool) -> None:
+    """Attribute `seconds` of the current handler call to payload validation."""
+    timing = _timing.get()
+    if timing is not None:
+        timing.validation += seconds
+        timing.invalid = timing.invalid or invalid
+
+
+def instrument(event: str, handler):
+    """
+    Wrap a Socket.IO handler so every call is counted and timed under
+    `event`. A call is an error when it raises or answers with
+    `{"status": "error"}`.
+    """
+
+    @wraps(handler)
+    async def wrapper(*args, **kwargs):
+        timing = CallTiming()
+        token = _timing.set(timing)
+        error = True
+        started = time.perf_counter()
+        try:
+            response = await handler(*args, **kwargs)
+            error = isinstance(response, dict) and response.get("status") == "error"
+            return response
+        finally:
+            _timing.reset(token)
+            latency_manager.record_call(
+                event,
+                time.perf_counter() - started,
+                timing.validation,
+                error,
+                timing.invalid,
+            )
+
+    wrapper.__seedarr_instrumented__ = True  # type: ignore
+    return wrapper
+
+
+def instrument_handlers(sio: socketio.AsyncServer, package: str = "seedarr.routes") -> int:
+    """
+    Instrument every registered handler defined under `package`. Call once
+    the route modules are imported; returns how many were wrapped.
+    """
+    wrapped = 0
+    for handlers in sio.handlers.values():
+        for event, handler in list(handlers.items()):
+            if getattr(handler, "__seedarr_instrumented__", False):
+                continue
+            if not getattr(handler, "__module__", "").startswith(package):
+                continue
+            handlers[event] = instrument(event, handler)
+            wrapped += 1
+    return wrapped
@@ -1,9 +1,12 @@
+import time
 from functools import wraps
 
 from pydantic import BaseModel, ValidationError
 
 from seedarr.singletons import SIO
 
+from .instrument import record_validation
+
 sio = SIO.get_instance()
 
 
@@ -11,15 +14,22 @@ def validate_payload(model: type[BaseModel]):
     """
     Decorator to validate a dict payload using the given Pydantic model.
     Assumes the decorated function is async and second argument is the dict payload.
+    A missing payload validates as an empty dict.
     """
 
     def decorator(func):
         @wraps(func)
-        async def wrapper(sid, data, *args, **kwargs):
+        async def wrapper(sid, data=None, *args, **kwargs):
+            started = time.perf_counter()
+            validated = False
             try:
-                validated_data = model(**data)
+                validated_data = model(**(data or {}))
+                validated = True
+                record_validation(time.perf_counter() - started, invalid=False)
                 return await func(sid, validated_data, *args, **kwargs)
             except ValidationError as e:
+                if not validated:
+                    record_validation(time.perf_counter() - started, invalid=True)
                 print(f"[VALIDATION ERROR] {e}")
                 await sio.emit("validation_error", {"errors": e.errors()}, to=sid)
                 return None
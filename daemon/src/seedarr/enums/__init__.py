@@ -1 +1,3 @@
+from .event_topic import EventTopic as EventTopic
+from .overflow_policy import OverflowPolicy as OverflowPolicy
 from .synthetic_events import SyntheticEvent as SyntheticEvent
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class EventTopic(Enum):
+    """
+    Named channels on the EventBus. Consumers subscribe to the topics they
+    care about and only receive events published on those.
+    """
+
+    ALERTS = "libtorrent:alerts"  # Serialized alert batches popped from the session
+    SYNTHETIC = "synthetic"  # EventDataclass events raised by route handlers
+    RESUME_DATA = "resume_data"  # resume_data:save / resume_data:remove batches
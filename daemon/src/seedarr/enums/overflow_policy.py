@@ -0,0 +1,11 @@
+from enum import Enum, auto
+
+
+class OverflowPolicy(Enum):
+    """
+    What `EventBus.publish` does with an event when the bus is at capacity.
+    """
+
+    BLOCK = auto()  # Wait until the consumer frees a slot
+    DROP_OLDEST = auto()  # Evict the oldest queued event to make room
+    COALESCE = auto()  # Merge into the queued event with the same key
@@ -10,3 +10,4 @@ class SyntheticEvent(Enum):
     RESUMED = auto()
     PAUSED = auto()
     REMOVED = auto()
+    RECHECKED = auto()
@@ -1 +1,31 @@
+from .alert_batching import (
+    ALERT_BATCH_SIZE as ALERT_BATCH_SIZE,
+    ALERT_FLUSH_INTERVAL as ALERT_FLUSH_INTERVAL,
+    ALERT_QUEUE_SIZE as ALERT_QUEUE_SIZE,
+    STATUS_UPDATE_INTERVAL as STATUS_UPDATE_INTERVAL,
+)
+from .database_path import DATABASE_PATH as DATABASE_PATH
+from .event_bus_capacity import EVENT_BUS_CAPACITY as EVENT_BUS_CAPACITY
+from .file_table_cache import FILE_TABLE_CACHE_SIZE as FILE_TABLE_CACHE_SIZE
 from .folder_lock_directory import FOLDER_LOCK_DIRECTORY as FOLDER_LOCK_DIRECTORY
+from .geoip import GEOIP_CACHE_SIZE as GEOIP_CACHE_SIZE, GEOIP_DATABASE_PATH as GEOIP_DATABASE_PATH
+from .ingest import (
+    INGEST_ADD_TIMEOUT as INGEST_ADD_TIMEOUT,
+    INGEST_CONCURRENCY as INGEST_CONCURRENCY,
+    INGEST_PROGRESS_INTERVAL as INGEST_PROGRESS_INTERVAL,
+)
+from .libtorrent_workers import LIBTORRENT_WORKERS as LIBTORRENT_WORKERS
+from .metadata_cache import (
+    METADATA_CACHE_SIZE as METADATA_CACHE_SIZE,
+    METADATA_CACHE_TTL as METADATA_CACHE_TTL,
+    METADATA_FETCH_TIMEOUT as METADATA_FETCH_TIMEOUT,
+)
+from .metrics import METRICS_INTERVAL as METRICS_INTERVAL, METRICS_PATH as METRICS_PATH
+from .remove_timeout import REMOVE_TIMEOUT as REMOVE_TIMEOUT
+from .resume_data import (
+    RESTORE_TIMEOUT as RESTORE_TIMEOUT,
+    RESUME_DATA_FLUSH_TIMEOUT as RESUME_DATA_FLUSH_TIMEOUT,
+    RESUME_DATA_INTERVAL as RESUME_DATA_INTERVAL,
+)
+from .status_max_age import STATUS_MAX_AGE as STATUS_MAX_AGE
+from .subscription_interval import SUBSCRIPTION_INTERVAL as SUBSCRIPTION_INTERVAL
@@ -0,0 +1,17 @@
+import os
+
+# Most serialized alerts sent in a single libtorrent:broadcast frame
+ALERT_BATCH_SIZE = int(os.environ.get("ALERT_BATCH_SIZE", "1000"))
+
+# Seconds alerts popped after a quiet period are collected before they are
+# broadcast together; 0 broadcasts every pop on its own
+ALERT_FLUSH_INTERVAL = float(os.environ.get("ALERT_FLUSH_INTERVAL", "0.25"))
+
+# Seconds between post_torrent_updates() calls while clients are connected,
+# i.e. how often state_update alerts are broadcast
+STATUS_UPDATE_INTERVAL = float(os.environ.get("STATUS_UPDATE_INTERVAL", "0.25"))
+
+# Alerts libtorrent queues between pops before it drops new ones. Well above
+# libtorrent's default of 2000, so restoring or ingesting thousands of
+# torrents at once cannot lose the add_torrent_alerts they are awaited by
+ALERT_QUEUE_SIZE = int(os.environ.get("ALERT_QUEUE_SIZE", "100000"))
@@ -0,0 +1,7 @@
+import os
+
+from platformdirs import user_data_dir
+
+DATABASE_PATH = os.environ.get(
+    "DATABASE_PATH", os.path.join(user_data_dir("seedarr"), "seedarr.db")
+)
@@ -0,0 +1,4 @@
+import os
+
+# Most events the EventBus holds before publishers block, drop or coalesce
+EVENT_BUS_CAPACITY = int(os.environ.get("EVENT_BUS_CAPACITY", "1024"))
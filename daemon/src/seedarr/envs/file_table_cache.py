@@ -0,0 +1,5 @@
+import os
+
+# Torrents whose static file list (paths, sizes, offsets) is kept in memory.
+# Least recently served ones are dropped first
+FILE_TABLE_CACHE_SIZE = int(os.environ.get("FILE_TABLE_CACHE_SIZE", "64"))
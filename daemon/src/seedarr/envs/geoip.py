@@ -0,0 +1,8 @@
+import os
+
+# MaxMind country database (.mmdb) peers are resolved against. Unset or
+# empty disables the lookup; the file is read locally, so it works offline
+GEOIP_DATABASE_PATH = os.environ.get("GEOIP_DATABASE_PATH", "")
+
+# Resolved IP addresses kept in memory, shared by every torrent and client
+GEOIP_CACHE_SIZE = int(os.environ.get("GEOIP_CACHE_SIZE", "65536"))
@@ -0,0 +1,9 @@
+import os
+
+# Torrents bulk ingestion keeps in flight in `async_add_torrent`. Bounded so
+# the add_torrent_alerts fit in libtorrent's alert queue
+INGEST_CONCURRENCY = int(os.environ.get("INGEST_CONCURRENCY", "64"))
+# Seconds to wait for the add_torrent_alert of one ingested torrent
+INGEST_ADD_TIMEOUT = float(os.environ.get("INGEST_ADD_TIMEOUT", "60"))
+# Seconds between progress events sent to the ingesting client
+INGEST_PROGRESS_INTERVAL = float(os.environ.get("INGEST_PROGRESS_INTERVAL", "0.5"))
@@ -0,0 +1,5 @@
+import os
+
+# Threads running blocking libtorrent calls. libtorrent serializes most of
+# them on its network thread, so a few workers are enough
+LIBTORRENT_WORKERS = int(os.environ.get("LIBTORRENT_WORKERS", "4"))
@@ -0,0 +1,9 @@
+import os
+
+# Fetched metadata (info dicts) kept for magnet links that were previewed, so
+# adding them afterwards skips the swarm. Least recently used ones go first
+METADATA_CACHE_SIZE = int(os.environ.get("METADATA_CACHE_SIZE", "256"))
+# Seconds fetched metadata stays in the cache
+METADATA_CACHE_TTL = float(os.environ.get("METADATA_CACHE_TTL", "1800"))
+# Seconds to wait for a magnet link's metadata from the swarm
+METADATA_FETCH_TIMEOUT = float(os.environ.get("METADATA_FETCH_TIMEOUT", "20"))
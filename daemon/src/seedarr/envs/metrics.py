@@ -0,0 +1,7 @@
+import os
+
+# HTTP path the Prometheus exporter is served on, beside Socket.IO
+METRICS_PATH = os.environ.get("METRICS_PATH", "/metrics")
+
+# Seconds between post_session_stats() calls refreshing the exported values
+METRICS_INTERVAL = float(os.environ.get("METRICS_INTERVAL", "5"))
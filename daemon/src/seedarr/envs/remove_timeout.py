@@ -0,0 +1,5 @@
+import os
+
+# Seconds to wait for libtorrent's torrent_removed_alert before a removal is
+# answered and the torrent's folder unlocked anyway
+REMOVE_TIMEOUT = float(os.environ.get("REMOVE_TIMEOUT", "10"))
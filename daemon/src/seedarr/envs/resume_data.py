@@ -0,0 +1,12 @@
+import os
+
+# Seconds between sweeps that save resume data of every modified torrent
+RESUME_DATA_INTERVAL = float(os.environ.get("RESUME_DATA_INTERVAL", "60"))
+
+# Seconds shutdown waits for libtorrent to hand over and the database to
+# store resume data of every torrent
+RESUME_DATA_FLUSH_TIMEOUT = float(os.environ.get("RESUME_DATA_FLUSH_TIMEOUT", "10"))
+
+# Seconds startup waits for libtorrent to add every restored torrent before
+# it carries on without the ones still missing
+RESTORE_TIMEOUT = float(os.environ.get("RESTORE_TIMEOUT", "60"))
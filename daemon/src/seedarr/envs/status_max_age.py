@@ -0,0 +1,5 @@
+import os
+
+# Seconds a status store read may lag behind libtorrent. While nobody streams
+# alerts no state_update arrives, so older stores are re-read on demand
+STATUS_MAX_AGE = float(os.environ.get("STATUS_MAX_AGE", "1.0"))
@@ -0,0 +1,3 @@
+import os
+
+SUBSCRIPTION_INTERVAL = float(os.environ.get("SUBSCRIPTION_INTERVAL", "0.95"))
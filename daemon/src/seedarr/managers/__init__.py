@@ -1 +1,16 @@
-from .broadcast_client import BroadcastClientManager as BroadcastClientManager
+from .alert_waiter import AlertWaiterManager as AlertWaiterManager
+from .broadcast_client import (
+    BROADCAST_ROOM as BROADCAST_ROOM,
+    DELTA_BROADCAST_ROOM as DELTA_BROADCAST_ROOM,
+    BroadcastClientManager as BroadcastClientManager,
+    subscription_room as subscription_room,
+)
+from .latency import HandlerStats as HandlerStats, LatencyManager as LatencyManager
+from .metadata_fetch import MetadataFetchManager as MetadataFetchManager
+from .resume_data import (
+    SAVE_FLAGS as SAVE_FLAGS,
+    ResumeDataManager as ResumeDataManager,
+    resume_data_key as resume_data_key,
+)
+from .session_stats import SessionStatsManager as SessionStatsManager
+from .state_delta import StateDeltaManager as StateDeltaManager
@@ -0,0 +1,138 @@
+import asyncio
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+
+import anyio
+import libtorrent as lt
+
+from seedarr.datastructures import info_hash_keys
+
+AlertTypes = Tuple[Type[lt.alert], ...]
+
+
+def _alert_keys(alert: lt.alert) -> List[str]:
+    """Every hex info-hash of the torrent an alert is about."""
+    if isinstance(alert, lt.torrent_removed_alert):
+        return info_hash_keys(alert.info_hashes)
+    if alert.handle.is_valid():
+        return info_hash_keys(alert.handle.info_hashes())
+    if isinstance(alert, lt.add_torrent_alert):
+        # A failed add leaves no valid handle; its params name the torrent
+        if alert.params.ti is not None:
+            return info_hash_keys(alert.params.ti.info_hashes())
+        return info_hash_keys(alert.params.info_hashes)
+    return []
+
+
+def _outcome(alert: lt.alert) -> dict:
+    # libtorrent frees alerts on the next pop, so waiters get a copy
+    error = getattr(alert, "error", None)
+    return {
+        "type": alert.what(),
+        "message": alert.message(),
+        "error": error.message() if error is not None and error.value() else None,
+    }
+
+
+class AlertWaiterManager:
+    """
+    Lets code await the next alert of given types for one torrent instead of
+    polling for the state change it reports. Futures are resolved straight
+    from the alert loop with the alert's type, message and error, if any.
+    """
+
+    _instance: "AlertWaiterManager | None" = None
+    _waiters: Dict[str, List[Tuple[AlertTypes, asyncio.Future]]]
+    # Future -> the info-hash it waits on
+    _keys: Dict[asyncio.Future, str]
+    _types: Counter
+    _awaited: AlertTypes
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._waiters = {}
+            cls._instance._keys = {}
+            cls._instance._types = Counter()
+            cls._instance._awaited = ()
+        return cls._instance
+
+    def expect(self, alert_types: AlertTypes, info_hash: str) -> asyncio.Future:
+        """
+        A future resolved by the next alert of `alert_types` for `info_hash`.
+        Register it before triggering the operation, so the alert is not
+        missed; pass it to `discard` when giving up on it.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(info_hash.lower(), []).append((alert_types, future))
+        self._keys[future] = info_hash.lower()
+        self._types.update(alert_types)
+        self._awaited = tuple(self._types)
+        return future
+
+    def discard(self, future: asyncio.Future) -> None:
+        info_hash = self._keys.pop(future, None)
+        if info_hash is None:
+            return
+        waiters = self._waiters[info_hash]
+        for entry in waiters:
+            if entry[1] is future:
+                waiters.remove(entry)
+                self._release(entry[0])
+                break
+        if not waiters:
+            del self._waiters[info_hash]
+
+    def _release(self, alert_types: AlertTypes) -> None:
+        self._types.subtract(alert_types)
+        self._types = +self._types
+        self._awaited = tuple(self._types)
+
+    async def wait(self, alert_types: AlertTypes, info_hash: str, timeout: float) -> dict:
+        """
+        Wait for the next alert of `alert_types` for `info_hash`.
+        Raises TimeoutError if none arrives within `timeout` seconds.
+        """
+        future = self.expect(alert_types, info_hash)
+        return await self.wait_on(future, timeout)
+
+    async def wait_on(self, future: asyncio.Future, timeout: float) -> dict:
+        """Wait for a future from `expect`, at most `timeout` seconds."""
+        try:
+            with anyio.fail_after(timeout):
+                return await future
+        finally:
+            self.discard(future)
+
+    def collect(self, alerts: Iterable[lt.alert]) -> None:
+        if not self._waiters:
+            return
+        for alert in alerts:
+            if not isinstance(alert, self._awaited):
+                continue
+            for key in _alert_keys(alert):
+                waiters = self._waiters.get(key)
+                if waiters:
+                    self._resolve(key, waiters, alert)
+
+    def _resolve(self, key: str, waiters: List[Tuple[AlertTypes, asyncio.Future]], alert) -> None:
+        outcome: Optional[dict] = None
+        for entry in list(waiters):
+            alert_types, future = entry
+            if not isinstance(alert, alert_types):
+                continue
+            waiters.remove(entry)
+            self._release(alert_types)
+            del self._keys[future]
+            if not future.done():
+                if outcome is None:
+                    outcome = _outcome(alert)
+                future.set_result(outcome)
+        if not waiters:
+            del self._waiters[key]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self):
+        return f"<AlertWaiterManager waiters={len(self)}>"
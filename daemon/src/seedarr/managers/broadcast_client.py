@@ -1,30 +1,94 @@
-from typing import Set
+import asyncio
+from typing import Dict, Set, Tuple
+
+Subscription = Tuple[str, str]  # (info_hash, topic)
+
+# Socket.IO rooms alerts are fanned out to, so each payload is encoded once
+BROADCAST_ROOM = "libtorrent:broadcast"
+DELTA_BROADCAST_ROOM = "libtorrent:broadcast:delta"
+
+
+def subscription_room(info_hash: str, topic: str) -> str:
+    return f"libtorrent:subscription:{topic}:{info_hash}"
 
 
 class BroadcastClientManager:
     _instance: "BroadcastClientManager | None" = None
     _clients: Set[str]
+    _delta_clients: Set[str]
+    _subscriptions: Dict[Subscription, Set[str]]
+    _active: asyncio.Event
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._clients = set()
+            cls._instance._delta_clients = set()
+            cls._instance._subscriptions = {}
+            cls._instance._active = asyncio.Event()
         return cls._instance
 
-    def add_client(self, client_id: str) -> None:
+    def add_client(self, client_id: str, delta: bool = False) -> None:
         self._clients.add(client_id)
+        self._active.set()
+        if delta:
+            self._delta_clients.add(client_id)
+        else:
+            self._delta_clients.discard(client_id)
 
     def remove_client(self, client_id: str) -> None:
         self._clients.discard(client_id)
+        self._delta_clients.discard(client_id)
+        if not self._clients:
+            self._active.clear()
+        for key in list(self._subscriptions):
+            self.unsubscribe(client_id, *key)
 
     def count(self) -> int:
         return len(self._clients)
 
+    def count_full(self) -> int:
+        return len(self._clients) - len(self._delta_clients)
+
+    def count_delta(self) -> int:
+        return len(self._delta_clients)
+
     def clear(self) -> None:
         self._clients.clear()
+        self._delta_clients.clear()
+        self._subscriptions.clear()
+        self._active.clear()
+
+    async def wait_for_clients(self) -> None:
+        """Return once at least one client is streaming alerts."""
+        await self._active.wait()
 
     def get_clients(self) -> Set[str]:
         return self._clients.copy()
 
+    def get_delta_clients(self) -> Set[str]:
+        return self._delta_clients.copy()
+
+    def is_delta(self, client_id: str) -> bool:
+        return client_id in self._delta_clients
+
+    def subscribe(self, client_id: str, info_hash: str, topic: str) -> None:
+        self._subscriptions.setdefault((info_hash, topic), set()).add(client_id)
+
+    def unsubscribe(self, client_id: str, info_hash: str, topic: str) -> bool:
+        subscribers = self._subscriptions.get((info_hash, topic))
+        if subscribers is None or client_id not in subscribers:
+            return False
+        subscribers.discard(client_id)
+        if not subscribers:
+            del self._subscriptions[(info_hash, topic)]
+        return True
+
+    def get_subscriptions(self) -> Dict[Subscription, Set[str]]:
+        return {key: subscribers.copy() for key, subscribers in self._subscriptions.items()}
+
     def __repr__(self):
-        return f"<BroadcastClientManager clients={self.count()}>"
+        return (
+            f"<BroadcastClientManager clients={self.count()} "
+            f"subscriptions={len(self._subscriptions)}>"
+        )
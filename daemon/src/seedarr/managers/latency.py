@@ -0,0 +1,107 @@
+from typing import Dict
+
+from seedarr.datastructures import LatencyHistogram
+
+
+class HandlerStats:
+    __slots__ = ("calls", "errors", "invalid", "validation", "handler")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.invalid = 0
+        self.validation = LatencyHistogram()
+        self.handler = LatencyHistogram()
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "invalid": self.invalid,
+            "validation": self.validation.to_dict(),
+            "handler": self.handler.to_dict(),
+        }
+
+
+class LatencyManager:
+    """
+    Per-event call counts, error counts and latency histograms of the
+    Socket.IO handlers, split into payload validation and handler time, plus
+    the duration of broadcast emits per kind of room.
+    """
+
+    _instance: "LatencyManager | None" = None
+    _handlers: Dict[str, HandlerStats]
+    _emits: Dict[str, LatencyHistogram]
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._handlers = {}
+            cls._instance._emits = {}
+        return cls._instance
+
+    def record_call(
+        self, event: str, total: float, validation: float, error: bool, invalid: bool
+    ) -> None:
+        stats = self._handlers.get(event)
+        if stats is None:
+            stats = self._handlers[event] = HandlerStats()
+        stats.calls += 1
+        stats.errors += error
+        stats.invalid += invalid
+        stats.validation.observe(validation)
+        stats.handler.observe(total - validation)
+
+    def observe_emit(self, room: str, seconds: float) -> None:
+        histogram = self._emits.get(room)
+        if histogram is None:
+            histogram = self._emits[room] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    def stats(self) -> dict:
+        return {
+            "handlers": {event: stats.to_dict() for event, stats in self._handlers.items()},
+            "emits": {room: histogram.to_dict() for room, histogram in self._emits.items()},
+        }
+
+    def render(self) -> str:
+        """The counters and histograms in the Prometheus text format."""
+        parts = ["# TYPE seedarr_handler_calls_total counter\n"]
+        parts.extend(
+            f'seedarr_handler_calls_total{{event="{event}"}} {stats.calls}\n'
+            for event, stats in self._handlers.items()
+        )
+        parts.append("# TYPE seedarr_handler_errors_total counter\n")
+        parts.extend(
+            f'seedarr_handler_errors_total{{event="{event}"}} {stats.errors}\n'
+            for event, stats in self._handlers.items()
+        )
+        parts.append("# TYPE seedarr_handler_invalid_total counter\n")
+        parts.extend(
+            f'seedarr_handler_invalid_total{{event="{event}"}} {stats.invalid}\n'
+            for event, stats in self._handlers.items()
+        )
+        parts.append("# TYPE seedarr_handler_seconds histogram\n")
+        for event, stats in self._handlers.items():
+            parts.append(
+                stats.validation.render(
+                    "seedarr_handler_seconds", f'event="{event}",phase="validation",'
+                )
+            )
+            parts.append(
+                stats.handler.render("seedarr_handler_seconds", f'event="{event}",phase="handler",')
+            )
+        parts.append("# TYPE seedarr_emit_seconds histogram\n")
+        parts.extend(
+            histogram.render("seedarr_emit_seconds", f'room="{room}",')
+            for room, histogram in self._emits.items()
+        )
+        return "".join(parts)
+
+    def clear(self) -> None:
+        self._handlers.clear()
+        self._emits.clear()
+
+    def __repr__(self):
+        return f"<LatencyManager events={len(self._handlers)}>"
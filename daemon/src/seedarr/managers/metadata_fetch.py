@@ -0,0 +1,53 @@
+import asyncio
+from typing import Dict, List, Optional
+
+from seedarr.datastructures import MetadataCache
+from seedarr.envs import METADATA_CACHE_SIZE, METADATA_CACHE_TTL
+
+
+class MetadataFetchManager:
+    """
+    Remembers the metadata fetched for magnet links and the fetches still
+    running, both reachable through every hex info-hash of the torrent, so
+    concurrent previews share one swarm join and adding a previewed magnet
+    reuses its metadata.
+    """
+
+    _instance: "MetadataFetchManager | None" = None
+    _cache: MetadataCache
+    _inflight: Dict[str, asyncio.Task]
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._cache = MetadataCache(METADATA_CACHE_SIZE, METADATA_CACHE_TTL)
+            cls._instance._inflight = {}
+        return cls._instance
+
+    def cached(self, keys: List[str]) -> Optional[bytes]:
+        return self._cache.get(keys)
+
+    def store(self, keys: List[str], info_section: bytes) -> None:
+        self._cache.put(keys, info_section)
+
+    def inflight(self, keys: List[str]) -> Optional[asyncio.Task]:
+        for key in keys:
+            task = self._inflight.get(key)
+            if task is not None:
+                return task
+        return None
+
+    def track(self, keys: List[str], task: asyncio.Task) -> None:
+        """Share `task` under `keys` until it finishes."""
+        for key in keys:
+            self._inflight[key] = task
+
+        def done(_: asyncio.Task) -> None:
+            for key in keys:
+                if self._inflight.get(key) is task:
+                    del self._inflight[key]
+
+        task.add_done_callback(done)
+
+    def __repr__(self):
+        return f"<MetadataFetchManager cached={len(self._cache)} inflight={len(self._inflight)}>"
@@ -0,0 +1,167 @@
+import asyncio
+import time
+from typing import Iterable, List, Set
+
+import libtorrent as lt
+
+# Resume data is requested with the info dict so torrents can be restored
+# without their .torrent file
+SAVE_FLAGS = lt.torrent_handle.save_info_dict
+
+# Alerts after which a torrent's resume data is saved straight away
+SAVE_TRIGGERS = (
+    lt.add_torrent_alert,
+    lt.torrent_finished_alert,
+    lt.torrent_paused_alert,
+    lt.torrent_resumed_alert,
+    lt.metadata_received_alert,
+    lt.storage_moved_alert,
+    lt.file_renamed_alert,
+)
+
+
+def resume_data_key(info_hashes: lt.info_hash_t) -> str:
+    return str(info_hashes.get_best())
+
+
+class ResumeDataManager:
+    """
+    Requests `save_resume_data` from libtorrent and turns the answers into
+    `resume_data:save` / `resume_data:remove` events for the persistence
+    consumer.
+
+    Outstanding requests are counted so shutdown can wait for every answer.
+    Torrents being restored are remembered until their add_torrent_alert
+    arrives; their save triggers are skipped until the next periodic sweep,
+    since they were just loaded from the stored data.
+    """
+
+    _instance: "ResumeDataManager | None" = None
+    _outstanding: int
+    _settled: asyncio.Event
+    _restoring: Set[str]
+    _restored: Set[str]
+    _restore_done: asyncio.Event
+    _closed: bool
+    restore_started: float
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._outstanding = 0
+            cls._instance._settled = asyncio.Event()
+            cls._instance._settled.set()
+            cls._instance._restoring = set()
+            cls._instance._restored = set()
+            cls._instance._restore_done = asyncio.Event()
+            cls._instance._restore_done.set()
+            cls._instance._closed = False
+            cls._instance.restore_started = 0.0
+        return cls._instance
+
+    def request(self, handles: Iterable[lt.torrent_handle]) -> int:
+        """Ask libtorrent for resume data of `handles`; returns how many were asked."""
+        requested = 0
+        for handle in handles:
+            if not handle.is_valid():
+                continue
+            handle.save_resume_data(SAVE_FLAGS)
+            requested += 1
+
+        if requested:
+            self._outstanding += requested
+            self._settled.clear()
+        return requested
+
+    def close(self) -> None:
+        """Stop saving on alerts; only explicit requests are answered."""
+        self._closed = True
+
+    def _answered(self) -> None:
+        self._outstanding = max(self._outstanding - 1, 0)
+        if not self._outstanding:
+            self._settled.set()
+
+    def begin_restore(self, info_hashes: Iterable[str]) -> None:
+        self._restoring = set(info_hashes)
+        self.restore_started = time.monotonic()
+        if self._restoring:
+            self._restore_done.clear()
+
+    def end_sweep(self) -> None:
+        """Re-enable save triggers for restored torrents."""
+        self._restored.clear()
+
+    def _restore_answered(self, info_hash: str) -> None:
+        self._restoring.discard(info_hash)
+        self._restored.add(info_hash)
+        if not self._restoring:
+            self._restore_done.set()
+
+    def abandon_restore(self) -> Set[str]:
+        """Stop waiting for the running restore; returns the unanswered info-hashes."""
+        unanswered = self._restoring
+        self._restoring = set()
+        self._restore_done.set()
+        return unanswered
+
+    def collect(self, alerts: Iterable[lt.alert]) -> List[dict]:
+        """
+        Extract resume data from a pop's alerts and request it for torrents
+        that just changed. Saved data is returned as the alerts'
+        add_torrent_params, which libtorrent frees on the next `pop_alerts()`;
+        `encode_resume_data` bencodes them off the event loop before that.
+        """
+        events = []
+        triggered = []
+
+        for alert in alerts:
+            if isinstance(alert, lt.save_resume_data_alert):
+                events.append(
+                    {
+                        "type": "resume_data:save",
+                        "info_hash": resume_data_key(alert.params.info_hashes),
+                        "params": alert.params,
+                    }
+                )
+                self._answered()
+
+            elif isinstance(alert, lt.save_resume_data_failed_alert):
+                self._answered()
+
+            elif isinstance(alert, lt.torrent_removed_alert) and not self._closed:
+                events.append(
+                    {
+                        "type": "resume_data:remove",
+                        "info_hash": resume_data_key(alert.info_hashes),
+                    }
+                )
+
+            elif isinstance(alert, SAVE_TRIGGERS) and not self._closed:
+                handle = alert.handle
+                if not handle.is_valid():
+                    if isinstance(alert, lt.add_torrent_alert):
+                        self._restore_answered(resume_data_key(alert.params.info_hashes))
+                    continue
+
+                info_hash = resume_data_key(handle.info_hashes())
+                if isinstance(alert, lt.add_torrent_alert) and info_hash in self._restoring:
+                    self._restore_answered(info_hash)
+                elif info_hash not in self._restored:
+                    triggered.append(handle)
+
+        self.request(triggered)
+        return events
+
+    async def wait_settled(self) -> None:
+        """Return once every requested resume data was answered."""
+        await self._settled.wait()
+
+    async def wait_restored(self) -> None:
+        """Return once libtorrent answered every torrent of the running restore."""
+        await self._restore_done.wait()
+
+    def __repr__(self):
+        return (
+            f"<ResumeDataManager outstanding={self._outstanding} restoring={len(self._restoring)}>"
+        )
@@ -0,0 +1,48 @@
+import time
+from typing import List, Tuple
+
+import libtorrent as lt
+
+
+def _metric_name(name: str, counter: bool) -> str:
+    name = "libtorrent_" + name.replace(".", "_")
+    return name + "_total" if counter else name
+
+
+class SessionStatsManager:
+    """
+    Caches the latest `session_stats_alert` rendered in the Prometheus text
+    format, so serving a scrape is a lookup that never touches libtorrent.
+
+    The metric names and types come from `lt.session_stats_metrics()` once;
+    each alert only renders values next to the prebuilt prefixes.
+    """
+
+    _instance: "SessionStatsManager | None" = None
+    _metrics: List[Tuple[str, str]]
+    _text: str
+    updated: float
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._metrics = []
+            for metric in sorted(lt.session_stats_metrics(), key=lambda m: m.value_index):
+                counter = metric.type == lt.metric_type_t.counter
+                name = _metric_name(metric.name, counter)
+                prefix = f"# TYPE {name} {'counter' if counter else 'gauge'}\n{name} "
+                cls._instance._metrics.append((metric.name, prefix))
+            cls._instance._text = ""
+            cls._instance.updated = 0.0
+        return cls._instance
+
+    def update(self, alert: lt.session_stats_alert) -> None:
+        values = alert.values
+        self._text = "".join(f"{prefix}{values.get(name, 0)}\n" for name, prefix in self._metrics)
+        self.updated = time.time()
+
+    def render(self) -> str:
+        return self._text
+
+    def __repr__(self):
+        return f"<SessionStatsManager metrics={len(self._metrics)} updated={self.updated}>"
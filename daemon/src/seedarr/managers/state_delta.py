@@ -0,0 +1,100 @@
+from operator import itemgetter
+from typing import Dict, Iterable, List, Tuple
+
+from seedarr.datastructures import STATE_UPDATE_FIELDS
+
+
+class StateDeltaManager:
+    """
+    Remembers the last state_update values sent per torrent and field, so
+    delta subscribers only receive what changed.
+
+    Each torrent gets a small integer id when first sent. A change is encoded
+    as `[id, field_index, value, field_index, value, ...]` with indexes into
+    `fields`, which avoids repeating the info-hash and field names.
+
+    Every non-empty delta bumps `seq`. A client that sees a gap in `seq`
+    asks for a snapshot, which reflects every delta up to the current `seq`.
+    """
+
+    _instance: "StateDeltaManager | None" = None
+    fields: Tuple[str, ...] = STATE_UPDATE_FIELDS
+    _values = staticmethod(itemgetter(*STATE_UPDATE_FIELDS))
+    _last: Dict[str, tuple]
+    _ids: Dict[str, int]
+    _next_id: int
+    seq: int
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._last = {}
+            cls._instance._ids = {}
+            cls._instance._next_id = 0
+            cls._instance.seq = 0
+        return cls._instance
+
+    def _add(self, status: dict) -> dict:
+        info_hash = status["info_hash"]
+        self._last[info_hash] = self._values(status)
+        self._ids[info_hash] = self._next_id
+        self._next_id += 1
+        return {"id": self._ids[info_hash], **status}
+
+    def diff(self, statuses: Iterable[dict]) -> Tuple[List[dict], List[list]]:
+        """
+        Record `statuses` and return the torrents seen for the first time
+        (as full rows with their id) and the changes for known ones.
+        """
+        get_values = self._values
+        last_sent = self._last
+        added = []
+        changes = []
+
+        for status in statuses:
+            info_hash = status["info_hash"]
+            last = last_sent.get(info_hash)
+            if last is None:
+                added.append(self._add(status))
+                continue
+
+            values = get_values(status)
+            if values == last:
+                continue
+
+            change: list = [self._ids[info_hash]]
+            for index, value in enumerate(values):
+                if value != last[index]:
+                    change += (index, value)
+            last_sent[info_hash] = values
+            changes.append(change)
+
+        if added or changes:
+            self.seq += 1
+        return added, changes
+
+    def reset(self, statuses: Iterable[dict]) -> None:
+        """Replace everything remembered with `statuses` as a new baseline."""
+        self._last.clear()
+        self._ids.clear()
+        for status in statuses:
+            self._add(status)
+        self.seq += 1
+
+    def snapshot(self) -> List[dict]:
+        return [
+            {"id": self._ids[info_hash], **dict(zip(self.fields, values))}
+            for info_hash, values in self._last.items()
+        ]
+
+    def forget(self, info_hash: str) -> None:
+        self._last.pop(info_hash, None)
+        self._ids.pop(info_hash, None)
+
+    def clear(self) -> None:
+        self._last.clear()
+        self._ids.clear()
+        self.seq = 0
+
+    def __repr__(self):
+        return f"<StateDeltaManager torrents={len(self._last)} seq={self.seq}>"
@@ -0,0 +1,3 @@
+from .resume_data import ResumeDataTable as ResumeDataTable
+
+TABLES = (ResumeDataTable,)
@@ -0,0 +1,52 @@
+import time
+from typing import Iterable, List, Tuple
+
+import aiosqlite
+
+
+class ResumeDataTable:
+    """
+    Bencoded `add_torrent_params` (libtorrent resume data) keyed by the
+    torrent's best info-hash.
+    """
+
+    name = "resume_data"
+
+    @staticmethod
+    async def create(connection: aiosqlite.Connection) -> None:
+        await connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS resume_data (
+                info_hash TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+
+    @staticmethod
+    async def load_all(connection: aiosqlite.Connection) -> List[Tuple[str, bytes]]:
+        async with connection.execute("SELECT info_hash, data FROM resume_data") as cursor:
+            return [tuple(row) for row in await cursor.fetchall()]  # type: ignore
+
+    @staticmethod
+    async def write(
+        connection: aiosqlite.Connection,
+        saved: Iterable[Tuple[str, bytes]],
+        removed: Iterable[str],
+    ) -> None:
+        """Upsert `saved` and delete `removed` in a single transaction."""
+        now = time.time()
+        await connection.executemany(
+            """
+            INSERT INTO resume_data (info_hash, data, updated_at) VALUES (?, ?, ?)
+            ON CONFLICT (info_hash) DO UPDATE SET
+                data = excluded.data, updated_at = excluded.updated_at
+            """,
+            [(info_hash, data, now) for info_hash, data in saved],
+        )
+        await connection.executemany(
+            "DELETE FROM resume_data WHERE info_hash = ?",
+            [(info_hash,) for info_hash in removed],
+        )
+        await connection.commit()
@@ -0,0 +1,15 @@
+from seedarr.singletons import SIO, EventBus
+
+sio = SIO.get_instance()
+event_bus = EventBus.get_bus()
+
+
+@sio.on("admin:event_bus")  # type: ignore
+async def event_bus_stats(sid: str):
+    """
+    Handle the 'admin:event_bus' event from the client.
+
+    Returns the EventBus depth, drop and merge counters and the
+    enqueue-to-consume latency, so an overloaded bus is visible.
+    """
+    return {"status": "success", "stats": event_bus.stats()}
@@ -0,0 +1,27 @@
+from seedarr.managers import LatencyManager
+from seedarr.singletons import SIO, EventBus, LibtorrentExecutor
+
+sio = SIO.get_instance()
+event_bus = EventBus.get_bus()
+latency_manager = LatencyManager()
+
+
+@sio.on("admin:latency")  # type: ignore
+async def latency_stats(sid: str):
+    """
+    Handle the 'admin:latency' event from the client.
+
+    Returns per-event call and error counts with validation and handler
+    latency histograms, broadcast emit durations per room kind, the
+    EventBus wait and handle histograms per consumer, and the wait and run
+    histograms of each libtorrent operation.
+    """
+    return {
+        "status": "success",
+        **latency_manager.stats(),
+        "event_bus": {
+            name: {"wait": stats["wait"], "handle": stats["handle"]}
+            for name, stats in event_bus.stats().items()
+        },
+        "libtorrent": LibtorrentExecutor.stats(),
+    }
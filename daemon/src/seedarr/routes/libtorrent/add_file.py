@@ -2,7 +2,7 @@ import os
 import tempfile
 
 import libtorrent as lt
-from seedarr.singletons import SIO, FolderLock, LibtorrentSession, Logger
+from seedarr.singletons import SIO, FolderLock, LibtorrentExecutor, LibtorrentSession, Logger
 
 folder_lock = FolderLock.get_instance()
 sio = SIO.get_instance()
@@ -23,8 +23,9 @@ async def add_file(sid: str, data: dict):
         return {"status": "error", "message": "File must be a byte string"}
 
     try:
-        torrent_dict = lt.bdecode(file)
-        torrent_info = lt.torrent_info(torrent_dict)  # type:ignore
+        torrent_info = await LibtorrentExecutor.run(
+            "torrent_info.parse", lambda: lt.torrent_info(lt.bdecode(file))
+        )
     except Exception as e:
         return {"status": "error", "message": f"Failed to decode torrent file: {e}"}
 
@@ -34,19 +35,24 @@ async def add_file(sid: str, data: dict):
         "storage_mode": lt.storage_mode_t.storage_mode_sparse,
     }
 
-    try:
+    def add() -> tuple[lt.torrent_handle, dict]:
         handle = lt_session.add_torrent(params)
-        logger.info(f"Added to libtorrent: {handle.name()}")
+        return handle, {
+            "name": handle.name(),
+            "info_hash": str(handle.info_hash()),
+            "save_path": handle.save_path(),
+        }
+
+    try:
+        handle, added = await LibtorrentExecutor.run("session.add_torrent", add)
+        LibtorrentSession.register_handle(handle)
+        logger.info(f"Added to libtorrent: {added['name']}")
     except Exception as e:
         return {"status": "error", "message": f"Failed to add torrent: {e}"}
 
-    await folder_lock.add_folder(os.path.join(save_path, handle.name()))
+    await folder_lock.add_folder(os.path.join(save_path, added["name"]))
     return {
         "status": "success",
         "message": "Torrent added successfully",
-        "torrent_info": {
-            "name": handle.name(),
-            "info_hash": str(handle.info_hash()),
-            "save_path": handle.save_path(),
-        },
+        "torrent_info": added,
     }
@@ -4,8 +4,10 @@ import tempfile
 from pydantic import BaseModel, Field, field_validator
 
 import libtorrent as lt
+from seedarr.datastructures import torrent_file_from_info
 from seedarr.decorators import validate_payload
-from seedarr.singletons import SIO, FolderLock, LibtorrentSession, Logger
+from seedarr.singletons import SIO, FolderLock, LibtorrentExecutor, LibtorrentSession, Logger
+from seedarr.tasks import cached_magnet_metadata
 
 folder_lock = FolderLock.get_instance()
 
@@ -37,17 +39,22 @@ async def add_magnet(sid: str, data: AddMagnetPayload):
         # Parse magnet URI
         params = lt.parse_magnet_uri(data.magnet_uri)
         params.save_path = data.save_path
+        # Metadata fetched for a preview lets the download start right away
+        info_section = await cached_magnet_metadata(params)
 
-        # Try to use resume data if available
-        handle = ses.add_torrent(params)
+        def add() -> tuple[lt.torrent_handle, str, str]:
+            if info_section is not None:
+                params.ti = lt.torrent_info(torrent_file_from_info(info_section))
+            handle = ses.add_torrent(params)
+            return handle, handle.name(), str(handle.info_hash())
 
-        # Get torrent info
-        ti = handle.get_torrent_info()
-        await folder_lock.add_folder(os.path.join(data.save_path, handle.name()))
+        handle, name, info_hash = await LibtorrentExecutor.run("session.add_torrent", add)
+        LibtorrentSession.register_handle(handle)
+        await folder_lock.add_folder(os.path.join(data.save_path, name))
 
         return {
             "status": "success",
-            "info_hash": str(ti.info_hash()),
+            "info_hash": info_hash,
         }
 
     except Exception as e:
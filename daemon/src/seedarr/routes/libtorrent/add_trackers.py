@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field
 
 from seedarr.decorators import validate_payload
-from seedarr.singletons import SIO, LibtorrentSession
+from seedarr.singletons import SIO, LibtorrentExecutor, LibtorrentSession
 
 sio = SIO.get_instance()
 
@@ -14,52 +14,48 @@ class AddTrackerPayload(BaseModel):
 @sio.on("libtorrent:add_tracker")  # type: ignore
 @validate_payload(AddTrackerPayload)
 async def add_tracker(sid: str, data: AddTrackerPayload):
-    ses = await LibtorrentSession.get_session()
-    handles = ses.get_torrents()
-
-    for handle in handles:
-        if not handle.is_valid():
-            continue
-
-        if str(handle.info_hash()) == data.info_hash:
-            try:
-                existing_trackers = handle.trackers()
-                existing_urls = {tr["url"] for tr in existing_trackers}
-
-                # Get max existing tier to place new trackers after them
-                max_tier = max((tr["tier"] for tr in existing_trackers), default=0)
-
-                # New trackers to be added (skip duplicates)
-                new_trackers = [
-                    {"url": url, "tier": max_tier + 1}
-                    for url in data.trackers
-                    if url not in existing_urls
-                ]
-
-                # Convert existing announce_entry to dict
-                existing_as_dicts = [
-                    {"url": tr["url"], "tier": tr["tier"]} for tr in existing_trackers
-                ]
-
-                # Final list: existing first, then new ones
-                combined_trackers = existing_as_dicts + new_trackers
-
-                # Replace the entire tracker list
-                handle.replace_trackers(combined_trackers)
-
-                return {
-                    "status": "success",
-                    "message": f"Added {len(new_trackers)} tracker(s)",
-                    "all_trackers": [tr["url"] for tr in combined_trackers],
-                }
-
-            except Exception as e:
-                return {
-                    "status": "error",
-                    "message": f"Failed to add trackers: {str(e)}",
-                }
-
-    return {
-        "status": "error",
-        "message": "Torrent not found",
-    }
+    handle = await LibtorrentSession.find_handle(data.info_hash)
+    if handle is None:
+        return {
+            "status": "error",
+            "message": "Torrent not found",
+        }
+
+    def add_trackers() -> tuple[list[dict], list[dict]]:
+        existing_trackers = handle.trackers()
+        existing_urls = {tr["url"] for tr in existing_trackers}
+
+        # Get max existing tier to place new trackers after them
+        max_tier = max((tr["tier"] for tr in existing_trackers), default=0)
+
+        # New trackers to be added (skip duplicates)
+        new_trackers = [
+            {"url": url, "tier": max_tier + 1} for url in data.trackers if url not in existing_urls
+        ]
+
+        # Convert existing announce_entry to dict
+        existing_as_dicts = [{"url": tr["url"], "tier": tr["tier"]} for tr in existing_trackers]
+
+        # Final list: existing first, then new ones
+        combined_trackers = existing_as_dicts + new_trackers
+
+        # Replace the entire tracker list
+        handle.replace_trackers(combined_trackers)
+        return new_trackers, combined_trackers
+
+    try:
+        new_trackers, combined_trackers = await LibtorrentExecutor.run(
+            "torrent_handle.replace_trackers", add_trackers
+        )
+
+        return {
+            "status": "success",
+            "message": f"Added {len(new_trackers)} tracker(s)",
+            "all_trackers": [tr["url"] for tr in combined_trackers],
+        }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Failed to add trackers: {str(e)}",
+        }
@@ -0,0 +1,156 @@
+import asyncio
+from collections import Counter
+from typing import Callable, Literal
+
+import anyio
+from pydantic import BaseModel, Field, model_validator
+
+import libtorrent as lt
+from seedarr.datastructures import BatchEventDataclass
+from seedarr.decorators import validate_payload
+from seedarr.enums import EventTopic, SyntheticEvent
+from seedarr.managers import AlertWaiterManager
+from seedarr.singletons import SIO, EventBus, LibtorrentExecutor, LibtorrentSession
+from seedarr.tasks import (
+    Outcome,
+    RemovedTorrent,
+    expect_removal,
+    pause_handle,
+    recheck_handle,
+    release_removed,
+    remove_handle,
+    resume_handle,
+)
+
+sio = SIO.get_instance()
+event_bus = EventBus.get_bus()
+alert_waiter_manager = AlertWaiterManager()
+
+ACTION_EVENTS = {
+    "pause": SyntheticEvent.PAUSED,
+    "resume": SyntheticEvent.RESUMED,
+    "remove": SyntheticEvent.REMOVED,
+    "recheck": SyntheticEvent.RECHECKED,
+}
+
+
+class BatchRequestPayload(BaseModel):
+    action: Literal["pause", "resume", "remove", "recheck"] = Field(...)
+    info_hashes: list[str] | None = Field(default=None)
+    category: (
+        Literal[
+            "all",
+            "active",
+            "inactive",
+            "completed",
+            "downloading",
+            "uploading",
+            "running",
+            "stopped",
+        ]
+        | None
+    ) = Field(default=None)
+    remove_data: bool = Field(default=False)
+
+    @model_validator(mode="after")
+    def check_selection(self):
+        if (self.info_hashes is None) == (self.category is None):
+            raise ValueError("Pass exactly one of 'info_hashes' or 'category'")
+        return self
+
+
+async def publish_batch_event(info_hashes: list[str], event: SyntheticEvent):
+    """Publish one synthetic event for every torrent a batch changed."""
+    await event_bus.publish(
+        BatchEventDataclass(info_hashes=info_hashes, event=event),
+        topic=EventTopic.SYNTHETIC,
+    )
+
+
+@sio.on("libtorrent:batch")  # type: ignore
+@validate_payload(BatchRequestPayload)
+async def batch(sid: str, data: BatchRequestPayload):
+    """
+    Pause, resume, remove or recheck many torrents at once, chosen by
+    info-hash or by listing category.
+
+    Handle calls run in one libtorrent worker pass. Returns a status and message
+    per info-hash and publishes a single synthetic event for the torrents
+    that changed. Removals are answered once their torrent_removed_alerts
+    arrive, so the torrents are really gone from the session by then.
+    """
+    ses = await LibtorrentSession.get_session()
+
+    if data.category is not None:
+        statuses = await LibtorrentSession.get_status_store()
+        _, rows = statuses.select(data.category)
+        requested = [row.info_hash for row in rows]
+    else:
+        requested = list(dict.fromkeys(data.info_hashes or []))
+
+    missing = {"status": "error", "message": "Torrent not found"}
+    # A hybrid torrent requested by both its v1 and v2 hash is handled once,
+    # under the first of them; handle -> that info-hash
+    handles: dict[lt.torrent_handle, str] = {}
+    aliases: dict[str, str] = {}
+    for info_hash in requested:
+        handle = await LibtorrentSession.find_handle(info_hash)
+        if handle is not None:
+            aliases[info_hash] = handles.setdefault(handle, info_hash)
+
+    flags = lt.options_t.delete_files if data.remove_data else 0
+    # handle -> its torrent_removed_alert, registered before the removal
+    removals: dict[lt.torrent_handle, asyncio.Future] = {}
+    if data.action == "remove":
+        removals = {handle: expect_removal(info_hash) for handle, info_hash in handles.items()}
+    removed: list[tuple[RemovedTorrent, asyncio.Future]] = []
+
+    def _remove(handle: lt.torrent_handle) -> Outcome:
+        torrent = remove_handle(ses, handle, flags)
+        removed.append((torrent, removals.pop(handle)))
+        return "success", "Torrent removed"
+
+    operations: dict[str, Callable[[lt.torrent_handle], Outcome]] = {
+        "pause": pause_handle,
+        "resume": resume_handle,
+        "remove": _remove,
+        "recheck": recheck_handle,
+    }
+    operation = operations[data.action]
+
+    def apply() -> tuple[dict[str, dict], list[str]]:
+        outcomes = {}
+        changed = []
+        for handle, info_hash in handles.items():
+            try:
+                event_hash = str(handle.info_hash())
+                status, message = operation(handle)
+            except Exception as e:
+                status, message = "error", str(e)
+            else:
+                if status == "success":
+                    changed.append(event_hash)
+            outcomes[info_hash] = {"status": status, "message": message}
+        return outcomes, changed
+
+    outcomes, changed = await LibtorrentExecutor.run(f"batch.{data.action}", apply)
+    results = {
+        info_hash: outcomes[aliases[info_hash]] if info_hash in aliases else missing
+        for info_hash in requested
+    }
+
+    for removal in removals.values():
+        alert_waiter_manager.discard(removal)
+    async with anyio.create_task_group() as task_group:
+        for torrent, removal in removed:
+            task_group.start_soon(release_removed, torrent, removal)
+
+    if changed:
+        sio.start_background_task(publish_batch_event, changed, ACTION_EVENTS[data.action])
+
+    return {
+        "status": "success",
+        "action": data.action,
+        "counts": dict(Counter(result["status"] for result in results.values())),
+        "results": results,
+    }
@@ -1,43 +1,131 @@
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
+from seedarr.consumers import serialize_subscription
+from seedarr.datastructures import STATE_UPDATE_FIELDS
 from seedarr.decorators import validate_payload
-from seedarr.managers import BroadcastClientManager
+from seedarr.managers import (
+    BROADCAST_ROOM,
+    DELTA_BROADCAST_ROOM,
+    BroadcastClientManager,
+    StateDeltaManager,
+    subscription_room,
+)
 from seedarr.singletons import (
     SIO,
     EventBus,
+    LibtorrentSession,
     Logger,
 )
 
 sio = SIO.get_instance()
 logger = Logger.get_logger()
 broadcast_client_manager = BroadcastClientManager()
+state_delta_manager = StateDeltaManager()
 event_bus = EventBus.get_bus()
 
-poller_started = False
-
 
 class BroadcastRequestPayload(BaseModel):
-    event: Literal["start", "stop"] = Field(...)
+    event: Literal["start", "stop", "resync", "subscribe", "unsubscribe"] = Field(...)
+    mode: Literal["full", "delta"] = Field(default="full")
+    info_hash: str | None = Field(default=None)
+    topic: Literal["general", "peers", "files", "trackers"] | None = Field(default=None)
+
+    @model_validator(mode="after")
+    def check_subscription(self):
+        if self.event in ("subscribe", "unsubscribe"):
+            if not self.info_hash or not self.topic:
+                raise ValueError(f"'{self.event}' requires 'info_hash' and 'topic'")
+            self.info_hash = self.info_hash.lower()
+        return self
+
+
+def _snapshot() -> dict:
+    return {
+        "seq": state_delta_manager.seq,
+        "fields": state_delta_manager.fields,
+        "statuses": state_delta_manager.snapshot(),
+    }
 
 
 @sio.on("libtorrent:broadcast")  # type: ignore
 @validate_payload(BroadcastRequestPayload)
 async def handle_broadcast_request(sid: str, data: BroadcastRequestPayload):
-    global poller_started
+    """
+    Start or stop the alert stream for a client.
+
+    In "delta" mode state updates arrive as `libtorrent:state_delta` alerts
+    carrying only changed fields (see `StateDeltaManager`) and a sequence
+    number. The start (and "resync") response holds a snapshot tagged with
+    the current `seq`; deltas with a lower or equal `seq` are already
+    reflected in it.
 
+    "subscribe" registers interest in one torrent's detail topic (general,
+    peers, files or trackers). Updates arrive as `libtorrent:subscription`
+    alerts from a single producer shared by every subscriber.
+    """
     if data.event == "start":
-        broadcast_client_manager.add_client(sid)
+        delta = data.mode == "delta"
+        if delta and not broadcast_client_manager.count_delta():
+            # Deltas are only tracked while someone consumes them, so the first
+            # delta client starts from the current status store
+            statuses = await LibtorrentSession.get_status_store()
+            state_delta_manager.reset(row.to_dict(STATE_UPDATE_FIELDS) for row in statuses)
 
-        return {
+        broadcast_client_manager.add_client(sid, delta=delta)
+        await sio.leave_room(sid, BROADCAST_ROOM if delta else DELTA_BROADCAST_ROOM)
+        await sio.enter_room(sid, DELTA_BROADCAST_ROOM if delta else BROADCAST_ROOM)
+
+        response = {
             "status": "success",
             "message": f"Started alert stream for client {sid}",
         }
+        if delta:
+            response.update(_snapshot())
+        return response
+
+    elif data.event == "resync":
+        if not broadcast_client_manager.is_delta(sid):
+            return {
+                "status": "error",
+                "message": f"No active delta stream for client {sid}",
+            }
+
+        return {"status": "success", **_snapshot()}
+
+    elif data.event == "subscribe":
+        if await LibtorrentSession.find_handle(data.info_hash) is None:  # type: ignore
+            return {"status": "error", "message": f"Torrent {data.info_hash} not found"}
+
+        broadcast_client_manager.subscribe(sid, data.info_hash, data.topic)  # type: ignore
+        await sio.enter_room(sid, subscription_room(data.info_hash, data.topic))  # type: ignore
+        payload = await serialize_subscription(data.info_hash, data.topic)  # type: ignore
+        return {
+            "status": "success",
+            "message": f"Subscribed to {data.topic} of {data.info_hash}",
+            "data": payload.get("data"),
+        }
+
+    elif data.event == "unsubscribe":
+        if broadcast_client_manager.unsubscribe(sid, data.info_hash, data.topic):  # type: ignore
+            await sio.leave_room(sid, subscription_room(data.info_hash, data.topic))  # type: ignore
+            return {
+                "status": "success",
+                "message": f"Unsubscribed from {data.topic} of {data.info_hash}",
+            }
+
+        return {
+            "status": "error",
+            "message": f"No subscription to {data.topic} of {data.info_hash}",
+        }
 
     elif data.event == "stop":
         if sid in broadcast_client_manager.get_clients():
             broadcast_client_manager.remove_client(sid)
+            for room in sio.rooms(sid):
+                if room.startswith("libtorrent:"):
+                    await sio.leave_room(sid, room)
             return {
                 "status": "success",
                 "message": f"Stopped alert stream for client {sid}",
@@ -3,10 +3,10 @@ import tempfile
 from pydantic import BaseModel, Field
 
 import libtorrent as lt
+from seedarr.datastructures import FileTable, torrent_file_from_info
 from seedarr.decorators import validate_payload
-from seedarr.serializers import serialize_file_info
-from seedarr.singletons import SIO, LibtorrentSession, Logger
-from seedarr.timers import wait_for
+from seedarr.singletons import SIO, LibtorrentExecutor, Logger
+from seedarr.tasks import fetch_magnet_metadata
 
 sio = SIO.get_instance()
 logger = Logger.get_logger()
@@ -16,47 +16,46 @@ class FetchMetadataPayload(BaseModel):
     magnet_uri: str | None = Field(default=None)
 
 
+def _describe(info_section: bytes) -> tuple[dict, list[dict]]:
+    torrent_info = lt.torrent_info(torrent_file_from_info(info_section))
+    files = FileTable(torrent_info.files())
+    metadata = {
+        "info_hash": str(torrent_info.info_hashes().get_best()),
+        "name": torrent_info.name(),
+        "save_path": tempfile.gettempdir(),
+        "size": torrent_info.total_size(),
+    }
+    # Nothing is downloaded yet; every file has the default priority
+    return metadata, files.rows([0] * len(files), [4] * len(files))
+
+
 @sio.on("libtorrent:fetch_metadata")  # type: ignore
 @validate_payload(FetchMetadataPayload)
 async def fetch_metadata(sid: str, data: FetchMetadataPayload):
+    """
+    Preview a magnet link's name, size and files. Metadata is cached, so a
+    later `libtorrent:add_magnet` of the same link starts downloading at once.
+    """
     if not data.magnet_uri:
         return {"status": "error", "message": "Magnet URI is required"}
 
-    ses = await LibtorrentSession.get_session()
-
-    # Parse and add magnet URI to session
-    params = lt.parse_magnet_uri(data.magnet_uri)
-    params.save_path = tempfile.gettempdir()
-    handle = ses.add_torrent(params)
-
-    async def is_ready():
-        return handle.has_metadata()
-
-    await wait_for(is_ready, timeout=20, backoff="exponential")
+    try:
+        params = lt.parse_magnet_uri(data.magnet_uri)
+    except Exception as e:
+        return {"status": "error", "message": f"Invalid magnet URI: {e}", "metadata": None}
 
-    if not handle.has_metadata():
+    try:
+        info_section = await fetch_magnet_metadata(params)
+    except TimeoutError:
         return {
             "status": "error",
             "message": "Metadata not available after waiting",
             "metadata": None,
         }
 
-    # Try to extract file info
-    try:
-        torrent_files = await serialize_file_info(handle)
-    except Exception:
-        torrent_files = []
-
-    # Prepare metadata
-    metadata = {
-        "info_hash": str(handle.info_hash()),
-        "name": handle.name(),
-        "save_path": handle.save_path(),
-        "size": handle.get_torrent_info().total_size(),
-    }
-
-    # Optionally clean up
-    ses.remove_torrent(handle, lt.options_t.delete_files)
+    metadata, torrent_files = await LibtorrentExecutor.run(
+        "torrent_info.describe", _describe, info_section
+    )
 
     return {
         "status": "success",
@@ -14,18 +14,12 @@ class SpecificTorrentData(BaseModel):
 @sio.on("libtorrent:get_specific")  # type: ignore
 @validate_payload(SpecificTorrentData)
 async def get_specific(sid: str, data: SpecificTorrentData):
-    ses = await LibtorrentSession.get_session()
-    handles = ses.get_torrents()
-
-    for handle in handles:
-        if not handle.is_valid():
-            continue
-
-        if str(handle.info_hash()) == data.info_hash:
-            metadata = await serialize_magnet_torrent_info(handle)
-            return {
-                "status": "success",
-                "torrent": metadata,
-            }
-
-    return {"status": "error", "message": "torrent not found"}
+    handle = await LibtorrentSession.find_handle(data.info_hash)
+    if handle is None:
+        return {"status": "error", "message": "torrent not found"}
+
+    metadata = await serialize_magnet_torrent_info(handle)
+    return {
+        "status": "success",
+        "torrent": metadata,
+    }
@@ -1,7 +1,13 @@
 from pydantic import BaseModel, Field
 
 from seedarr.decorators import validate_payload
-from seedarr.serializers import serialize_file_info
+from seedarr.serializers import (
+    FILE_COLUMNS,
+    ResponseFormat,
+    empty_columns,
+    serialize_file_columns,
+    serialize_file_info,
+)
 from seedarr.singletons import SIO, LibtorrentSession
 
 sio = SIO.get_instance()
@@ -9,25 +15,25 @@ sio = SIO.get_instance()
 
 class SpecificTorrentFiles(BaseModel):
     info_hash: str = Field(...)
+    format: ResponseFormat = Field(default="rows")
 
 
 @sio.on("libtorrent:get_specific_files")  # type: ignore
 @validate_payload(SpecificTorrentFiles)
 async def get_specific_files(sid: str, data: SpecificTorrentFiles):
-    ses = await LibtorrentSession.get_session()
-    handles = ses.get_torrents()
-
-    for handle in handles:
-        if not handle.is_valid():
-            continue
-
-        if str(handle.info_hash()) == data.info_hash:
-            try:
-                torrent_files = await serialize_file_info(handle)
-            except Exception:
-                torrent_files = []
-
-            return {
-                "status": "success",
-                "files": torrent_files,
-            }
+    handle = await LibtorrentSession.find_handle(data.info_hash)
+    if handle is None:
+        return {"status": "error", "message": "torrent not found"}
+
+    try:
+        if data.format == "columnar":
+            torrent_files = await serialize_file_columns(handle)
+        else:
+            torrent_files = await serialize_file_info(handle)
+    except Exception:
+        torrent_files = empty_columns(FILE_COLUMNS) if data.format == "columnar" else []
+
+    return {
+        "status": "success",
+        "files": torrent_files,
+    }
@@ -1,7 +1,13 @@
 from pydantic import BaseModel, Field
 
 from seedarr.decorators import validate_payload
-from seedarr.serializers import serialize_peer_info
+from seedarr.serializers import (
+    PEER_COLUMNS,
+    ResponseFormat,
+    empty_columns,
+    serialize_peer_columns,
+    serialize_peer_info,
+)
 from seedarr.singletons import SIO, LibtorrentSession
 
 sio = SIO.get_instance()
@@ -9,25 +15,25 @@ sio = SIO.get_instance()
 
 class SpecificTorrentPeer(BaseModel):
     info_hash: str = Field(...)
+    format: ResponseFormat = Field(default="rows")
 
 
 @sio.on("libtorrent:get_specific_peers")  # type: ignore
 @validate_payload(SpecificTorrentPeer)
 async def get_specific_peers(sid: str, data: SpecificTorrentPeer):
-    ses = await LibtorrentSession.get_session()
-    handles = ses.get_torrents()
-
-    for handle in handles:
-        if not handle.is_valid():
-            continue
-
-        if str(handle.info_hash()) == data.info_hash:
-            try:
-                peers_info = await serialize_peer_info(handle)
-            except Exception:
-                peers_info = []
-
-            return {
-                "status": "success",
-                "peers": peers_info,
-            }
+    handle = await LibtorrentSession.find_handle(data.info_hash)
+    if handle is None:
+        return {"status": "error", "message": "torrent not found"}
+
+    try:
+        if data.format == "columnar":
+            peers_info = await serialize_peer_columns(handle)
+        else:
+            peers_info = await serialize_peer_info(handle)
+    except Exception:
+        peers_info = empty_columns(PEER_COLUMNS) if data.format == "columnar" else []
+
+    return {
+        "status": "success",
+        "peers": peers_info,
+    }
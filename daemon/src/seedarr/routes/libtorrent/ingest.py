@@ -0,0 +1,54 @@
+import tempfile
+
+from pydantic import BaseModel, Field, field_validator
+
+from seedarr.decorators import validate_payload
+from seedarr.envs import INGEST_CONCURRENCY
+from seedarr.singletons import SIO
+from seedarr.tasks import IngestReport, ingest_torrents
+
+sio = SIO.get_instance()
+
+
+class IngestRequestPayload(BaseModel):
+    magnets: list[str] = Field(default_factory=list)
+    # Raw .torrent files; each message is capped by the Socket.IO buffer size
+    files: list[bytes] = Field(default_factory=list)
+    # .torrent files or directories of them on the daemon's disk
+    paths: list[str] = Field(default_factory=list)
+    save_path: str = Field(default_factory=tempfile.gettempdir)
+    concurrency: int = Field(default=INGEST_CONCURRENCY, ge=1, le=1024)
+
+    @field_validator("save_path", mode="before")
+    @classmethod
+    def set_default_save_path_if_empty(cls, v):
+        if not v or (isinstance(v, str) and v.strip() == ""):
+            return tempfile.gettempdir()
+        return v
+
+
+@sio.on("libtorrent:ingest")  # type: ignore
+@validate_payload(IngestRequestPayload)
+async def ingest(sid: str, data: IngestRequestPayload):
+    """
+    Bulk-add magnet links, .torrent files and directories of .torrent files.
+
+    The caller receives `libtorrent:ingest_progress` events with the running
+    counts while torrents are added; the acknowledgement carries the final
+    report, including the reason each failed source was not added.
+    """
+    if not (data.magnets or data.files or data.paths):
+        return {"status": "error", "message": "Nothing to ingest"}
+
+    async def on_progress(report: IngestReport) -> None:
+        await sio.emit("libtorrent:ingest_progress", report.to_dict(errors=False), to=sid)
+
+    report = await ingest_torrents(
+        data.magnets,
+        data.files,
+        data.paths,
+        data.save_path,
+        concurrency=data.concurrency,
+        on_progress=on_progress,
+    )
+    return {"status": "success", **report.to_dict()}
@@ -1,10 +1,11 @@
 from pydantic import BaseModel, Field
 
 import libtorrent as lt
-from seedarr.datastructures import EventDataclass
+from seedarr.datastructures import EventDataclass, is_info_hash
 from seedarr.decorators import validate_payload
-from seedarr.enums import SyntheticEvent
-from seedarr.singletons import SIO, EventBus, LibtorrentSession
+from seedarr.enums import EventTopic, SyntheticEvent
+from seedarr.singletons import SIO, EventBus, LibtorrentExecutor, LibtorrentSession
+from seedarr.tasks import pause_handle
 
 sio = SIO.get_instance()
 event_bus = EventBus.get_bus()
@@ -16,7 +17,7 @@ async def publish_pause_event(handle: lt.torrent_handle):
         event=SyntheticEvent.PAUSED,
         torrent=handle,
     )
-    await event_bus.publish(event)
+    await event_bus.publish(event, topic=EventTopic.SYNTHETIC)
 
 
 class PauseRequestPayload(BaseModel):
@@ -33,22 +34,14 @@ async def pause(sid: str, data: PauseRequestPayload):
         sid (str): The session ID of the client.
         data (dict): The data sent from the client.
     """
-    ses = await LibtorrentSession.get_session()
-
-    try:
-        ih = lt.sha1_hash(bytes.fromhex(data.info_hash))
-    except ValueError:
+    if not is_info_hash(data.info_hash):
         return {"status": "error", "message": "Invalid info_hash format"}
 
-    handle = ses.find_torrent(ih)
-    if not handle.is_valid():
+    handle = await LibtorrentSession.find_handle(data.info_hash)
+    if handle is None:
         return {"status": "error", "message": "Torrent not found"}
 
-    if not handle.is_paused():
-        handle.auto_managed(False)  # Disable auto-resume
-        handle.set_upload_mode(True)  # Prevent seeding
-        handle.pause()
+    status, message = await LibtorrentExecutor.run("torrent_handle.pause", pause_handle, handle)
+    if status == "success":
         sio.start_background_task(publish_pause_event, handle)
-        return {"status": "success", "message": "Torrent paused and upload disabled"}
-
-    return {"status": "info", "message": "Torrent is already paused"}
+    return {"status": status, "message": message}
@@ -0,0 +1,96 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field, field_validator
+
+from seedarr.datastructures import DEFAULT_FIELDS, ROW_FIELDS, SORT_KEYS
+from seedarr.decorators import validate_payload
+from seedarr.serializers import (
+    TORRENT_COLUMNS,
+    ResponseFormat,
+    encode_rows,
+    serialize_peer_columns,
+    serialize_peer_info,
+)
+from seedarr.singletons import SIO, LibtorrentSession
+
+sio = SIO.get_instance()
+
+
+class QueryTorrentsPayload(BaseModel):
+    category: Literal[
+        "all",
+        "active",
+        "inactive",
+        "completed",
+        "downloading",
+        "uploading",
+        "running",
+        "stopped",
+    ] = Field(default="all")
+    sort_by: str = Field(default="name")
+    descending: bool = Field(default=False)
+    page: int = Field(default=0, ge=0)
+    page_size: int = Field(default=100, ge=1, le=1000)
+    fields: list[str] = Field(default_factory=lambda: list(DEFAULT_FIELDS))
+    format: ResponseFormat = Field(default="rows")
+
+    @field_validator("sort_by")
+    @classmethod
+    def check_sort_key(cls, v):
+        if v not in SORT_KEYS:
+            raise ValueError(f"Cannot sort by '{v}'")
+        return v
+
+    @field_validator("fields")
+    @classmethod
+    def check_fields(cls, v):
+        unknown = [field for field in v if field not in ROW_FIELDS and field != "peers"]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        return v
+
+
+@sio.on("libtorrent:query")  # type: ignore
+@validate_payload(QueryTorrentsPayload)
+async def query(sid: str, data: QueryTorrentsPayload):
+    """
+    Return one page of torrents, filtered by category and sorted on the daemon.
+
+    Only the requested fields are sent. Peer lists are fetched from libtorrent
+    for the rows on the page, and only when "peers" is among the fields.
+    With `format: "columnar"` the page (and each peer list) is a columnar
+    block, see `seedarr.serializers.columnar`.
+    """
+    statuses = await LibtorrentSession.get_status_store()
+
+    start = data.page * data.page_size
+    total, rows = statuses.select(
+        category=data.category,
+        sort_by=data.sort_by,
+        descending=data.descending,
+        limit=start + data.page_size,
+    )
+    rows = rows[start:]
+
+    with_peers = "peers" in data.fields
+    fields = [field for field in data.fields if field != "peers"]
+
+    torrents = []
+    columnar = data.format == "columnar"
+    serialize_peers = serialize_peer_columns if columnar else serialize_peer_info
+    for row in rows:
+        torrent = row.to_dict(fields)
+        if with_peers:
+            handle = await LibtorrentSession.find_handle(row.info_hash)
+            torrent["peers"] = await serialize_peers(handle) if handle else []
+        torrents.append(torrent)
+    if columnar:
+        torrents = encode_rows(torrents, TORRENT_COLUMNS, data.fields)
+
+    return {
+        "status": "success",
+        "torrents": torrents,
+        "total": total,
+        "page": data.page,
+        "page_size": data.page_size,
+    }
@@ -0,0 +1,41 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from seedarr.datastructures import RATE_HISTORY_TIERS
+from seedarr.decorators import validate_payload
+from seedarr.singletons import SIO, LibtorrentSession
+
+sio = SIO.get_instance()
+
+TIER_PERIODS = {name: period for name, period, _ in RATE_HISTORY_TIERS}
+
+
+class RateHistoryPayload(BaseModel):
+    info_hash: str = Field(...)
+    tier: Literal["1s", "1m", "1h"] = Field(default="1s")
+
+
+@sio.on("libtorrent:rate_history")  # type: ignore
+@validate_payload(RateHistoryPayload)
+async def rate_history(sid: str, data: RateHistoryPayload):
+    """
+    Return a torrent's download/upload rate and peer count history at the
+    requested resolution, oldest sample first and `interval` seconds apart,
+    with the smoothed download rate and the ETA derived from it.
+    """
+    history = await LibtorrentSession.get_rate_history()
+    statuses = await LibtorrentSession.get_status_store()
+
+    row = statuses.get(data.info_hash)
+    series = history.series(data.info_hash, data.tier)
+    if row is None or series is None:
+        return {"status": "error", "message": "Torrent not found"}
+
+    return {
+        "status": "success",
+        "interval": TIER_PERIODS[data.tier],
+        **series,
+        "average_download_rate": history.average_download_rate(data.info_hash),
+        "eta": history.eta(row),
+    }
@@ -1,16 +1,16 @@
-import os
-
 from pydantic import BaseModel, Field
 
 import libtorrent as lt
-from seedarr.datastructures import EventDataclass
+from seedarr.datastructures import EventDataclass, is_info_hash
 from seedarr.decorators import validate_payload
-from seedarr.enums import SyntheticEvent
-from seedarr.singletons import SIO, EventBus, FolderLock, LibtorrentSession
+from seedarr.enums import EventTopic, SyntheticEvent
+from seedarr.managers import AlertWaiterManager
+from seedarr.singletons import SIO, EventBus, LibtorrentExecutor, LibtorrentSession
+from seedarr.tasks import expect_removal, release_removed, remove_handle
 
-folder_lock = FolderLock.get_instance()
 sio = SIO.get_instance()
 event_bus = EventBus.get_bus()
+alert_waiter_manager = AlertWaiterManager()
 
 
 async def publish_remove_event(handle: lt.torrent_handle):
@@ -19,7 +19,7 @@ async def publish_remove_event(handle: lt.torrent_handle):
         event=SyntheticEvent.REMOVED,
         torrent=handle,
     )
-    await event_bus.publish(event)
+    await event_bus.publish(event, topic=EventTopic.SYNTHETIC)
 
 
 class RemoveRequestPayload(BaseModel):
@@ -35,17 +35,23 @@ async def remove(sid: str, data: RemoveRequestPayload):
     if not data.info_hash:
         return {"status": "error", "message": "Missing 'info_hash'"}
 
-    try:
-        ih = lt.sha1_hash(bytes.fromhex(data.info_hash))
-    except ValueError:
+    if not is_info_hash(data.info_hash):
         return {"status": "error", "message": "Invalid info_hash format"}
 
-    handle = ses.find_torrent(ih)
-    if not handle.is_valid():
+    handle = await LibtorrentSession.find_handle(data.info_hash)
+    if handle is None:
         return {"status": "error", "message": "Torrent not found"}
 
     flags = lt.options_t.delete_files if data.remove_data else 0
-    ses.remove_torrent(handle, flags)
-    await folder_lock.remove_folder(os.path.join(handle.save_path(), handle.name()))
+
+    removal = expect_removal(data.info_hash)
+    try:
+        removed = await LibtorrentExecutor.run(
+            "session.remove_torrent", remove_handle, ses, handle, flags
+        )
+    except Exception:
+        alert_waiter_manager.discard(removal)
+        raise
+    await release_removed(removed, removal)
     sio.start_background_task(publish_remove_event, handle)
     return {"status": "success", "message": "Torrent removed"}
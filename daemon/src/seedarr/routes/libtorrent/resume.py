@@ -1,10 +1,11 @@
 from pydantic import BaseModel, Field
 
 import libtorrent as lt
-from seedarr.datastructures import EventDataclass
+from seedarr.datastructures import EventDataclass, is_info_hash
 from seedarr.decorators import validate_payload
-from seedarr.enums import SyntheticEvent
-from seedarr.singletons import SIO, EventBus, LibtorrentSession
+from seedarr.enums import EventTopic, SyntheticEvent
+from seedarr.singletons import SIO, EventBus, LibtorrentExecutor, LibtorrentSession
+from seedarr.tasks import resume_handle
 
 sio = SIO.get_instance()
 event_bus = EventBus.get_bus()
@@ -16,7 +17,7 @@ async def publish_resume_event(handle: lt.torrent_handle):
         event=SyntheticEvent.RESUMED,
         torrent=handle,
     )
-    await event_bus.publish(event)
+    await event_bus.publish(event, topic=EventTopic.SYNTHETIC)
 
 
 class ResumeRequestPayload(BaseModel):
@@ -35,22 +36,14 @@ async def resume(sid: str, data: ResumeRequestPayload):
             Expected keys:
             - info_hash (str): The hex string of the torrent's info hash.
     """
-    ses = await LibtorrentSession.get_session()
-
-    try:
-        ih = lt.sha1_hash(bytes.fromhex(data.info_hash))
-    except ValueError:
+    if not is_info_hash(data.info_hash):
         return {"status": "error", "message": "Invalid info_hash format"}
 
-    handle = ses.find_torrent(ih)
-    if not handle.is_valid():
+    handle = await LibtorrentSession.find_handle(data.info_hash)
+    if handle is None:
         return {"status": "error", "message": "Torrent not found"}
 
-    if handle.is_paused():
-        handle.set_upload_mode(False)  # Re-enable uploading
-        handle.auto_managed(True)  # Re-enable auto management
-        handle.resume()
+    status, message = await LibtorrentExecutor.run("torrent_handle.resume", resume_handle, handle)
+    if status == "success":
         sio.start_background_task(publish_resume_event, handle)
-        return {"status": "success", "message": "Torrent resumed and upload enabled"}
-
-    return {"status": "info", "message": "Torrent is already active"}
+    return {"status": status, "message": message}
@@ -1,3 +1,19 @@
-from .files import serialize_file_info as serialize_file_info
+from .columnar import (
+    FILE_COLUMNS as FILE_COLUMNS,
+    PEER_COLUMNS as PEER_COLUMNS,
+    TORRENT_COLUMNS as TORRENT_COLUMNS,
+    ResponseFormat as ResponseFormat,
+    empty_columns as empty_columns,
+    encode_columns as encode_columns,
+    encode_rows as encode_rows,
+)
+from .files import (
+    serialize_file_columns as serialize_file_columns,
+    serialize_file_info as serialize_file_info,
+)
 from .magnet import serialize_magnet_torrent_info as serialize_magnet_torrent_info
-from .peers import serialize_peer_info as serialize_peer_info
+from .peers import (
+    serialize_peer_columns as serialize_peer_columns,
+    serialize_peer_info as serialize_peer_info,
+)
+from .trackers import serialize_tracker_info as serialize_tracker_info
@@ -0,0 +1,143 @@
+"""
+Columnar encoding of list responses, sent instead of a list of dicts when a
+request asks for `format: "columnar"`:
+
+    {
+        "count": 3,
+        "columns": {
+            "size": {"type": "int64", "data": <bin>},
+            "progress": {"type": "float32", "data": <bin>},
+            "seed": {"type": "bool", "data": <bin>},
+            "client": {"type": "str", "data": ["a", "b", "c"]},
+            "path": {"type": "path", "shared": <bin>, "data": ["x/a", "b", "c"]},
+        },
+    }
+
+Numeric and boolean columns are msgpack bin holding little-endian int64,
+float32 or uint8 values. A "path" column stores, per row, how many leading
+"/"-separated segments it shares with the previous row (uint32, in
+`shared`) and the rest of the path in `data`: "x/a", "x/b", "x/c" is sent
+as shared [0, 1, 1] and data ["x/a", "b", "c"].
+"""
+
+import sys
+from array import array
+from typing import Iterable, Literal, Mapping, Sequence
+
+# The `format` requests may ask for; "rows" is a list of dicts
+ResponseFormat = Literal["rows", "columnar"]
+
+# Packed column type -> array typecode
+PACKED_TYPES = {"int64": "q", "float32": "f", "bool": "B"}
+
+FILE_COLUMNS = {
+    "index": "int64",
+    "path": "path",
+    "name": "str",
+    "size": "int64",
+    "offset": "int64",
+    "progress": "int64",
+    "remaining": "int64",
+    "priority": "int64",
+}
+
+PEER_COLUMNS = {
+    "ip": "str",
+    "port": "int64",
+    "client": "str",
+    "connection_type": "str",
+    "progress": "float32",
+    "flags": "int64",
+    "download_queue_length": "int64",
+    "upload_queue_length": "int64",
+    "up_speed": "int64",
+    "down_speed": "int64",
+    "total_download": "int64",
+    "total_upload": "int64",
+    "seed": "bool",
+    "country_code": "str",
+    "country": "str",
+}
+
+# Torrent listing fields (see ROW_FIELDS); "peers" holds a peer block per row
+TORRENT_COLUMNS = {
+    "name": "str",
+    "info_hash": "str",
+    "progress": "float32",
+    "state": "str",
+    "paused": "bool",
+    "finished": "bool",
+    "total_download": "int64",
+    "total_size": "int64",
+    "download_rate": "int64",
+    "upload_rate": "int64",
+    "num_peers": "int64",
+    "num_seeds": "int64",
+    "seeders": "int64",
+    "added_time": "int64",
+    "completed_time": "int64",
+    "peers": "columnar",
+}
+
+
+def pack(values: Iterable, column_type: str) -> bytes:
+    packed = array(PACKED_TYPES[column_type], values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def share_paths(paths: Iterable[str]) -> tuple[bytes, list[str]]:
+    """Split paths into shared leading segment counts and remaining suffixes."""
+    shared = array("I")
+    suffixes = []
+    previous: list[str] = []
+    for path in paths:
+        segments = path.split("/")
+        common = 0
+        for mine, theirs in zip(segments, previous):
+            if mine != theirs:
+                break
+            common += 1
+        shared.append(common)
+        suffixes.append("/".join(segments[common:]))
+        previous = segments
+    if sys.byteorder == "big":
+        shared.byteswap()
+    return shared.tobytes(), suffixes
+
+
+def encode_column(values: Sequence, column_type: str) -> dict:
+    if column_type == "path":
+        shared, suffixes = share_paths(values)
+        return {"type": "path", "shared": shared, "data": suffixes}
+    if column_type in PACKED_TYPES:
+        return {"type": column_type, "data": pack(values, column_type)}
+    return {"type": column_type, "data": list(values)}
+
+
+def encode_columns(columns: Mapping[str, Sequence], types: Mapping[str, str]) -> dict:
+    """Encode equally long `columns` by name, typed from `types`."""
+    count = len(next(iter(columns.values()), ()))
+    return {
+        "count": count,
+        "columns": {
+            name: encode_column(values, types.get(name, "str")) for name, values in columns.items()
+        },
+    }
+
+
+def empty_columns(types: Mapping[str, str]) -> dict:
+    return encode_columns({name: [] for name in types}, types)
+
+
+def encode_rows(
+    rows: Sequence[dict], types: Mapping[str, str], names: Iterable[str] | None = None
+) -> dict:
+    """
+    Encode a list of dicts with the same keys. Columns are `names`, or the
+    keys of the first row (every key in `types` when there are no rows).
+    """
+    if names is None:
+        names = rows[0].keys() if rows else types.keys()
+    return encode_columns({name: [row[name] for row in rows] for name in names}, types)
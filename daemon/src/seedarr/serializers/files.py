@@ -1,52 +1,69 @@
-import os
+from typing import Callable, TypeVar
 
-import anyio
-import anyio.to_thread
 import libtorrent as lt
 
+from seedarr.datastructures import FileTable
+from seedarr.singletons import LibtorrentExecutor, LibtorrentSession
+
+from .columnar import FILE_COLUMNS, empty_columns, encode_columns
+
+T = TypeVar("T")
+
+
+async def _with_file_table(
+    handle: lt.torrent_handle,
+    build: Callable[[FileTable, list[int], list[int]], T],
+    empty: T,
+) -> T:
+    """
+    Call `build(table, progress, priorities)` in one libtorrent worker hop.
+
+    Paths, sizes and offsets come from a `FileTable` cached per info-hash;
+    only progress and priorities are read from libtorrent on each call.
+    Returns `empty` while the torrent has no metadata.
+    """
+    tables = await LibtorrentSession.get_file_tables()
+
+    def collect() -> tuple[str, FileTable | None, T]:
+        info_hash = str(handle.info_hashes().get_best())
+        # Only read here; the cache is reordered and filled on the event loop
+        files = tables.peek(info_hash)
+        if files is None:
+            torrent_info = handle.torrent_file()
+            if torrent_info is None:
+                # No metadata yet
+                return info_hash, None, empty
+            files = FileTable(torrent_info.files())
+
+        try:
+            progress = handle.file_progress()
+        except Exception:
+            progress = [0] * len(files)
+
+        try:
+            priorities = handle.file_priorities()
+        except Exception:
+            priorities = [0] * len(files)
+
+        return info_hash, files, build(files, progress, priorities)
+
+    info_hash, files, result = await LibtorrentExecutor.run("torrent_handle.file_progress", collect)
+    if files is not None:
+        tables.put(info_hash, files)
+    return result
+
 
 async def serialize_file_info(handle: lt.torrent_handle) -> list[dict]:
-    fs = handle.get_torrent_info().files()
-    num_files = fs.num_files()
-
-    try:
-        file_progress = await anyio.to_thread.run_sync(handle.file_progress)
-    except Exception:
-        file_progress = [0] * num_files
-
-    try:
-        file_priorities = await anyio.to_thread.run_sync(handle.file_priorities)
-    except Exception:
-        file_priorities = [0] * num_files
-
-    results = []
-    lock = anyio.Lock()
-
-    async with anyio.create_task_group() as tg:
-
-        async def run_and_store(idx: int):
-            def extract():
-                full_path = fs.file_path(idx)
-                size = fs.file_size(idx)
-                progress = file_progress[idx]
-                remaining = size - progress
-
-                return {
-                    "index": idx,
-                    "path": str(full_path),
-                    "name": os.path.basename(full_path),
-                    "size": int(size),
-                    "offset": int(fs.file_offset(idx)),
-                    "progress": int(progress),
-                    "remaining": int(remaining),
-                    "priority": int(file_priorities[idx]),
-                }
-
-            res = await anyio.to_thread.run_sync(extract)
-            async with lock:
-                results.append(res)
-
-        for idx in range(num_files):
-            tg.start_soon(run_and_store, idx)
-
-    return results
+    """One torrent's files in index order."""
+    return await _with_file_table(handle, FileTable.rows, [])
+
+
+async def serialize_file_columns(handle: lt.torrent_handle) -> dict:
+    """One torrent's files as a columnar block (see `seedarr.serializers.columnar`)."""
+    return await _with_file_table(
+        handle,
+        lambda table, progress, priorities: encode_columns(
+            table.columns(progress, priorities), FILE_COLUMNS
+        ),
+        empty_columns(FILE_COLUMNS),
+    )
@@ -1,87 +1,50 @@
-import anyio
-import anyio.to_thread
 import libtorrent as lt
 
+from seedarr.datastructures import MISSING_METADATA
+from seedarr.singletons import LibtorrentExecutor, LibtorrentSession
+
 
 async def serialize_magnet_torrent_info(handle: lt.torrent_handle) -> dict:
-    ti = await anyio.to_thread.run_sync(handle.get_torrent_info)
-    status = await anyio.to_thread.run_sync(handle.status)
+    """
+    One torrent's general info. Metadata fields are cached per info-hash and
+    status fields come from the status store, so only the handle's live
+    tracker list is read from libtorrent on every call.
+    """
+    status = await LibtorrentSession.get_status_row(handle)
+    metadata = await LibtorrentSession.get_metadata(handle)
 
-    downloaded = (
-        status.all_time_download or status.total_done or status.total_wanted_done or 0
-    )
-    uploaded = status.all_time_upload or 0
+    downloaded = status.all_time_download or status.total_done or status.total_wanted_done or 0
 
     info = {
-        "info_hash": str(handle.info_hash()),
+        "info_hash": status.info_hash,
         "progress": round(status.progress * 100, 2),
         "download_rate": int(status.download_rate),
         "upload_rate": int(status.upload_rate),
         "num_peers": int(status.num_peers),
         "seeds": int(status.num_seeds),
-        "state": "metadata_present" if ti else "metadata_missing",
-        "save_path": handle.save_path(),
+        "state": "metadata_present" if metadata else "metadata_missing",
+        "save_path": status.save_path,
         "added_time": int(status.added_time),
         "completion_time": int(status.completed_time) if status.is_finished else None,
         "downloaded": int(downloaded),
-        "uploaded": int(uploaded),
+        "uploaded": int(status.all_time_upload or 0),
         "connections": int(status.num_connections),
         "wasted": int(status.total_failed_bytes),
         "active_time": int(status.active_time),
         "seeding_time": int(status.seeding_time),
         "finished": bool(status.is_finished),
-        "next_announce": int(status.next_announce.total_seconds()),
+        "next_announce": status.next_announce,
         "connected_seeds": int(status.num_seeds),
         "connected_leeches": int(status.num_peers - status.num_seeds),
-        "total_known_peers": len(handle.get_peer_info()),
+        "total_known_peers": int(status.list_peers),
     }
 
-    if not ti:
-        info.update(
-            {
-                "name": None,
-                "comment": None,
-                "creator": None,
-                "info_hash_v2": None,
-                "total_size": None,
-                "piece_length": None,
-                "num_pieces": None,
-                "is_private": None,
-                "creation_date": None,
-                "num_files": None,
-                "metadata_size": None,
-                "files": [],
-                "trackers": [],
-                "nodes": [],
-                "url_seeds": [],
-                "http_seeds": [],
-            }
-        )
+    if metadata is None:
+        info.update(MISSING_METADATA)
         return info
 
+    info.update(metadata.fields)
     # nodes = [{"host": host, "port": port} for host, port in ti.nodes()]
-    trackers = list(ti.trackers()) + handle.trackers()
-
-    info.update(
-        {
-            "name": ti.name(),
-            "comment": ti.comment(),
-            "creator": ti.creator(),
-            "info_hash_v2": str(ti.info_hashes().v2)
-            if ti.info_hashes().has_v2()
-            else None,
-            "total_size": int(ti.total_size()),
-            "piece_length": int(ti.piece_length()),
-            "num_pieces": int(ti.num_pieces()),
-            "is_private": bool(ti.priv()),
-            "creation_date": int(ti.creation_date()),
-            "num_files": int(ti.num_files()),
-            "metadata_size": int(ti.metadata_size()),
-            "trackers": trackers,
-            # "nodes": nodes,
-            "url_seeds": getattr(ti, "url_seeds", lambda: [])(),
-            "http_seeds": getattr(ti, "http_seeds", lambda: [])(),
-        }
-    )
+    info["trackers"] = metadata.trackers + await LibtorrentExecutor.call(handle, "trackers")
 
     return info
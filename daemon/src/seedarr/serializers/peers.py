@@ -1,7 +1,9 @@
 import anyio
 import libtorrent as lt
 
-from seedarr.singletons import Logger
+from seedarr.singletons import GeoIP, LibtorrentExecutor, Logger
+
+from .columnar import PEER_COLUMNS, encode_rows
 
 
 def infer_connection_type(flags: int) -> str:
@@ -22,7 +24,7 @@ async def serialize_peer_info(handle: lt.torrent_handle) -> list[dict]:
     logger = Logger.get_logger()
 
     try:
-        peers = handle.get_peer_info()
+        peers = await LibtorrentExecutor.call(handle, "get_peer_info")
     except Exception as e:
         logger.error(f"Failed to get peer info: {e}")
         return []
@@ -33,8 +35,9 @@ async def serialize_peer_info(handle: lt.torrent_handle) -> list[dict]:
     async def run_and_store(p: lt.peer_info):
         try:
             seed = bool(p.flags & lt.peer_info.seed)
+            ip = str(p.ip[0])
             result = {
-                "ip": str(p.ip[0]),
+                "ip": ip,
                 "port": int(p.ip[1]),
                 "client": p.client.decode("utf-8", "ignore"),
                 "connection_type": infer_connection_type(p.flags),
@@ -48,6 +51,10 @@ async def serialize_peer_info(handle: lt.torrent_handle) -> list[dict]:
                 "total_upload": int(p.total_upload),
                 "seed": seed,
             }
+            # Only sent when a GeoIP database is configured
+            country = GeoIP.country(ip)
+            if country is not None:
+                result["country_code"], result["country"] = country
             async with lock:
                 results.append(result)
         except Exception as ex:
@@ -58,3 +65,8 @@ async def serialize_peer_info(handle: lt.torrent_handle) -> list[dict]:
             tg.start_soon(run_and_store, p)
 
     return results
+
+
+async def serialize_peer_columns(handle: lt.torrent_handle) -> dict:
+    """One torrent's peers as a columnar block (see `seedarr.serializers.columnar`)."""
+    return encode_rows(await serialize_peer_info(handle), PEER_COLUMNS)
@@ -0,0 +1,7 @@
+import libtorrent as lt
+
+from seedarr.singletons import LibtorrentExecutor
+
+
+async def serialize_tracker_info(handle: lt.torrent_handle) -> list[dict]:
+    return await LibtorrentExecutor.call(handle, "trackers")
@@ -1,5 +1,8 @@
+from .database import Database as Database
 from .event_bus import EventBus as EventBus
 from .folder_lock import FolderLock as FolderLock
+from .geoip import GeoIP as GeoIP
 from .libtorrent import LibtorrentSession as LibtorrentSession
+from .libtorrent_executor import LibtorrentExecutor as LibtorrentExecutor
 from .logger import Logger as Logger
 from .sio import SIO as SIO
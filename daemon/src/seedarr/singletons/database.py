@@ -0,0 +1,53 @@
+import os
+from typing import Optional, Type
+
+import aiosqlite
+import anyio
+
+from seedarr.envs import DATABASE_PATH
+from seedarr.orm import TABLES
+
+
+class Database:
+    _instance: Optional["Database"] = None
+    _lock = anyio.Lock()
+
+    def __init__(self) -> None:
+        self.connection: Optional[aiosqlite.Connection] = None
+
+    @classmethod
+    async def init(cls: Type["Database"], path: str = DATABASE_PATH) -> None:
+        async with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            if cls._instance.connection is not None:
+                return
+
+            if path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+            connection = await aiosqlite.connect(path)
+            # WAL lets reads proceed during the batched resume-data writes, and
+            # NORMAL sync is durable across application crashes in WAL mode
+            await connection.execute("PRAGMA journal_mode=WAL")
+            await connection.execute("PRAGMA synchronous=NORMAL")
+            for table in TABLES:
+                await table.create(connection)
+            await connection.commit()
+            cls._instance.connection = connection
+
+    @classmethod
+    async def get_connection(cls) -> aiosqlite.Connection:
+        if cls._instance is None or cls._instance.connection is None:
+            await cls.init()
+        if cls._instance is None or cls._instance.connection is None:
+            raise RuntimeError("Database is not initialized.")
+        return cls._instance.connection
+
+    @classmethod
+    async def close(cls) -> None:
+        async with cls._lock:
+            if cls._instance is None or cls._instance.connection is None:
+                return
+            await cls._instance.connection.close()
+            cls._instance.connection = None
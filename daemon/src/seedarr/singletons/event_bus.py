@@ -1,17 +1,276 @@
 import asyncio
+import time
 import traceback
-from typing import Any, Awaitable, Callable, Optional
+from collections import deque
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Optional,
+)
+
+import anyio
+from anyio.abc import TaskGroup
+
+from seedarr.datastructures import LatencyHistogram
+from seedarr.enums import EventTopic, OverflowPolicy
+from seedarr.envs import EVENT_BUS_CAPACITY
 
 from .logger import Logger
 
+Consumer = Callable[[Any], Awaitable[None]]
+
+
+def event_type(event: Any) -> Optional[str]:
+    """The alert or synthetic event type of a bus event, e.g. "synthetic:paused"."""
+    if isinstance(event, dict):
+        return event.get("type")
+    return getattr(event, "type", None)
+
+
+class _Entry:
+    __slots__ = ("event", "key", "droppable", "enqueued")
+
+    def __init__(self, event: Any, key: Optional[Hashable], droppable: bool) -> None:
+        self.event = event
+        self.key = key
+        self.droppable = droppable
+        self.enqueued = time.monotonic()
+
+
+class Subscriber:
+    """
+    One consumer of the EventBus with its own bounded queue and task, so a
+    slow consumer only ever backs up itself.
+
+    When `capacity` events are waiting, an event's `OverflowPolicy` decides:
+    BLOCK waits for the consumer, DROP_OLDEST evicts the oldest waiting event
+    and COALESCE merges into the waiting event with the same key (falling
+    back to DROP_OLDEST when there is none). Events published with BLOCK are
+    never evicted; when nothing else is waiting the new event is dropped.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        consumer: Consumer,
+        topics: Optional[FrozenSet[EventTopic]],
+        types: Optional[FrozenSet[str]],
+        capacity: int,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("EventBus capacity must be at least 1")
+        self.name = name
+        self.consumer = consumer
+        self.topics = topics
+        self.types = types
+        self.capacity = capacity
+        self._queue: Deque[_Entry] = deque()
+        self._pending: Dict[Hashable, _Entry] = {}
+        self._has_events = asyncio.Event()
+        self._not_full = asyncio.Condition()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._stopping = False
+
+        self._published = 0
+        self._consumed = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._blocked = 0
+        self._max_depth = 0
+        self._latency_last = 0.0
+        self._latency_max = 0.0
+        self._latency_total = 0.0
+        # Enqueue-to-consume wait and time spent in the consumer
+        self.wait_histogram = LatencyHistogram()
+        self.handle_histogram = LatencyHistogram()
+
+    def select(self, event: Any, topic: EventTopic) -> Any:
+        """
+        Return the part of `event` this subscriber wants, or None.
+
+        Batches (lists) are narrowed to the events of the subscribed types.
+        """
+        if self.topics is not None and topic not in self.topics:
+            return None
+        if self.types is None:
+            return event
+        if isinstance(event, list):
+            selected = [item for item in event if event_type(item) in self.types]
+            return selected or None
+        return event if event_type(event) in self.types else None
+
+    def offer(
+        self,
+        event: Any,
+        policy: OverflowPolicy,
+        key: Optional[Hashable],
+        merge: Optional[Callable[[Any, Any], Any]],
+    ) -> bool:
+        """
+        Queue `event` without waiting. Returns False when it has to BLOCK,
+        in which case the caller awaits `put`.
+        """
+        if policy is OverflowPolicy.COALESCE:
+            waiting = self._pending.get(key)
+            if waiting is not None:
+                waiting.event = event if merge is None else merge(waiting.event, event)
+                self._coalesced += 1
+                return True
+
+        droppable = policy is not OverflowPolicy.BLOCK
+        if len(self._queue) >= self.capacity:
+            if not droppable:
+                return False
+            if not self._drop_oldest():
+                self._dropped += 1
+                return True
+
+        self._append(event, key, droppable)
+        return True
+
+    async def put(self, event: Any, key: Optional[Hashable]) -> None:
+        self._blocked += 1
+        async with self._not_full:
+            await self._not_full.wait_for(lambda: len(self._queue) < self.capacity)
+        self._append(event, key, droppable=False)
+
+    def _append(self, event: Any, key: Optional[Hashable], droppable: bool) -> None:
+        entry = _Entry(event, key, droppable)
+        self._queue.append(entry)
+        if key is not None:
+            self._pending[key] = entry
+        self._published += 1
+        self._max_depth = max(self._max_depth, len(self._queue))
+        self._idle.clear()
+        self._has_events.set()
+
+    def _drop_oldest(self) -> bool:
+        for entry in self._queue:
+            if entry.droppable:
+                break
+        else:
+            return False
+
+        self._queue.remove(entry)
+        if entry.key is not None and self._pending.get(entry.key) is entry:
+            del self._pending[entry.key]
+        self._dropped += 1
+        return True
+
+    async def _next(self) -> Optional[_Entry]:
+        while not self._queue:
+            if self._stopping:
+                return None
+            self._has_events.clear()
+            await self._has_events.wait()
+
+        entry = self._queue.popleft()
+        if entry.key is not None and self._pending.get(entry.key) is entry:
+            del self._pending[entry.key]
+
+        async with self._not_full:
+            self._not_full.notify()
+
+        latency = time.monotonic() - entry.enqueued
+        self._consumed += 1
+        self._latency_last = latency
+        self._latency_max = max(self._latency_max, latency)
+        self._latency_total += latency
+        self.wait_histogram.observe(latency)
+        return entry
+
+    async def run(self) -> None:
+        logger = Logger.get_logger()
+        logger.info(f"EventBus consumer '{self.name}' started.")
+
+        while True:
+            try:
+                entry = await self._next()
+                if entry is None:
+                    break
+
+                started = time.monotonic()
+                try:
+                    await self.consumer(entry.event)
+                except asyncio.CancelledError:
+                    logger.info(f"EventBus consumer '{self.name}' cancelled.")
+                    raise
+                except Exception as e:
+                    traceback.print_exception(e)
+                    logger.exception(f"Error while '{self.name}' handled event {entry.event}: {e}")
+                finally:
+                    self.handle_histogram.observe(time.monotonic() - started)
+            except asyncio.CancelledError:
+                raise
+            except Exception as outer:
+                logger.exception(f"Unexpected error in EventBus consumer '{self.name}': {outer}")
+            finally:
+                if not self._queue:
+                    self._idle.set()
+
+        logger.info(f"EventBus consumer '{self.name}' stopped.")
+
+    async def join(self) -> None:
+        """Wait until every queued event has been handled."""
+        await self._idle.wait()
+
+    def stop(self) -> None:
+        """Stop once the events already queued are handled."""
+        self._stopping = True
+        # Wake up the consumer if it's waiting
+        self._has_events.set()
+
+    def stats(self) -> dict:
+        return {
+            "topics": None if self.topics is None else sorted(t.value for t in self.topics),
+            "types": None if self.types is None else sorted(self.types),
+            "capacity": self.capacity,
+            "depth": len(self._queue),
+            "max_depth": self._max_depth,
+            "published": self._published,
+            "consumed": self._consumed,
+            "dropped": self._dropped,
+            "coalesced": self._coalesced,
+            "blocked": self._blocked,
+            "latency_ms": {
+                "last": self._latency_last * 1e3,
+                "max": self._latency_max * 1e3,
+                "mean": self._latency_total / self._consumed * 1e3 if self._consumed else 0.0,
+            },
+            "wait": self.wait_histogram.to_dict(),
+            "handle": self.handle_histogram.to_dict(),
+        }
+
+    def __repr__(self):
+        return (
+            f"<Subscriber {self.name} depth={len(self._queue)}/{self.capacity} "
+            f"dropped={self._dropped}>"
+        )
+
 
 class EventBus:
+    """
+    Publish/subscribe hub for alert batches and synthetic events.
+
+    Events are published on an `EventTopic`. Every consumer subscribed to
+    that topic (and, optionally, to the event's type) gets its own copy
+    through its own `Subscriber` queue and task.
+    """
+
     _instance: Optional["EventBus"] = None
 
     _initialized: bool
     _running: bool
-    queue: asyncio.Queue
-    _consumer: Optional[Callable[[Any], Awaitable[None]]]
+    _subscribers: Dict[str, Subscriber]
+    _task_group: Optional[TaskGroup]
+    _stopped: asyncio.Event
 
     def __new__(cls):
         if cls._instance is None:
@@ -31,67 +290,134 @@ class EventBus:
         instance = cls.get_bus()
         if instance._initialized:
             return
-        instance.queue = asyncio.Queue()
-        instance._consumer = None
+        instance._subscribers = {}
+        instance._task_group = None
+        instance._stopped = asyncio.Event()
         instance._running = False
         instance._initialized = True
 
-    def set_consumer(self, consumer: Callable[[Any], Awaitable[None]]):
+    def subscribe(
+        self,
+        name: str,
+        consumer: Consumer,
+        topics: Optional[Iterable[EventTopic]] = None,
+        types: Optional[Iterable[str]] = None,
+        capacity: int = EVENT_BUS_CAPACITY,
+    ) -> Subscriber:
+        """
+        Register `consumer` under `name`. `topics` limits it to some topics
+        and `types` to some alert or synthetic event types (e.g.
+        "libtorrent:torrent_finished"); both default to everything.
+        """
+        if not self._initialized:
+            raise RuntimeError("Call EventBus.init() before subscribing")
+        if name in self._subscribers:
+            raise RuntimeError(f"A consumer named '{name}' is already subscribed")
+
+        subscriber = Subscriber(
+            name,
+            consumer,
+            None if topics is None else frozenset(topics),
+            None if types is None else frozenset(types),
+            capacity,
+        )
+        self._subscribers[name] = subscriber
+        if self._task_group is not None:
+            self._task_group.start_soon(subscriber.run)
+        return subscriber
+
+    def unsubscribe(self, name: str):
         if not self._initialized:
-            raise RuntimeError("Call EventBus.init() before setting consumer")
-        if self._consumer is not None:
-            raise RuntimeError("Consumer is already set and cannot be replaced")
-        self._consumer = consumer
+            raise RuntimeError("Call EventBus.init() before unsubscribing")
+        subscriber = self._subscribers.pop(name, None)
+        if subscriber is None:
+            raise RuntimeError(f"No consumer named '{name}' is subscribed")
+        subscriber.stop()
 
-    def remove_consumer(self):
+    async def join(self, name: str):
+        """Wait until consumer `name` has handled every event queued for it."""
         if not self._initialized:
-            raise RuntimeError("Call EventBus.init() before removing consumer")
-        if self._consumer is None:
-            raise RuntimeError("No consumer is set to remove")
-        self._consumer = None
+            raise RuntimeError("Call EventBus.init() before joining a consumer")
+        subscriber = self._subscribers.get(name)
+        if subscriber is None:
+            raise RuntimeError(f"No consumer named '{name}' is subscribed")
+        await subscriber.join()
+
+    async def publish(
+        self,
+        event: Any,
+        topic: EventTopic,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        key: Optional[Hashable] = None,
+        merge: Optional[Callable[[Any, Any], Any]] = None,
+    ):
+        """
+        Hand `event` to every consumer subscribed to `topic`.
 
-    async def publish(self, event: Any):
+        With COALESCE, an event already waiting under `key` in a consumer's
+        queue is replaced by `merge(waiting, event)` (or by `event` when
+        `merge` is None) and keeps its place in that queue. Consumers with
+        room are served first, so one full queue that BLOCKs does not delay
+        the others.
+        """
         if not self._initialized:
             raise RuntimeError("Call EventBus.init() before publishing events")
-        await self.queue.put(event)
+        if policy is OverflowPolicy.COALESCE and key is None:
+            raise ValueError("COALESCE needs a key")
+
+        blocked = []
+        for subscriber in list(self._subscribers.values()):
+            selected = subscriber.select(event, topic)
+            if selected is None:
+                continue
+            if not subscriber.offer(selected, policy, key, merge):
+                blocked.append((subscriber, selected))
+
+        for subscriber, selected in blocked:
+            await subscriber.put(selected, key)
 
     async def start(self):
         if not self._initialized:
             raise RuntimeError("Call EventBus.init() before starting the bus")
-        if not self._consumer:
-            raise RuntimeError("Consumer not set")
 
         logger = Logger.get_logger()
         self._running = True
+        self._stopped.clear()
 
         logger.info("EventBus started.")
 
-        while self._running:
-            try:
-                event = await self.queue.get()
-                if event is None:
-                    # Special signal to stop the loop
-                    logger.info("EventBus received shutdown signal.")
-                    break
+        async with anyio.create_task_group() as task_group:
+            self._task_group = task_group
+            for subscriber in self._subscribers.values():
+                task_group.start_soon(subscriber.run)
 
-                try:
-                    await self._consumer(event)
-                except asyncio.CancelledError:
-                    logger.info("EventBus task cancelled.")
-                    raise
-                except Exception as e:
-                    traceback.print_exception(e)
-                    logger.exception(f"Error while handling event {event}: {e}")
-            except Exception as outer:
-                logger.exception(f"Unexpected error in EventBus loop: {outer}")
+            await self._stopped.wait()
+            for subscriber in self._subscribers.values():
+                subscriber.stop()
 
+        self._task_group = None
+        self._running = False
         logger.info("EventBus stopped.")
 
     def stop(self):
+        """Stop every consumer once the events already queued are handled."""
         if not self._initialized:
             raise RuntimeError("Call EventBus.init() before stopping the bus")
         if not self._running:
             return
-        self._running = False
-        # Wake up the queue if it's waiting
-        self.queue.put_nowait(None)
+        self._stopped.set()
+
+    def stats(self) -> dict:
+        if not self._initialized:
+            raise RuntimeError("Call EventBus.init() before reading stats")
+        return {name: subscriber.stats() for name, subscriber in self._subscribers.items()}
+
+    def subscribers(self) -> Dict[str, Subscriber]:
+        if not self._initialized:
+            raise RuntimeError("Call EventBus.init() before reading subscribers")
+        return dict(self._subscribers)
+
+    def __repr__(self):
+        if not self._initialized:
+            return "<EventBus uninitialized>"
+        return f"<EventBus consumers={list(self._subscribers)}>"
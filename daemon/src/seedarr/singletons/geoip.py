@@ -0,0 +1,82 @@
+import functools
+from typing import Optional, Tuple, Type
+
+from seedarr.envs import GEOIP_CACHE_SIZE, GEOIP_DATABASE_PATH
+
+from .logger import Logger
+
+try:
+    import maxminddb
+except ImportError:  # The "geoip" extra; without it peers are not enriched
+    maxminddb = None
+
+# (ISO 3166 code, English name), either None when unknown
+Country = Tuple[Optional[str], Optional[str]]
+
+
+class GeoIP:
+    """
+    Resolves peer IPs to countries from a local MaxMind `.mmdb` file read
+    through a memory map. Results, misses included, live in one LRU shared
+    by every torrent and client, so each address is resolved once per
+    daemon rather than once per browser per poll.
+    """
+
+    _instance: Optional["GeoIP"] = None
+
+    def __init__(self, reader, cache_size: int) -> None:
+        self._reader = reader
+        self._lookup = functools.lru_cache(maxsize=cache_size)(self._resolve)
+
+    @classmethod
+    def init(
+        cls: Type["GeoIP"], path: str = GEOIP_DATABASE_PATH, cache_size: int = GEOIP_CACHE_SIZE
+    ) -> None:
+        if cls._instance is not None or not path:
+            return
+
+        logger = Logger.get_logger()
+        if maxminddb is None:
+            logger.warning(
+                "GEOIP_DATABASE_PATH is set but maxminddb is not installed (seedarr[geoip])"
+            )
+            return
+
+        try:
+            reader = maxminddb.open_database(path, maxminddb.MODE_MMAP)
+        except (OSError, maxminddb.InvalidDatabaseError) as e:
+            logger.error(f"Could not open GeoIP database {path}: {e}")
+            return
+
+        cls._instance = cls(reader, cache_size)
+        logger.info(f"Resolving peer countries from {path}")
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return cls._instance is not None
+
+    @classmethod
+    def country(cls, ip: str) -> Optional[Country]:
+        """The country of `ip`, or None when no database is loaded."""
+        if cls._instance is None:
+            return None
+        return cls._instance._lookup(ip)
+
+    def _resolve(self, ip: str) -> Country:
+        try:
+            record = self._reader.get(ip)
+        except ValueError:
+            # Not an IP address
+            return None, None
+        if not isinstance(record, dict):
+            return None, None
+        country = record.get("country") or record.get("registered_country") or {}
+        return country.get("iso_code"), country.get("names", {}).get("en")
+
+    @classmethod
+    def close(cls) -> None:
+        if cls._instance is None:
+            return
+        cls._instance._lookup.cache_clear()
+        cls._instance._reader.close()
+        cls._instance = None
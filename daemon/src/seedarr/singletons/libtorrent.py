@@ -1,10 +1,22 @@
 import threading
+import time
 from pprint import pprint
-from typing import Optional, Type
+from typing import Dict, Iterable, List, Optional, Type
 
 import anyio
 import libtorrent as lt
-from anyio import to_thread
+
+from seedarr.datastructures import (
+    FileTableCache,
+    HandleIndex,
+    RateHistory,
+    StatusStore,
+    TorrentMetadata,
+    TorrentStatusRow,
+)
+from seedarr.envs import ALERT_QUEUE_SIZE, FILE_TABLE_CACHE_SIZE, STATUS_MAX_AGE
+
+from .libtorrent_executor import LibtorrentExecutor
 
 
 class LibtorrentSession:
@@ -15,6 +27,13 @@ class LibtorrentSession:
         self._initialized = False
         self.session: Optional[lt.session] = None
         self._thread_lock = threading.Lock()
+        self._index = HandleIndex()
+        self._statuses = StatusStore()
+        self._history = RateHistory()
+        self._files = FileTableCache(FILE_TABLE_CACHE_SIZE)
+        self._metadata: Dict[str, TorrentMetadata] = {}
+        # Set by the next state_update_alert while a stale read waits for one
+        self._state_updated: Optional[anyio.Event] = None
 
     @classmethod
     async def init(cls: Type["LibtorrentSession"]) -> None:
@@ -22,9 +41,9 @@ class LibtorrentSession:
             if cls._instance is None:
                 cls._instance = cls()
             if not cls._instance._initialized:
-                # Run session creation in a separate thread
-                cls._instance.session = await to_thread.run_sync(
-                    cls._instance._create_session
+                # Run session creation on a libtorrent worker
+                cls._instance.session = await LibtorrentExecutor.run(
+                    "session.create", cls._instance._create_session
                 )
                 cls._instance._initialized = True
 
@@ -36,6 +55,212 @@ class LibtorrentSession:
             raise RuntimeError("Libtorrent session is not initialized.")
         return cls._instance.session
 
+    @classmethod
+    async def find_handle(cls, info_hash: str) -> Optional[lt.torrent_handle]:
+        """
+        Look up a torrent handle by its hex v1 or v2 info-hash.
+
+        Answers from the handle index; torrents the index has not seen yet are
+        resolved through `session.find_torrent` and indexed on the way out.
+        """
+        ses = await cls.get_session()
+        index = cls._instance._index  # type: ignore
+
+        handle = index.get(info_hash)
+        if handle is not None:
+            if handle.is_valid():
+                return handle
+            index.discard(info_hash)
+
+        if len(info_hash) != 40:
+            return None
+
+        try:
+            key = lt.sha1_hash(bytes.fromhex(info_hash))
+        except ValueError:
+            return None
+
+        handle = await LibtorrentExecutor.call(ses, "find_torrent", key)
+
+        if not handle.is_valid():
+            return None
+
+        index.add(handle)
+        return handle
+
+    @classmethod
+    async def get_status_store(cls, max_age: float = STATUS_MAX_AGE) -> StatusStore:
+        """
+        Return the status store, reading every status in one query only to
+        prime it. Afterwards, when no `state_update_alert` refreshed it within
+        `max_age` seconds (updates are only posted periodically while clients
+        stream alerts), one update is requested and awaited so just the
+        changed rows are applied.
+        """
+        ses = await cls.get_session()
+        statuses = cls._instance._statuses  # type: ignore
+        if not statuses.primed:
+            statuses.replace(
+                await LibtorrentExecutor.run(
+                    "session.get_statuses",
+                    lambda: [handle.status() for handle in ses.get_torrents()],
+                )
+            )
+        elif statuses.age() > max_age:
+            await cls._await_state_update(ses)
+        return statuses
+
+    @classmethod
+    async def _await_state_update(cls, ses: lt.session) -> None:
+        """
+        Post one `post_torrent_updates()` and wait, at most `STATUS_MAX_AGE`
+        seconds, for `track_alerts` to apply its state_update_alert.
+        Concurrent stale reads share the same request.
+        """
+        instance = cls._instance  # type: ignore
+        updated = instance._state_updated
+        if updated is None:
+            updated = instance._state_updated = anyio.Event()
+            ses.post_torrent_updates()
+        with anyio.move_on_after(STATUS_MAX_AGE):
+            await updated.wait()
+        if not updated.is_set() and instance._state_updated is updated:
+            # The alert was lost (e.g. a full alert queue); let the next read ask again
+            instance._state_updated = None
+
+    @classmethod
+    async def get_rate_history(cls) -> RateHistory:
+        await cls.get_session()
+        return cls._instance._history  # type: ignore
+
+    @classmethod
+    async def get_file_tables(cls) -> FileTableCache:
+        await cls.get_session()
+        return cls._instance._files  # type: ignore
+
+    @classmethod
+    async def get_status_row(
+        cls, handle: lt.torrent_handle, max_age: float = STATUS_MAX_AGE
+    ) -> TorrentStatusRow:
+        """
+        Return one torrent's status store row, re-reading only this torrent's
+        status when the row is missing or the store is older than `max_age`.
+        """
+        await cls.get_session()
+        statuses = cls._instance._statuses  # type: ignore
+        info_hash = str(handle.info_hash())
+        row = statuses.get(info_hash)
+        if row is None or statuses.age() > max_age:
+            statuses.update([await LibtorrentExecutor.call(handle, "status")])
+            row = statuses.get(info_hash)
+        return row  # type: ignore
+
+    @classmethod
+    async def get_metadata(cls, handle: lt.torrent_handle) -> Optional[TorrentMetadata]:
+        """
+        Return a torrent's static metadata fields, built once per info-hash,
+        or None while the torrent has no metadata.
+        """
+        await cls.get_session()
+        cache = cls._instance._metadata  # type: ignore
+        info_hash = str(handle.info_hashes().get_best())
+        metadata = cache.get(info_hash)
+        if metadata is None:
+
+            def build() -> Optional[TorrentMetadata]:
+                ti = handle.torrent_file()
+                return TorrentMetadata(ti) if ti is not None else None
+
+            metadata = await LibtorrentExecutor.run("torrent_handle.torrent_file", build)
+            if metadata is not None:
+                cache[info_hash] = metadata
+        return metadata
+
+    @classmethod
+    def register_handle(cls, handle: lt.torrent_handle) -> None:
+        if cls._instance is None:
+            raise RuntimeError("Libtorrent session is not initialized.")
+        if not handle.is_valid():
+            return
+        cls._instance._index.add(handle)
+
+    @classmethod
+    def knows(cls, info_hash: str) -> bool:
+        """Whether a torrent reachable through `info_hash` is in the session."""
+        if cls._instance is None:
+            return False
+        return info_hash in cls._instance._index
+
+    @classmethod
+    def unregister_handle(cls, info_hashes: lt.info_hash_t) -> None:
+        if cls._instance is None:
+            raise RuntimeError("Libtorrent session is not initialized.")
+        cls._instance._index.remove(info_hashes)
+        cls._instance._statuses.remove(str(info_hashes.get_best()))
+        cls._instance._files.discard(str(info_hashes.get_best()))
+        cls._instance._metadata.pop(str(info_hashes.get_best()), None)
+
+    @classmethod
+    async def track_alerts(cls, alerts: Iterable[lt.alert]) -> None:
+        """
+        Keep the handle index, status store and metadata caches in sync with
+        a pop's worth of alerts. Statuses of added torrents and the metadata
+        magnet links just received are read in one libtorrent worker hop.
+        """
+        if cls._instance is None:
+            return
+        instance = cls._instance
+        added: List[lt.torrent_handle] = []
+        received: List[lt.torrent_handle] = []
+
+        for alert in alerts:
+            if isinstance(alert, lt.state_update_alert):
+                instance._statuses.update(alert.status)
+                instance._statuses.refreshed = time.monotonic()
+                if instance._state_updated is not None:
+                    instance._state_updated.set()
+                    instance._state_updated = None
+            elif isinstance(alert, lt.add_torrent_alert):
+                cls.register_handle(alert.handle)
+                added.append(alert.handle)
+            elif isinstance(alert, lt.torrent_removed_alert):
+                # The same torrent may have been added again since it was removed
+                current = instance._index.get(str(alert.info_hashes.get_best()))
+                if current is None or not current.is_valid():
+                    cls.unregister_handle(alert.info_hashes)
+            elif isinstance(alert, lt.file_renamed_alert):
+                instance._files.discard(str(alert.handle.info_hashes().get_best()))
+            elif isinstance(alert, lt.metadata_received_alert):
+                received.append(alert.handle)
+
+        if not added and not received:
+            return
+
+        def read() -> tuple[list[lt.torrent_status], dict[str, TorrentMetadata]]:
+            statuses = []
+            metadata = {}
+            # Torrents removed by the time this runs raise on invalid handles
+            for handle in added:
+                try:
+                    statuses.append(handle.status())
+                except RuntimeError:
+                    pass
+            for handle in received:
+                try:
+                    ti = handle.torrent_file()
+                except RuntimeError:
+                    continue
+                if ti is not None:
+                    metadata[str(handle.info_hashes().get_best())] = TorrentMetadata(ti)
+            return statuses, metadata
+
+        statuses, metadata = await LibtorrentExecutor.run("session.track_alerts", read)
+        instance._statuses.update(
+            status for status in statuses if str(status.info_hash) not in instance._statuses
+        )
+        # Magnet links get their metadata only now; build it once
+        instance._metadata.update(metadata)
+
     def _create_session(self) -> lt.session:
         ses = lt.session()
         ses.apply_settings(
@@ -50,6 +275,7 @@ class LibtorrentSession:
                 "enable_outgoing_utp": True,
                 "enable_incoming_utp": True,
                 "ban_web_seeds": False,
+                "alert_queue_size": ALERT_QUEUE_SIZE,
                 "alert_mask": (
                     lt.alert.category_t.status_notification
                     | lt.alert.category_t.error_notification
@@ -72,9 +298,15 @@ class LibtorrentSession:
             if cls._instance is None or not cls._instance._initialized:
                 return
             # Pause all torrents safely in a thread
-            await to_thread.run_sync(cls._instance._pause_all_torrents)
+            await LibtorrentExecutor.run("session.pause_all", cls._instance._pause_all_torrents)
             await anyio.sleep(1)
             cls._instance.session = None
+            cls._instance._index.clear()
+            cls._instance._statuses.clear()
+            cls._instance._history.clear()
+            cls._instance._files.clear()
+            cls._instance._metadata.clear()
+            cls._instance._state_updated = None
             cls._instance._initialized = False
 
     def _pause_all_torrents(self) -> None:
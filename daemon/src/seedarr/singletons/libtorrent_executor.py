@@ -0,0 +1,140 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Type, TypeVar
+
+from seedarr.datastructures import LatencyHistogram
+from seedarr.envs import LIBTORRENT_WORKERS
+
+T = TypeVar("T")
+
+
+class OperationStats:
+    __slots__ = ("calls", "errors", "wait", "run")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.wait = LatencyHistogram()
+        self.run = LatencyHistogram()
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "wait": self.wait.to_dict(),
+            "run": self.run.to_dict(),
+        }
+
+
+class LibtorrentExecutor:
+    """
+    A dedicated, bounded thread pool for blocking libtorrent calls, so no
+    session or handle query holds up the event loop and they do not compete
+    with file and database work for anyio's shared worker threads.
+
+    Each operation is timed: how long it waited for a worker and how long
+    the call itself ran.
+    """
+
+    _instance: Optional["LibtorrentExecutor"] = None
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="libtorrent")
+        self._operations: Dict[str, OperationStats] = {}
+
+    @classmethod
+    def init(cls: Type["LibtorrentExecutor"], workers: int = LIBTORRENT_WORKERS) -> None:
+        if cls._instance is None:
+            cls._instance = cls(workers)
+
+    @classmethod
+    def get_instance(cls) -> "LibtorrentExecutor":
+        if cls._instance is None:
+            cls.init()
+        return cls._instance  # type: ignore
+
+    @classmethod
+    async def run(cls, operation: str, fn: Callable[..., T], *args: Any) -> T:
+        """Run `fn(*args)` on a libtorrent worker, timed under `operation`."""
+        executor = cls.get_instance()
+        queued = time.perf_counter()
+        # When the call started and finished, set by the worker
+        timing = [0.0, 0.0]
+
+        def call() -> T:
+            timing[0] = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                timing[1] = time.perf_counter()
+
+        error = True
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(executor._pool, call)
+            error = False
+            return result
+        finally:
+            # A cancelled call keeps running; it is only counted once done
+            if timing[1]:
+                executor._observe(operation, timing[0] - queued, timing[1] - timing[0], error)
+
+    @classmethod
+    async def call(cls, target: Any, method: str, *args: Any) -> Any:
+        """
+        Call `target.method(*args)` on a libtorrent worker, timed as
+        "<type>.<method>", e.g. "torrent_handle.status".
+        """
+        return await cls.run(f"{type(target).__name__}.{method}", getattr(target, method), *args)
+
+    def _observe(self, operation: str, wait: float, run: float, error: bool) -> None:
+        stats = self._operations.get(operation)
+        if stats is None:
+            stats = self._operations[operation] = OperationStats()
+        stats.calls += 1
+        stats.errors += error
+        stats.wait.observe(wait)
+        stats.run.observe(run)
+
+    @classmethod
+    def stats(cls) -> dict:
+        if cls._instance is None:
+            return {}
+        return {
+            operation: stats.to_dict() for operation, stats in cls._instance._operations.items()
+        }
+
+    @classmethod
+    def render(cls) -> str:
+        """Call counts and wait/run histograms in the Prometheus text format."""
+        operations = cls._instance._operations if cls._instance is not None else {}
+        parts = ["# TYPE seedarr_libtorrent_calls_total counter\n"]
+        parts.extend(
+            f'seedarr_libtorrent_calls_total{{operation="{operation}"}} {stats.calls}\n'
+            for operation, stats in operations.items()
+        )
+        parts.append("# TYPE seedarr_libtorrent_errors_total counter\n")
+        parts.extend(
+            f'seedarr_libtorrent_errors_total{{operation="{operation}"}} {stats.errors}\n'
+            for operation, stats in operations.items()
+        )
+        parts.append("# TYPE seedarr_libtorrent_seconds histogram\n")
+        for operation, stats in operations.items():
+            parts.append(
+                stats.wait.render(
+                    "seedarr_libtorrent_seconds", f'operation="{operation}",phase="wait",'
+                )
+            )
+            parts.append(
+                stats.run.render(
+                    "seedarr_libtorrent_seconds", f'operation="{operation}",phase="run",'
+                )
+            )
+        return "".join(parts)
+
+    @classmethod
+    def close(cls) -> None:
+        if cls._instance is not None:
+            cls._instance._pool.shutdown(wait=True)
+            cls._instance = None
@@ -0,0 +1,22 @@
+from .ingest import IngestReport as IngestReport, ingest_torrents as ingest_torrents
+from .metadata import (
+    cached_magnet_metadata as cached_magnet_metadata,
+    fetch_magnet_metadata as fetch_magnet_metadata,
+)
+from .rate_history import sample_rate_history as sample_rate_history
+from .resume_data import (
+    flush_resume_data as flush_resume_data,
+    restore_torrents as restore_torrents,
+    save_resume_data_periodically as save_resume_data_periodically,
+)
+from .session_stats import post_session_stats_periodically as post_session_stats_periodically
+from .torrent_actions import (
+    Outcome as Outcome,
+    RemovedTorrent as RemovedTorrent,
+    expect_removal as expect_removal,
+    pause_handle as pause_handle,
+    recheck_handle as recheck_handle,
+    release_removed as release_removed,
+    remove_handle as remove_handle,
+    resume_handle as resume_handle,
+)
@@ -0,0 +1,229 @@
+import os
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+import anyio
+import anyio.to_thread
+import libtorrent as lt
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+
+from seedarr.datastructures import info_hash_keys, torrent_file_from_info
+from seedarr.envs import (
+    INGEST_ADD_TIMEOUT,
+    INGEST_CONCURRENCY,
+    INGEST_PROGRESS_INTERVAL,
+)
+from seedarr.managers import AlertWaiterManager, MetadataFetchManager, resume_data_key
+from seedarr.singletons import FolderLock, LibtorrentExecutor, LibtorrentSession, Logger
+from seedarr.utilities import ParsedTorrent, find_torrent_files, parse_torrents
+
+logger = Logger.get_logger()
+alert_waiter_manager = AlertWaiterManager()
+metadata_fetch_manager = MetadataFetchManager()
+folder_lock = FolderLock.get_instance()
+
+# .torrent files parsed per libtorrent worker hop
+PARSE_CHUNK = 32
+
+
+class _Candidate(NamedTuple):
+    source: str
+    info_hash: str
+    name: str
+    params: lt.add_torrent_params
+    # Metadata fetched earlier for a magnet link, as .torrent data
+    data: Optional[bytes]
+
+
+@dataclass
+class IngestReport:
+    total: int = 0
+    added: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    errors: List[Dict[str, str]] = field(default_factory=list)
+
+    def fail(self, source: str, message: str) -> None:
+        self.failed += 1
+        self.errors.append({"source": source, "message": message})
+
+    @property
+    def done(self) -> int:
+        return self.added + self.duplicates + self.failed
+
+    def to_dict(self, errors: bool = True) -> dict:
+        counts = {
+            "total": self.total,
+            "done": self.done,
+            "added": self.added,
+            "duplicates": self.duplicates,
+            "failed": self.failed,
+        }
+        if errors:
+            counts["errors"] = self.errors
+        return counts
+
+
+def _parse_magnets(
+    magnets: Sequence[str],
+) -> List[Tuple[str, Optional[lt.add_torrent_params], str]]:
+    parsed = []
+    for magnet in magnets:
+        try:
+            parsed.append((magnet, lt.parse_magnet_uri(magnet), ""))
+        except Exception as e:
+            parsed.append((magnet, None, str(e)))
+    return parsed
+
+
+async def _parse_files(sources: List[Tuple[str, Optional[bytes]]]):
+    """
+    Yield the .torrent files of `sources` as they are parsed, a chunk per
+    libtorrent worker hop so adds start before the last file is read.
+    """
+    for start in range(0, len(sources), PARSE_CHUNK):
+        chunk = sources[start : start + PARSE_CHUNK]
+        for parsed in await LibtorrentExecutor.run("torrent_info.parse", parse_torrents, chunk):
+            yield parsed
+
+
+async def _lock_folder(save_path: str, name: str) -> None:
+    if not name:
+        return
+    folder = os.path.join(save_path, name)
+    if folder_lock.is_locked(folder):
+        return
+    try:
+        await folder_lock.add_folder(folder)
+    except (RuntimeError, ValueError) as e:
+        logger.warning(f"Could not lock {folder}: {e}")
+
+
+async def ingest_torrents(
+    magnets: Sequence[str],
+    files: Sequence[bytes],
+    paths: Sequence[str],
+    save_path: str,
+    concurrency: int = INGEST_CONCURRENCY,
+    on_progress: Optional[Callable[[IngestReport], Awaitable[None]]] = None,
+) -> IngestReport:
+    """
+    Add many torrents at once: magnet links, .torrent data and .torrent files
+    or directories of them on the daemon's disk.
+
+    Files are parsed on libtorrent workers and torrents already in the session,
+    or seen earlier in the same batch, are skipped. The rest are queued with
+    `async_add_torrent`, at most `concurrency` at a time, and each counts as
+    added once its add_torrent_alert arrives. `on_progress` is called with the
+    running report every `INGEST_PROGRESS_INTERVAL` seconds.
+    """
+    ses = await LibtorrentSession.get_session()
+    report = IngestReport()
+
+    sources: List[Tuple[str, Optional[bytes]]] = [
+        (f"file #{number}", data) for number, data in enumerate(files)
+    ]
+    for path in paths:
+        if os.path.isdir(path):
+            sources.extend(
+                (found, None) for found in await anyio.to_thread.run_sync(find_torrent_files, path)
+            )
+        elif os.path.isfile(path):
+            sources.append((path, None))
+        else:
+            report.fail(path, "No such file or directory")
+    report.total = len(magnets) + len(sources) + report.failed
+
+    seen: Set[str] = set()
+
+    def is_duplicate(keys: Sequence[str]) -> bool:
+        if any(key in seen or LibtorrentSession.knows(key) for key in keys):
+            report.duplicates += 1
+            return True
+        seen.update(keys)
+        return False
+
+    async def produce(send: MemoryObjectSendStream[_Candidate]) -> None:
+        async with send:
+            if magnets:
+                parsed_magnets = await LibtorrentExecutor.run(
+                    "magnet.parse", _parse_magnets, magnets
+                )
+                for magnet, params, error in parsed_magnets:
+                    if params is None:
+                        report.fail(magnet, error)
+                        continue
+                    keys = info_hash_keys(params.info_hashes)
+                    if not is_duplicate(keys):
+                        # Metadata fetched for a preview saves joining the swarm for it
+                        info_section = metadata_fetch_manager.cached(keys)
+                        data = torrent_file_from_info(info_section) if info_section else None
+                        key = resume_data_key(params.info_hashes)
+                        await send.send(_Candidate(magnet, key, params.name, params, data))
+
+            parsed: ParsedTorrent
+            async for parsed in _parse_files(sources):
+                if parsed.error is not None:
+                    report.fail(parsed.source, parsed.error)
+                elif not is_duplicate(parsed.keys):
+                    candidate = _Candidate(
+                        parsed.source, parsed.info_hash, parsed.name, parsed.params, None
+                    )
+                    await send.send(candidate)  # type: ignore
+
+    async def add(candidate: _Candidate) -> Optional[str]:
+        def submit() -> None:
+            params = candidate.params
+            if candidate.data is not None:
+                params.ti = lt.torrent_info(candidate.data)
+            params.save_path = save_path
+            params.storage_mode = lt.storage_mode_t.storage_mode_sparse
+            ses.async_add_torrent(params)
+
+        added = alert_waiter_manager.expect((lt.add_torrent_alert,), candidate.info_hash)
+        try:
+            await LibtorrentExecutor.run("session.async_add_torrent", submit)
+            return (await alert_waiter_manager.wait_on(added, INGEST_ADD_TIMEOUT))["error"]
+        except TimeoutError:
+            return "Timed out waiting for libtorrent to add the torrent"
+        except Exception as e:
+            return str(e)
+        finally:
+            alert_waiter_manager.discard(added)
+
+    async def consume(receive: MemoryObjectReceiveStream[_Candidate]) -> None:
+        async with receive:
+            async for candidate in receive:
+                error = await add(candidate)
+                if error is not None:
+                    report.fail(candidate.source, error)
+                    continue
+                report.added += 1
+                await _lock_folder(save_path, candidate.name)
+
+    async def send_progress() -> None:
+        while True:
+            await anyio.sleep(INGEST_PROGRESS_INTERVAL)
+            await on_progress(report)  # type: ignore
+
+    async with anyio.create_task_group() as progress:
+        if on_progress is not None:
+            progress.start_soon(send_progress)
+
+        send, receive = anyio.create_memory_object_stream[_Candidate](concurrency)
+        async with anyio.create_task_group() as pipeline:
+            pipeline.start_soon(produce, send)
+            for _ in range(max(1, concurrency)):
+                pipeline.start_soon(consume, receive.clone())
+            receive.close()
+
+        progress.cancel_scope.cancel()
+
+    if on_progress is not None:
+        await on_progress(report)
+
+    logger.info(
+        f"Ingested {report.total} torrents: {report.added} added, "
+        f"{report.duplicates} duplicates, {report.failed} failed"
+    )
+    return report
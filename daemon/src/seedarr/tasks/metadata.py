@@ -0,0 +1,116 @@
+import asyncio
+import tempfile
+from typing import List, Optional
+
+import libtorrent as lt
+
+from seedarr.datastructures import info_hash_keys, torrent_file_from_info
+from seedarr.envs import METADATA_FETCH_TIMEOUT
+from seedarr.managers import AlertWaiterManager, MetadataFetchManager
+from seedarr.singletons import LibtorrentExecutor, LibtorrentSession, Logger
+
+logger = Logger.get_logger()
+metadata_fetch_manager = MetadataFetchManager()
+alert_waiter_manager = AlertWaiterManager()
+
+
+def _info_section(handle: lt.torrent_handle) -> Optional[bytes]:
+    ti = handle.torrent_file()
+    return bytes(ti.info_section()) if ti is not None else None
+
+
+async def _wait_for_info_section(handle: lt.torrent_handle, received: asyncio.Future) -> bytes:
+    """
+    `handle`'s info dict, waiting for its metadata_received_alert through
+    `received` (registered before the torrent was added) if need be.
+    """
+    try:
+        info_section = await LibtorrentExecutor.run(
+            "torrent_handle.info_section", _info_section, handle
+        )
+        if info_section is None:
+            await alert_waiter_manager.wait_on(received, METADATA_FETCH_TIMEOUT)
+            info_section = await LibtorrentExecutor.run(
+                "torrent_handle.info_section", _info_section, handle
+            )
+    finally:
+        alert_waiter_manager.discard(received)
+    if info_section is None:
+        raise TimeoutError("Torrent was removed before its metadata arrived")
+    return info_section
+
+
+async def _fetch(params: lt.add_torrent_params, keys: List[str]) -> bytes:
+    received = alert_waiter_manager.expect((lt.metadata_received_alert,), keys[0])
+
+    # A torrent already in the session answers from its own metadata
+    for key in keys:
+        handle = await LibtorrentSession.find_handle(key)
+        if handle is not None:
+            return await _wait_for_info_section(handle, received)
+
+    ses = await LibtorrentSession.get_session()
+    params.save_path = tempfile.gettempdir()
+    try:
+        handle = await LibtorrentExecutor.call(ses, "add_torrent", params)
+    except Exception:
+        alert_waiter_manager.discard(received)
+        raise
+    LibtorrentSession.register_handle(handle)
+    try:
+        return await _wait_for_info_section(handle, received)
+    finally:
+        # Only the info dict is kept; the swarm join is dropped with its files
+        info_hashes = handle.info_hashes()
+        LibtorrentSession.unregister_handle(info_hashes)
+        await LibtorrentExecutor.call(ses, "remove_torrent", handle, lt.options_t.delete_files)
+
+
+async def fetch_magnet_metadata(params: lt.add_torrent_params) -> bytes:
+    """
+    The bencoded info dict of the magnet link parsed into `params`.
+
+    Answers from the metadata cache when it can. Otherwise the torrent is
+    added to a temporary directory until its metadata arrives, and callers
+    asking for the same torrent meanwhile share that one fetch.
+
+    Raises TimeoutError if no metadata arrives within `METADATA_FETCH_TIMEOUT`.
+    """
+    keys = info_hash_keys(params.info_hashes)
+    info_section = metadata_fetch_manager.cached(keys)
+    if info_section is not None:
+        return info_section
+
+    task = metadata_fetch_manager.inflight(keys)
+    if task is None:
+
+        async def fetch() -> bytes:
+            info_section = await _fetch(params, keys)
+            ti = await LibtorrentExecutor.run(
+                "torrent_info.parse", lt.torrent_info, torrent_file_from_info(info_section)
+            )
+            # Stored under every key of the full metadata, which a v1 magnet lacks
+            metadata_fetch_manager.store(info_hash_keys(ti.info_hashes()), info_section)
+            return info_section
+
+        task = asyncio.ensure_future(fetch())
+        metadata_fetch_manager.track(keys, task)
+
+    # One caller going away must not cancel the fetch the others wait on
+    return await asyncio.shield(task)
+
+
+async def cached_magnet_metadata(params: lt.add_torrent_params) -> Optional[bytes]:
+    """
+    The info dict of `params` if it was fetched before or is being fetched
+    right now, waiting for the running fetch; None otherwise.
+    """
+    keys = info_hash_keys(params.info_hashes)
+    info_section = metadata_fetch_manager.cached(keys)
+    if info_section is not None or metadata_fetch_manager.inflight(keys) is None:
+        return info_section
+    try:
+        return await fetch_magnet_metadata(params)
+    except Exception as e:
+        logger.warning(f"Metadata fetch for {keys[0]} failed: {e}")
+        return None
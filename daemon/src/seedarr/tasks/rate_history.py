@@ -0,0 +1,38 @@
+import math
+import time
+
+import anyio
+
+from seedarr.managers import BroadcastClientManager
+from seedarr.singletons import LibtorrentSession
+
+broadcast_client_manager = BroadcastClientManager()
+
+
+async def sample_rate_history():
+    """
+    Feed the rate history from the status store once per second while
+    clients stream alerts.
+
+    The store is then kept fresh by `post_status_updates`; with no client
+    connected the sampler sleeps instead of waking libtorrent, and the
+    history has a gap for that time.
+    """
+    history = await LibtorrentSession.get_rate_history()
+    next_tick = time.monotonic()
+
+    while True:
+        if not broadcast_client_manager.count():
+            await broadcast_client_manager.wait_for_clients()
+            next_tick = time.monotonic()
+
+        statuses = await LibtorrentSession.get_status_store(max_age=math.inf)
+        history.sample(statuses)
+
+        next_tick += 1
+        delay = next_tick - time.monotonic()
+        if delay < 0:
+            # Fell behind (e.g. a long roll-up); skip the missed ticks
+            next_tick = time.monotonic()
+            delay = 0
+        await anyio.sleep(delay)
@@ -0,0 +1,129 @@
+import os
+import time
+from typing import List, Tuple
+
+import anyio
+import libtorrent as lt
+
+from seedarr.consumers import RESUME_DATA_CONSUMER
+from seedarr.envs import RESTORE_TIMEOUT, RESUME_DATA_FLUSH_TIMEOUT, RESUME_DATA_INTERVAL
+from seedarr.managers import ResumeDataManager, resume_data_key
+from seedarr.orm import ResumeDataTable
+from seedarr.singletons import (
+    Database,
+    EventBus,
+    FolderLock,
+    LibtorrentExecutor,
+    LibtorrentSession,
+    Logger,
+)
+
+logger = Logger.get_logger()
+resume_data_manager = ResumeDataManager()
+event_bus = EventBus.get_bus()
+folder_lock = FolderLock.get_instance()
+
+
+def _read_resume_data(rows: List[Tuple[str, bytes]]) -> List[lt.add_torrent_params]:
+    params = []
+    for info_hash, data in rows:
+        try:
+            params.append(lt.read_resume_data(data))
+        except Exception as e:
+            logger.error(f"Skipping unreadable resume data of {info_hash}: {e}")
+    return params
+
+
+async def _lock_folders(params: List[lt.add_torrent_params]) -> None:
+    for atp in params:
+        if not atp.name:
+            continue
+        folder = os.path.join(atp.save_path, atp.name)
+        if folder_lock.is_locked(folder):
+            continue
+        try:
+            await folder_lock.add_folder(folder)
+        except (RuntimeError, ValueError) as e:
+            logger.warning(f"Could not lock {folder}: {e}")
+
+
+async def restore_torrents() -> int:
+    """
+    Re-add every torrent stored in the database.
+
+    All torrents are queued with `async_add_torrent` at once, so libtorrent
+    adds them in parallel. The stored resume data carries the piece state,
+    so nothing is rechecked. Torrents libtorrent has not added within
+    `RESTORE_TIMEOUT` seconds are logged and no longer waited for.
+    """
+    ses = await LibtorrentSession.get_session()
+    connection = await Database.get_connection()
+
+    started = time.monotonic()
+    rows = await ResumeDataTable.load_all(connection)
+    if not rows:
+        return 0
+
+    params = await LibtorrentExecutor.run("read_resume_data", _read_resume_data, rows)
+    resume_data_manager.begin_restore(resume_data_key(atp.info_hashes) for atp in params)
+    for atp in params:
+        ses.async_add_torrent(atp)
+
+    with anyio.move_on_after(RESTORE_TIMEOUT):
+        await resume_data_manager.wait_restored()
+    unanswered = resume_data_manager.abandon_restore()
+    if unanswered:
+        logger.warning(
+            f"{len(unanswered)} torrents were not added within {RESTORE_TIMEOUT}s: "
+            + ", ".join(sorted(unanswered))
+        )
+    restored = len(params) - len(unanswered)
+    logger.info(f"Restored {restored} torrents in {time.monotonic() - started:.2f}s")
+
+    await _lock_folders(params)
+    return restored
+
+
+async def save_resume_data_periodically():
+    """
+    Every `RESUME_DATA_INTERVAL` seconds, save resume data of the torrents
+    libtorrent reports as modified (e.g. new pieces) since their last save.
+    """
+    ses = await LibtorrentSession.get_session()
+    while True:
+        await anyio.sleep(RESUME_DATA_INTERVAL)
+        handles = await LibtorrentExecutor.run(
+            "session.need_save_resume_data",
+            lambda: [handle for handle in ses.get_torrents() if handle.need_save_resume_data()],
+        )
+        resume_data_manager.end_sweep()
+        resume_data_manager.request(handles)
+
+
+async def flush_resume_data(timeout: float = RESUME_DATA_FLUSH_TIMEOUT) -> bool:
+    """
+    Save resume data of every torrent and wait until it is stored, giving up
+    after `timeout` seconds. Returns whether everything was stored.
+    """
+    ses = await LibtorrentSession.get_session()
+    started = time.monotonic()
+    requested = 0
+
+    # Later alerts (e.g. torrents paused by LibtorrentSession.close) must not
+    # overwrite what is saved here
+    resume_data_manager.close()
+
+    with anyio.move_on_after(timeout) as scope:
+        # Freeze the session so the data saved is the data restored
+        ses.pause()
+        handles = await LibtorrentExecutor.call(ses, "get_torrents")
+        requested = resume_data_manager.request(handles)
+        await resume_data_manager.wait_settled()
+        await event_bus.join(RESUME_DATA_CONSUMER)
+
+    if scope.cancelled_caught:
+        logger.warning(f"Resume data flush did not finish within {timeout}s")
+        return False
+
+    logger.info(f"Flushed resume data of {requested} torrents in {time.monotonic() - started:.2f}s")
+    return True
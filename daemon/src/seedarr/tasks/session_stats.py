@@ -0,0 +1,15 @@
+import anyio
+
+from seedarr.envs import METRICS_INTERVAL
+from seedarr.singletons import LibtorrentSession
+
+
+async def post_session_stats_periodically():
+    """
+    Ask libtorrent for its session counters every `METRICS_INTERVAL` seconds.
+    The answering session_stats_alert refreshes the exporter's cache.
+    """
+    ses = await LibtorrentSession.get_session()
+    while True:
+        ses.post_session_stats()
+        await anyio.sleep(METRICS_INTERVAL)
@@ -0,0 +1,79 @@
+import asyncio
+import os
+from typing import NamedTuple, Tuple
+
+import libtorrent as lt
+
+from seedarr.envs import REMOVE_TIMEOUT
+from seedarr.managers import AlertWaiterManager
+from seedarr.singletons import FolderLock, LibtorrentSession, Logger
+
+logger = Logger.get_logger()
+alert_waiter_manager = AlertWaiterManager()
+folder_lock = FolderLock.get_instance()
+
+# (status, message) of one torrent's operation, as sent to clients
+Outcome = Tuple[str, str]
+
+# The handle operations below block on libtorrent; run them on its executor
+
+
+def pause_handle(handle: lt.torrent_handle) -> Outcome:
+    if handle.is_paused():
+        return "info", "Torrent is already paused"
+    handle.auto_managed(False)  # Disable auto-resume
+    handle.set_upload_mode(True)  # Prevent seeding
+    handle.pause()
+    return "success", "Torrent paused and upload disabled"
+
+
+def resume_handle(handle: lt.torrent_handle) -> Outcome:
+    if not handle.is_paused():
+        return "info", "Torrent is already active"
+    handle.set_upload_mode(False)  # Re-enable uploading
+    handle.auto_managed(True)  # Re-enable auto management
+    handle.resume()
+    return "success", "Torrent resumed and upload enabled"
+
+
+def recheck_handle(handle: lt.torrent_handle) -> Outcome:
+    handle.force_recheck()
+    return "success", "Torrent queued for recheck"
+
+
+class RemovedTorrent(NamedTuple):
+    # The info-hash synthetic events report the torrent under
+    info_hash: str
+    info_hashes: lt.info_hash_t
+    folder: str
+
+
+def remove_handle(ses: lt.session, handle: lt.torrent_handle, flags: int) -> RemovedTorrent:
+    # The handle is invalidated once libtorrent processes the removal
+    removed = RemovedTorrent(
+        str(handle.info_hash()),
+        handle.info_hashes(),
+        os.path.join(handle.save_path(), handle.name()),
+    )
+    ses.remove_torrent(handle, flags)
+    return removed
+
+
+def expect_removal(info_hash: str) -> asyncio.Future:
+    """Register for a torrent's torrent_removed_alert; call before removing it."""
+    return alert_waiter_manager.expect((lt.torrent_removed_alert,), info_hash)
+
+
+async def release_removed(removed: RemovedTorrent, future: asyncio.Future) -> None:
+    """
+    Wait for the torrent_removed_alert `future` (from `expect_removal`), then
+    unlock the torrent's folder. The alert loop has already dropped its
+    handle and caches by then; they are dropped here if the alert is late.
+    """
+    try:
+        await alert_waiter_manager.wait_on(future, REMOVE_TIMEOUT)
+    except TimeoutError:
+        logger.warning(f"Torrent {removed.info_hash} not removed after {REMOVE_TIMEOUT}s")
+        LibtorrentSession.unregister_handle(removed.info_hashes)
+    if folder_lock.is_locked(removed.folder):
+        await folder_lock.remove_folder(removed.folder)
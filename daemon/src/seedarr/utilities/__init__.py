@@ -1,3 +1,8 @@
 from .import_helper import (
     import_submodules as import_submodules,
 )
+from .torrent_files import (
+    ParsedTorrent as ParsedTorrent,
+    find_torrent_files as find_torrent_files,
+    parse_torrents as parse_torrents,
+)
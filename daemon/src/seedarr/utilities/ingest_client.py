@@ -0,0 +1,58 @@
+"""
+Client side of `seedarr ingest`: sends magnet links and .torrent paths to a
+running daemon's `libtorrent:ingest` event and relays its progress.
+
+Paths are sent as absolute paths and read by the daemon, so they must be
+visible on the daemon's disk. Needs the `client` extra (aiohttp) for the
+python-socketio client.
+"""
+
+import asyncio
+import importlib.util
+import os
+from typing import Callable, Optional, Sequence
+
+import socketio
+
+URL = "http://127.0.0.1:8080"
+
+
+async def _ingest(
+    url: str,
+    sources: Sequence[str],
+    save_path: str,
+    concurrency: Optional[int],
+    on_progress: Optional[Callable[[dict], None]],
+) -> dict:
+    payload: dict = {
+        "magnets": [source for source in sources if source.startswith("magnet:")],
+        "paths": [
+            os.path.abspath(source) for source in sources if not source.startswith("magnet:")
+        ],
+        "save_path": save_path,
+    }
+    if concurrency is not None:
+        payload["concurrency"] = concurrency
+
+    client = socketio.AsyncClient(serializer="msgpack")
+    if on_progress is not None:
+        client.on("libtorrent:ingest_progress", on_progress)
+
+    await client.connect(url, transports=["websocket"])
+    try:
+        # The daemon answers once every torrent has been added or has failed
+        return await client.call("libtorrent:ingest", payload, timeout=None)
+    finally:
+        await client.disconnect()
+
+
+def run(
+    sources: Sequence[str],
+    url: str = URL,
+    save_path: str = "",
+    concurrency: Optional[int] = None,
+    on_progress: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    if importlib.util.find_spec("aiohttp") is None:
+        raise RuntimeError("Ingesting needs aiohttp: pip install 'seedarr[client]'")
+    return asyncio.run(_ingest(url, sources, save_path, concurrency, on_progress))
@@ -0,0 +1,62 @@
+import os
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import libtorrent as lt
+
+from seedarr.datastructures import info_hash_keys
+
+
+class ParsedTorrent(NamedTuple):
+    """A .torrent file checked by `parse_torrents`, or the reason it was not."""
+
+    source: str
+    # The parsed file, ready for `async_add_torrent`
+    params: Optional[lt.add_torrent_params]
+    # resume_data_key() of the torrent, the key its add_torrent_alert carries
+    info_hash: str
+    # Every hex info-hash the torrent is reachable through
+    keys: Tuple[str, ...]
+    name: str
+    error: Optional[str]
+
+
+def find_torrent_files(directory: str) -> List[str]:
+    """Every .torrent file under `directory`, in a stable order."""
+    found = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        found.extend(
+            os.path.join(root, name) for name in sorted(files) if name.lower().endswith(".torrent")
+        )
+    return found
+
+
+def parse_torrents(items: Sequence[Tuple[str, Optional[bytes]]]) -> List[ParsedTorrent]:
+    """
+    Read and parse .torrent files, given as (path, None) or (label, data).
+
+    Each file is parsed once, into the add_torrent_params the torrent is
+    added with.
+    """
+    parsed = []
+    for source, data in items:
+        try:
+            if data is None:
+                params = lt.load_torrent_file(source)
+            else:
+                params = lt.load_torrent_buffer(data)
+        except Exception as e:
+            parsed.append(ParsedTorrent(source, None, "", (), "", str(e)))
+            continue
+        info_hashes = params.ti.info_hashes()
+        parsed.append(
+            ParsedTorrent(
+                source,
+                params,
+                str(info_hashes.get_best()),
+                tuple(info_hash_keys(info_hashes)),
+                params.ti.name(),
+                None,
+            )
+        )
+    return parsed
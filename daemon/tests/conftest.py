@@ -0,0 +1,23 @@
+import anyio
+import pytest
+
+from seedarr.singletons import SIO, Logger
+
+# Modules under test fetch the logger and Socket.IO server at import time
+Logger.init()
+anyio.run(SIO.init)
+
+from seedarr.managers import StateDeltaManager  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def state_delta_manager():
+    manager = StateDeltaManager()
+    manager.clear()
+    yield manager
+    manager.clear()
@@ -0,0 +1,54 @@
+from seedarr.consumers.batching import STATE_UPDATE, chunked, coalesce_alerts
+
+
+def state_update(*statuses):
+    return {"type": STATE_UPDATE, "statuses": list(statuses)}
+
+
+def test_state_updates_merge_to_latest_status_per_torrent():
+    alerts = [
+        state_update({"info_hash": "a", "progress": 0.1}, {"info_hash": "b", "progress": 0.5}),
+        state_update({"info_hash": "a", "progress": 0.2}),
+    ]
+
+    assert coalesce_alerts(alerts) == [
+        state_update({"info_hash": "b", "progress": 0.5}, {"info_hash": "a", "progress": 0.2})
+    ]
+
+
+def test_repeated_alerts_keep_their_last_occurrence():
+    alerts = [
+        {"type": "libtorrent:torrent_paused", "info_hash": "a", "n": 1},
+        {"type": "libtorrent:torrent_resumed", "info_hash": "a"},
+        {"type": "libtorrent:torrent_paused", "info_hash": "a", "n": 2},
+        {"type": "libtorrent:torrent_paused", "info_hash": "b"},
+    ]
+
+    assert coalesce_alerts(alerts) == [
+        {"type": "libtorrent:torrent_resumed", "info_hash": "a"},
+        {"type": "libtorrent:torrent_paused", "info_hash": "a", "n": 2},
+        {"type": "libtorrent:torrent_paused", "info_hash": "b"},
+    ]
+
+
+def test_state_update_takes_the_place_of_its_last_occurrence():
+    paused = {"type": "libtorrent:torrent_paused", "info_hash": "a"}
+    alerts = [state_update({"info_hash": "a"}), paused, state_update({"info_hash": "b"})]
+
+    coalesced = coalesce_alerts(alerts)
+
+    assert coalesced[0] == paused
+    assert coalesced[1]["statuses"] == [{"info_hash": "a"}, {"info_hash": "b"}]
+
+
+def test_alerts_without_info_hash_and_failed_state_updates_are_kept():
+    failed = {"type": STATE_UPDATE, "error": "boom"}
+    stats = {"type": "libtorrent:session_stats"}
+    alerts = [stats, failed, stats]
+
+    assert coalesce_alerts(alerts) == alerts
+
+
+def test_chunked():
+    assert list(chunked([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+    assert list(chunked([], 2)) == []
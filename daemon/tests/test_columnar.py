@@ -0,0 +1,65 @@
+from array import array
+
+import pytest
+
+from seedarr.serializers.columnar import (
+    FILE_COLUMNS,
+    empty_columns,
+    encode_rows,
+    share_paths,
+)
+
+
+def unpack(data: bytes, typecode: str) -> list:
+    values = array(typecode)
+    values.frombytes(data)
+    return values.tolist()
+
+
+def test_share_paths_counts_shared_leading_segments():
+    shared, suffixes = share_paths(["x/a", "x/b", "x/y/c", "x/y/d", "z"])
+
+    assert unpack(shared, "I") == [0, 1, 1, 2, 0]
+    assert suffixes == ["x/a", "b", "y/c", "d", "z"]
+
+
+def test_share_paths_with_repeated_and_empty_input():
+    shared, suffixes = share_paths(["a/b", "a/b"])
+    assert unpack(shared, "I") == [0, 2]
+    assert suffixes == ["a/b", ""]
+
+    assert share_paths([]) == (b"", [])
+
+
+def test_encode_rows_packs_typed_columns():
+    rows = [
+        {"size": 1, "progress": 0.5, "seed": True, "client": "a"},
+        {"size": 2**40, "progress": 1.0, "seed": False, "client": "b"},
+    ]
+    types = {"size": "int64", "progress": "float32", "seed": "bool", "client": "str"}
+
+    encoded = encode_rows(rows, types)
+
+    assert encoded["count"] == 2
+    columns = encoded["columns"]
+    assert unpack(columns["size"]["data"], "q") == [1, 2**40]
+    assert unpack(columns["progress"]["data"], "f") == pytest.approx([0.5, 1.0])
+    assert unpack(columns["seed"]["data"], "B") == [1, 0]
+    assert columns["client"] == {"type": "str", "data": ["a", "b"]}
+
+
+def test_encode_rows_paths_and_selected_names():
+    rows = [{"path": "t/a", "size": 1}, {"path": "t/b", "size": 2}]
+
+    encoded = encode_rows(rows, FILE_COLUMNS, names=["path"])
+
+    assert list(encoded["columns"]) == ["path"]
+    path = encoded["columns"]["path"]
+    assert path["type"] == "path"
+    assert unpack(path["shared"], "I") == [0, 1]
+    assert path["data"] == ["t/a", "b"]
+
+
+def test_encode_rows_without_rows_has_every_typed_column():
+    assert encode_rows([], FILE_COLUMNS) == empty_columns(FILE_COLUMNS)
+    assert encode_rows([], FILE_COLUMNS)["count"] == 0
@@ -0,0 +1,102 @@
+import anyio
+import pytest
+
+from seedarr.enums import EventTopic, OverflowPolicy
+from seedarr.singletons.event_bus import EventBus, Subscriber
+
+
+async def consume(event):
+    pass
+
+
+def subscriber(capacity=2) -> Subscriber:
+    return Subscriber("test", consume, None, None, capacity)
+
+
+def queued(subscriber: Subscriber) -> list:
+    return [entry.event for entry in subscriber._queue]
+
+
+def test_drop_oldest_evicts_the_oldest_droppable_event():
+    queue = subscriber()
+    for event in (1, 2, 3):
+        assert queue.offer(event, OverflowPolicy.DROP_OLDEST, None, None)
+
+    assert queued(queue) == [2, 3]
+    assert queue.stats()["dropped"] == 1
+
+
+def test_block_asks_the_publisher_to_wait_when_full():
+    queue = subscriber()
+    queue.offer(1, OverflowPolicy.BLOCK, None, None)
+    queue.offer(2, OverflowPolicy.BLOCK, None, None)
+
+    assert not queue.offer(3, OverflowPolicy.BLOCK, None, None)
+    assert queued(queue) == [1, 2]
+
+
+def test_blocking_events_are_never_evicted():
+    queue = subscriber()
+    queue.offer(1, OverflowPolicy.BLOCK, None, None)
+    queue.offer(2, OverflowPolicy.DROP_OLDEST, None, None)
+    queue.offer(3, OverflowPolicy.DROP_OLDEST, None, None)
+
+    assert queued(queue) == [1, 3]
+
+
+def test_new_event_is_dropped_when_only_blocking_events_wait():
+    queue = subscriber()
+    queue.offer(1, OverflowPolicy.BLOCK, None, None)
+    queue.offer(2, OverflowPolicy.BLOCK, None, None)
+
+    assert queue.offer(3, OverflowPolicy.DROP_OLDEST, None, None)
+    assert queued(queue) == [1, 2]
+    assert queue.stats()["dropped"] == 1
+
+
+def test_coalesce_merges_into_the_waiting_event_with_the_same_key():
+    queue = subscriber(capacity=4)
+    queue.offer([1], OverflowPolicy.COALESCE, "a", lambda old, new: old + new)
+    queue.offer([9], OverflowPolicy.COALESCE, "b", lambda old, new: old + new)
+    queue.offer([2], OverflowPolicy.COALESCE, "a", lambda old, new: old + new)
+    queue.offer([3], OverflowPolicy.COALESCE, "a", None)
+
+    assert queued(queue) == [[3], [9]]
+    assert queue.stats()["coalesced"] == 2
+
+
+def test_coalesce_without_a_waiting_event_falls_back_to_drop_oldest():
+    queue = subscriber()
+    queue.offer(1, OverflowPolicy.COALESCE, "a", None)
+    queue.offer(2, OverflowPolicy.COALESCE, "b", None)
+    queue.offer(3, OverflowPolicy.COALESCE, "c", None)
+
+    assert queued(queue) == [2, 3]
+    # The evicted event no longer absorbs events published under its key
+    queue.offer(4, OverflowPolicy.COALESCE, "a", None)
+    assert queued(queue) == [3, 4]
+
+
+@pytest.mark.anyio
+async def test_blocked_put_resumes_once_the_consumer_frees_a_slot():
+    queue = subscriber(capacity=1)
+    queue.offer(1, OverflowPolicy.BLOCK, None, None)
+
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(queue.put, 2, None)
+        await anyio.sleep(0)
+        assert queued(queue) == [1]
+        assert (await queue._next()).event == 1
+
+    assert queued(queue) == [2]
+    assert queue.stats()["blocked"] == 1
+
+
+@pytest.mark.anyio
+async def test_publish_coalesce_needs_a_key():
+    EventBus.init()
+
+    with pytest.raises(ValueError):
+        await EventBus.get_bus().publish(
+            {"type": "x"}, EventTopic.ALERTS, policy=OverflowPolicy.COALESCE
+        )
@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+import pytest
+
+import seedarr.datastructures.metadata_cache as metadata_cache_module
+from seedarr.datastructures import MetadataCache, torrent_file_from_info
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(metadata_cache_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_entries_are_reachable_through_every_key(clock):
+    cache = MetadataCache(size=4, ttl=60)
+    cache.put(["v1", "v2", "v2short"], b"info")
+
+    assert cache.get(["v2short"]) == b"info"
+    assert cache.get(["missing", "V1"]) == b"info"
+    assert cache.get(["missing"]) is None
+    assert len(cache) == 1
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = MetadataCache(size=4, ttl=60)
+    cache.put(["a"], b"info")
+
+    clock[0] += 59
+    assert cache.get(["a"]) == b"info"
+    clock[0] += 1
+    assert cache.get(["a"]) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_is_dropped_past_size(clock):
+    cache = MetadataCache(size=2, ttl=60)
+    cache.put(["a"], b"a")
+    cache.put(["b", "b2"], b"b")
+    cache.get(["a"])
+    cache.put(["c"], b"c")
+
+    assert cache.get(["b2"]) is None
+    assert cache.get(["a"]) == b"a"
+    assert cache.get(["c"]) == b"c"
+
+
+def test_put_replaces_entries_sharing_a_key(clock):
+    cache = MetadataCache(size=4, ttl=60)
+    cache.put(["v1"], b"partial")
+    cache.put(["v1", "v2"], b"full")
+
+    assert len(cache) == 1
+    assert cache.get(["v1"]) == b"full"
+
+
+def test_zero_size_stores_nothing(clock):
+    cache = MetadataCache(size=0, ttl=60)
+    cache.put(["a"], b"info")
+
+    assert cache.get(["a"]) is None
+
+
+def test_torrent_file_from_info():
+    assert torrent_file_from_info(b"d4:name1:xe") == b"d4:infod4:name1:xee"
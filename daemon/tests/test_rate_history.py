@@ -0,0 +1,96 @@
+import pytest
+
+from seedarr.benchmarks.status_store import stub_statuses
+from seedarr.datastructures import RateHistory, StatusStore
+
+
+@pytest.fixture
+def statuses():
+    statuses = stub_statuses(3)
+    for index, status in enumerate(statuses):
+        status.download_rate = 100 * (index + 1)
+        status.upload_rate = index
+        status.num_peers = index
+    return statuses
+
+
+def store_of(statuses) -> StatusStore:
+    store = StatusStore()
+    store.replace(statuses)
+    return store
+
+
+def test_unknown_torrents_have_no_series():
+    history = RateHistory()
+
+    assert history.series("0" * 40) is None
+    assert history.average_download_rate("0" * 40) is None
+
+
+def test_samples_are_returned_oldest_first(statuses):
+    history = RateHistory()
+    store = store_of(statuses)
+    info_hash = str(statuses[0].info_hash)
+
+    for rate in (10, 20, 30):
+        statuses[0].download_rate = rate
+        store.update([statuses[0]])
+        history.sample(store)
+
+    series = history.series(info_hash)
+    assert series["download_rate"] == [10, 20, 30]
+    assert series["upload_rate"] == [0, 0, 0]
+    assert len(history) == 3
+
+
+def test_second_tier_wraps_after_a_minute(statuses):
+    history = RateHistory()
+    store = store_of(statuses)
+
+    for second in range(70):
+        statuses[0].download_rate = second
+        store.update([statuses[0]])
+        history.sample(store)
+
+    series = history.series(str(statuses[0].info_hash))["download_rate"]
+    assert series == list(range(10, 70))
+
+
+def test_minutes_average_their_seconds(statuses):
+    history = RateHistory()
+    store = store_of(statuses)
+
+    for second in range(120):
+        statuses[0].download_rate = 60 if second < 60 else 120
+        store.update([statuses[0]])
+        history.sample(store)
+
+    assert history.series(str(statuses[0].info_hash), "1m")["download_rate"] == [60, 120]
+
+
+def test_removed_torrents_free_their_slot(statuses):
+    history = RateHistory()
+    history.sample(store_of(statuses))
+
+    history.sample(store_of(statuses[1:]))
+
+    assert history.series(str(statuses[0].info_hash)) is None
+    assert len(history) == 2
+    assert history.series(str(statuses[1].info_hash))["download_rate"] == [200, 200]
+
+
+def test_eta_uses_the_smoothed_download_rate(statuses):
+    statuses[0].total_wanted = 10_000
+    statuses[0].total_done = 4_000
+    history = RateHistory()
+    store = store_of(statuses)
+    history.sample(store)
+
+    row = store.get(str(statuses[0].info_hash))
+    rate = history.average_download_rate(row.info_hash)
+    assert 0 < rate < 100
+    assert history.eta(row) == pytest.approx(6_000 / rate)
+
+    statuses[0].total_done = 10_000
+    store.update([statuses[0]])
+    assert history.eta(row) == 0.0
@@ -0,0 +1,71 @@
+from seedarr.datastructures import STATE_UPDATE_FIELDS
+
+
+def status(info_hash, **changes):
+    row = {field: 0 for field in STATE_UPDATE_FIELDS}
+    row.update(info_hash=info_hash, name=info_hash, state="downloading")
+    row.update(changes)
+    return row
+
+
+def test_new_torrents_are_sent_in_full_with_an_id(state_delta_manager):
+    added, changes = state_delta_manager.diff([status("a"), status("b")])
+
+    first = added[0]["id"]
+    assert [row["id"] for row in added] == [first, first + 1]
+    assert added[0] == {"id": first, **status("a")}
+    assert changes == []
+    assert state_delta_manager.seq == 1
+
+
+def test_changes_carry_only_changed_fields(state_delta_manager):
+    known, _ = state_delta_manager.diff([status("a"), status("b")])
+
+    added, changes = state_delta_manager.diff([status("a", progress=0.5, num_peers=3), status("b")])
+
+    fields = state_delta_manager.fields
+    assert added == []
+    assert changes == [
+        [known[0]["id"], fields.index("progress"), 0.5, fields.index("num_peers"), 3]
+    ]
+
+
+def test_seq_only_moves_on_non_empty_deltas(state_delta_manager):
+    state_delta_manager.diff([status("a")])
+    state_delta_manager.diff([status("a")])
+    assert state_delta_manager.seq == 1
+
+    state_delta_manager.diff([status("a", progress=1.0)])
+    assert state_delta_manager.seq == 2
+
+
+def test_snapshot_reflects_every_delta(state_delta_manager):
+    added, _ = state_delta_manager.diff([status("a"), status("b")])
+    state_delta_manager.diff([status("b", download_rate=100)])
+
+    snapshot = {row["info_hash"]: row for row in state_delta_manager.snapshot()}
+
+    assert snapshot["a"] == {"id": added[0]["id"], **status("a")}
+    assert snapshot["b"] == {"id": added[1]["id"], **status("b", download_rate=100)}
+
+
+def test_reset_starts_a_new_baseline(state_delta_manager):
+    before, _ = state_delta_manager.diff([status("a"), status("b")])
+    seq = state_delta_manager.seq
+
+    state_delta_manager.reset([status("c")])
+
+    assert state_delta_manager.seq == seq + 1
+    assert [row["info_hash"] for row in state_delta_manager.snapshot()] == ["c"]
+    # Ids are never reused, so clients cannot confuse a torrent with an older one
+    added, _ = state_delta_manager.diff([status("a")])
+    assert added[0]["id"] > max(row["id"] for row in before)
+
+
+def test_forgotten_torrents_are_sent_in_full_again(state_delta_manager):
+    state_delta_manager.diff([status("a")])
+    state_delta_manager.forget("a")
+
+    added, changes = state_delta_manager.diff([status("a")])
+
+    assert len(added) == 1 and changes == []
@@ -104,6 +104,21 @@ export default function SocketProvider() {
 
         const handleBroadcast = async (response: SerializedAlert) => {
             switch (response.type) {
+                case "batch": {
+                    for (const alert of response.alerts) {
+                        await handleBroadcast(alert);
+                    }
+                    break;
+                }
+                case "synthetic:batch": {
+                    for (const info_hash of response.info_hashes) {
+                        await handleBroadcast({
+                            type: response.event,
+                            info_hash,
+                        } as SerializedAlert);
+                    }
+                    break;
+                }
                 case "synthetic:paused": {
                     const torrent = findTorrentByInfoHash(response.info_hash);
                     if (torrent) {
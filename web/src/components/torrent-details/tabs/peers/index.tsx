@@ -66,6 +66,15 @@ export default function PeersTab({ infoHash }: { infoHash: string }) {
                         peers.map(async (peer) => {
                             const ip = peer.ip;
 
+                            if ("country_code" in peer) {
+                                // Resolved by the daemon
+                                return {
+                                    ...peer,
+                                    isoCode: peer.country_code ?? undefined,
+                                    country: peer.country ?? undefined,
+                                };
+                            }
+
                             if (!isValidIP(ip) && isGlobalIP(ip)) {
                                 return {
                                     ...peer,
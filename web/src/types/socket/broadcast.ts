@@ -1,12 +1,30 @@
 import { TorrentInfo } from "./torrent_info";
 
 export type SerializedAlert =
+    | { type: "batch"; alerts: SerializedAlert[] }
     | { type: "synthetic:resumed"; info_hash: string }
     | { type: "synthetic:paused"; info_hash: string }
     | { type: "synthetic:removed"; info_hash: string }
-    | { type: "libtorrent:torrent_finished"; message: string }
+    | {
+          type: "synthetic:batch";
+          event:
+              | "synthetic:resumed"
+              | "synthetic:paused"
+              | "synthetic:removed"
+              | "synthetic:rechecked";
+          info_hashes: string[];
+      }
+    | {
+          type: "libtorrent:torrent_finished";
+          message: string;
+          info_hash: string | null;
+      }
     | { type: "libtorrent:metadata_received"; message: string }
-    | { type: "libtorrent:peer_connected"; message: string } // IP string
+    | {
+          type: "libtorrent:peer_connected";
+          message: string; // IP string
+          info_hash: string | null;
+      }
     | {
           type: "libtorrent:state_update";
           statuses: {
@@ -73,6 +73,9 @@ export interface Peer {
     up_speed: number;
     total_download: number;
     total_upload: number;
+    // Present when the daemon has a GeoIP database configured
+    country_code?: string | null;
+    country?: string | null;
 }
 
 export interface TorrentInfo {